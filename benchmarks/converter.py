@@ -0,0 +1,217 @@
+"""마크다운 → Notion 블록 변환기 마이크로 벤치마크.
+
+build_page_blocks, split_rich_text, _parse_inline_markdown에
+1KB~5MB 크기의 한국어/영어 분석 문서를 넣어 처리량과 메모리 할당량을 측정한다.
+결과는 JSON으로 출력한다.
+
+사용법:
+    uv run python benchmarks/converter.py
+    uv run python benchmarks/converter.py --sizes 10k 1m --docs report_ko --output converter.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from slack_to_notion.notion_client import NotionClient, _parse_inline_markdown, split_rich_text
+
+RESULT_VERSION = 1
+DEFAULT_SIZES = ["1k", "10k", "100k", "1m", "5m"]
+# 한 측정에서 최소한 이 시간(초)만큼은 반복 실행해 타이머 오차를 줄인다
+MIN_MEASURE_TIME = 0.2
+
+_SIZE_UNITS = {"k": 1024, "m": 1024 * 1024}
+
+
+def _report_ko(n: int) -> str:
+    return f"""## {n}. 주간 이슈 분석
+
+### 핵심 요약
+- **결정 사항**: 배포 일정을 `금요일 18:00`으로 확정하고 [배포 가이드](https://example.com/deploy/{n})를 공유함
+- *주의*: 스테이징 DB 마이그레이션은 ~~수요일~~ 목요일로 연기
+- 담당자: 김개발, 이리뷰 — 리뷰 요청 3건, 장애 대응 1건
+
+| 항목 | 담당 | 상태 |
+|------|------|------|
+| 로그인 오류 수정 | 김개발 | 완료 |
+| 결제 API 타임아웃 | 이리뷰 | 진행 중 |
+
+결제 모듈의 타임아웃 문제는 외부 PG사 응답 지연이 원인으로 확인되었으며, 재시도 정책과 **서킷 브레이커** 도입을 검토하기로 했습니다. 관련 논의는 스레드에서 계속 진행 중입니다.
+
+```python
+def retry(func, attempts=3):
+    return func()
+```
+
+1. 다음 주 월요일까지 재시도 정책 초안 작성
+2. `payment-service` 대시보드 알림 기준 조정
+> 참고: 장애 회고 문서는 [위키](https://example.com/wiki/{n})에 정리되어 있습니다.
+
+"""
+
+
+def _report_en(n: int) -> str:
+    return f"""## {n}. Weekly Issue Analysis
+
+### Key Takeaways
+- **Decision**: release scheduled for `Friday 18:00`, see [deploy guide](https://example.com/deploy/{n})
+- *Note*: staging DB migration moved from ~~Wednesday~~ to Thursday
+- Owners: alice, bob — 3 review requests, 1 incident
+
+| Item | Owner | Status |
+|------|-------|--------|
+| Fix login error | alice | done |
+| Payment API timeout | bob | in progress |
+
+The payment timeout was traced to slow responses from the external gateway. The team agreed to evaluate a retry policy and a **circuit breaker**, and the discussion continues in the thread.
+
+```python
+def retry(func, attempts=3):
+    return func()
+```
+
+1. Draft the retry policy by next Monday
+2. Tune alert thresholds on the `payment-service` dashboard
+> Note: the incident review lives in the [wiki](https://example.com/wiki/{n}).
+
+"""
+
+
+def _inline_dense(n: int) -> str:
+    # 인라인 문법이 빽빽한 줄: 정규식 매칭 비용을 집중적으로 측정
+    return (
+        f"- **굵게 {n}** *기울임* `code_{n}` ~~취소~~ [링크](https://example.com/{n}) "
+        f"mixed **bold** and *italic* with `inline` code ~~strike~~ [link](https://example.com/e/{n})\n"
+    )
+
+
+def _long_paragraph(n: int) -> str:
+    # 2000자를 넘는 문단: split_rich_text의 분할 경로를 측정
+    return ("긴 문단 텍스트 long paragraph text " * 200) + f"끝 {n}\n\n"
+
+
+DOCUMENTS = {
+    "report_ko": _report_ko,
+    "report_en": _report_en,
+    "inline_dense": _inline_dense,
+    "long_paragraph": _long_paragraph,
+}
+
+
+def parse_size(value: str) -> int:
+    """'1k', '5m', '2048' 형식의 크기를 바이트 수로 변환한다."""
+    value = value.strip().lower()
+    unit = _SIZE_UNITS.get(value[-1:], 1)
+    number = value[:-1] if value[-1:] in _SIZE_UNITS else value
+    return int(float(number) * unit)
+
+
+def build_document(kind: str, size: int) -> str:
+    """UTF-8 기준 size 바이트 이상이 될 때까지 문서 조각을 이어 붙인다."""
+    make = DOCUMENTS[kind]
+    parts = []
+    total = 0
+    n = 1
+    while total < size:
+        part = make(n)
+        parts.append(part)
+        total += len(part.encode("utf-8"))
+        n += 1
+    return "".join(parts)
+
+
+def _targets(client: NotionClient) -> dict:
+    def per_line(func):
+        def run(text: str):
+            return [func(line) for line in text.split("\n") if line]
+        return run
+
+    return {
+        "build_page_blocks": client.build_page_blocks,
+        "split_rich_text": per_line(split_rich_text),
+        "_parse_inline_markdown": per_line(_parse_inline_markdown),
+    }
+
+
+def measure(func, text: str, repeat: int) -> dict:
+    """실행 시간(반복 중 중앙값/최솟값)과 최대 메모리 할당량을 측정한다."""
+    durations = []
+    deadline = time.perf_counter() + MIN_MEASURE_TIME
+    while len(durations) < repeat or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        result = func(text)
+        durations.append(time.perf_counter() - start)
+
+    # tracemalloc은 실행을 느리게 하므로 시간 측정과 분리해 한 번만 실행한다
+    tracemalloc.start()
+    try:
+        func(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+    median = statistics.median(durations)
+    return {
+        "runs": len(durations),
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(durations) * 1000, 3),
+        "throughput_mb_s": round(size_mb / median, 2) if median else None,
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "items": len(result),
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="마크다운 → Notion 변환기 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="문서 크기 (예: 1k 100k 5m)")
+    parser.add_argument("--docs", nargs="+", choices=sorted(DOCUMENTS), default=sorted(DOCUMENTS), help="문서 종류")
+    parser.add_argument(
+        "--functions", nargs="+", choices=["build_page_blocks", "split_rich_text", "_parse_inline_markdown"],
+        default=["build_page_blocks", "split_rich_text", "_parse_inline_markdown"], help="측정할 함수",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="최소 반복 횟수 (기본: 5)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 경로 (미지정 시 stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    targets = _targets(NotionClient("ntn_benchmark"))
+    results = []
+    for kind in args.docs:
+        for size_label in args.sizes:
+            text = build_document(kind, parse_size(size_label))
+            for name in args.functions:
+                print(f"[bench] {name} {kind} {size_label}", file=sys.stderr)
+                results.append({
+                    "function": name,
+                    "document": kind,
+                    "size": size_label,
+                    "bytes": len(text.encode("utf-8")),
+                    **measure(targets[name], text, args.repeat),
+                })
+
+    report = {
+        "version": RESULT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {"repeat": args.repeat, "min_measure_time": MIN_MEASURE_TIME},
+        "results": results,
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""벤치마크용 가짜 Slack Web API / Notion API 서버.
+
+표준 라이브러리 http.server로 동작하며, 실제 API와 같은 형식의 응답을 돌려준다.
+응답 지연, 메서드별 rate limit(429 + Retry-After), 커서 기반 pagination,
+주기적인 429 주입을 설정할 수 있고, 엔드포인트별 요청 수를 기록한다.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class ServerConfig:
+    """가짜 서버 동작 설정.
+
+    Attributes:
+        latency: 요청마다 추가하는 응답 지연 (초)
+        rate_limits: {엔드포인트: 초당 허용 요청 수}. 초과하면 429를 반환한다.
+        default_rate_limit: rate_limits에 없는 엔드포인트의 초당 허용 요청 수 (0이면 제한 없음)
+        inject_429_every: N번째 요청마다 429를 반환한다 (0이면 주입하지 않음)
+        retry_after: 429 응답의 Retry-After 값 (초)
+        page_size: 목록 API의 최대 페이지 크기
+    """
+
+    latency: float = 0.0
+    rate_limits: dict[str, float] = field(default_factory=dict)
+    default_rate_limit: float = 0.0
+    inject_429_every: int = 0
+    retry_after: float = 1.0
+    page_size: int = 200
+
+
+class _Window:
+    """엔드포인트별 1초 슬라이딩 윈도 요청 카운터."""
+
+    def __init__(self):
+        self._hits: dict[str, list[float]] = {}
+
+    def allow(self, endpoint: str, limit: float) -> bool:
+        now = time.monotonic()
+        hits = [t for t in self._hits.get(endpoint, []) if now - t < 1.0]
+        allowed = len(hits) < max(1, int(limit))
+        if allowed:
+            hits.append(now)
+        self._hits[endpoint] = hits
+        return allowed
+
+
+class _FakeServer:
+    """가짜 API 서버 공통 동작 (요청 집계, 지연, rate limit)."""
+
+    def __init__(self, config: ServerConfig | None = None):
+        self.config = config or ServerConfig()
+        self.requests: Counter[str] = Counter()
+        self.rate_limited: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._window = _Window()
+        self._total = 0
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "_FakeServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def do_PATCH(self):
+                server._handle(self, "PATCH")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.rate_limited.clear()
+            self._total = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "total_requests": sum(self.requests.values()),
+                "rate_limited": dict(self.rate_limited),
+                "total_rate_limited": sum(self.rate_limited.values()),
+            }
+
+    def _check_rate_limit(self, endpoint: str) -> bool:
+        """요청을 집계하고 rate limit에 걸리면 False를 반환한다."""
+        config = self.config
+        with self._lock:
+            self.requests[endpoint] += 1
+            self._total += 1
+            injected = config.inject_429_every and self._total % config.inject_429_every == 0
+            limit = config.rate_limits.get(endpoint, config.default_rate_limit)
+            limited = injected or (limit and not self._window.allow(endpoint, limit))
+            if limited:
+                self.rate_limited[endpoint] += 1
+        return not limited
+
+    def _send_json(self, handler, status: int, body: dict, headers: dict | None = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _read_params(self, handler) -> dict:
+        """쿼리 문자열과 본문(form 또는 JSON)의 파라미터를 합친다."""
+        parsed = urlparse(handler.path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        length = int(handler.headers.get("Content-Length") or 0)
+        if length:
+            raw = handler.rfile.read(length).decode("utf-8")
+            if handler.headers.get("Content-Type", "").startswith("application/json"):
+                params.update(json.loads(raw or "{}"))
+            else:
+                params.update({k: v[0] for k, v in parse_qs(raw).items()})
+        return params
+
+    def _handle(self, handler, verb: str) -> None:
+        raise NotImplementedError
+
+
+class FakeSlackServer(_FakeServer):
+    """가짜 Slack Web API 서버.
+
+    채널별 메시지, 스레드 답글, 사용자 목록을 생성해 두고
+    conversations.*, users.* 메서드를 Slack과 같은 형식으로 응답한다.
+    """
+
+    def __init__(
+        self,
+        config: ServerConfig | None = None,
+        channels: int = 5,
+        messages_per_channel: int = 200,
+        threads_per_channel: int = 20,
+        replies_per_thread: int = 10,
+        users: int = 50,
+    ):
+        super().__init__(config)
+        self.users = [
+            {
+                "id": f"U{i:08d}",
+                "name": f"user{i}",
+                "real_name": f"사용자 {i}",
+                "profile": {"display_name": f"사용자{i}", "real_name": f"사용자 {i}"},
+            }
+            for i in range(users)
+        ]
+        self.channels = [
+            {"id": f"C{i:08d}", "name": f"channel-{i}", "topic": {"value": f"채널 {i} 주제"}, "num_members": users}
+            for i in range(channels)
+        ]
+        self.messages: dict[str, list[dict]] = {}
+        self.replies: dict[tuple[str, str], list[dict]] = {}
+        base_ts = 1_700_000_000
+        for channel in self.channels:
+            # 최신 메시지가 앞에 오도록 정렬 (conversations.history와 동일)
+            msgs = []
+            for i in range(messages_per_channel):
+                ts = f"{base_ts + (messages_per_channel - i) * 60}.000000"
+                msg = {
+                    "type": "message",
+                    "ts": ts,
+                    "user": self.users[i % users]["id"],
+                    "text": f"{channel['name']} 메시지 {i} — 배포 일정과 리뷰 요청에 대한 논의입니다.",
+                }
+                if i < threads_per_channel:
+                    msg["thread_ts"] = ts
+                    msg["reply_count"] = replies_per_thread
+                    msg["latest_reply"] = f"{base_ts + (messages_per_channel - i) * 60 + replies_per_thread}.000000"
+                    self.replies[(channel["id"], ts)] = [
+                        {
+                            "type": "message",
+                            "ts": f"{base_ts + (messages_per_channel - i) * 60 + r + 1}.000000",
+                            "thread_ts": ts,
+                            "user": self.users[(i + r + 1) % users]["id"],
+                            "text": f"답글 {r}",
+                        }
+                        for r in range(replies_per_thread)
+                    ]
+                msgs.append(msg)
+            self.messages[channel["id"]] = msgs
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/api/"
+
+    def _paginate(self, items: list, params: dict) -> tuple[list, str]:
+        start = int(params.get("cursor") or 0)
+        limit = int(params.get("limit") or self.config.page_size)
+        limit = max(1, min(limit, self.config.page_size))
+        page = items[start : start + limit]
+        next_cursor = str(start + limit) if start + limit < len(items) else ""
+        return page, next_cursor
+
+    def _handle(self, handler, verb: str) -> None:
+        method = urlparse(handler.path).path.rsplit("/", 1)[-1]
+        params = self._read_params(handler)
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        if not self._check_rate_limit(method):
+            self._send_json(
+                handler, 429, {"ok": False, "error": "ratelimited"},
+                {"Retry-After": f"{self.config.retry_after:g}"},
+            )
+            return
+
+        body = self._dispatch(method, params)
+        self._send_json(handler, 200, body)
+
+    def _dispatch(self, method: str, params: dict) -> dict:
+        channel_id = params.get("channel", "")
+        if method == "auth.test":
+            return {"ok": True, "user_id": "UBOT", "team_id": "T0001"}
+        if method == "conversations.list":
+            page, cursor = self._paginate(self.channels, params)
+            return {"ok": True, "channels": page, "response_metadata": {"next_cursor": cursor}}
+        if method == "conversations.info":
+            for channel in self.channels:
+                if channel["id"] == channel_id:
+                    return {"ok": True, "channel": channel}
+            return {"ok": False, "error": "channel_not_found"}
+        if method == "conversations.history":
+            if channel_id not in self.messages:
+                return {"ok": False, "error": "channel_not_found"}
+            oldest = float(params.get("oldest") or 0)
+            latest = float(params.get("latest") or "inf")
+            items = [m for m in self.messages[channel_id] if oldest < float(m["ts"]) < latest]
+            page, cursor = self._paginate(items, params)
+            return {
+                "ok": True,
+                "messages": page,
+                "has_more": bool(cursor),
+                "response_metadata": {"next_cursor": cursor},
+            }
+        if method == "conversations.replies":
+            ts = params.get("ts", "")
+            parent = next((m for m in self.messages.get(channel_id, []) if m["ts"] == ts), None)
+            if parent is None:
+                return {"ok": False, "error": "thread_not_found"}
+            items = [parent] + self.replies.get((channel_id, ts), [])
+            return {"ok": True, "messages": items, "has_more": False}
+        if method == "users.info":
+            for user in self.users:
+                if user["id"] == params.get("user"):
+                    return {"ok": True, "user": user}
+            return {"ok": False, "error": "user_not_found"}
+        if method == "users.list":
+            page, cursor = self._paginate(self.users, params)
+            return {"ok": True, "members": page, "response_metadata": {"next_cursor": cursor}}
+        if method == "users.getPresence":
+            index = int(params.get("user", "U0")[1:] or 0)
+            return {"ok": True, "presence": "active" if index % 3 == 0 else "away"}
+        return {"ok": False, "error": "unknown_method"}
+
+
+class FakeNotionServer(_FakeServer):
+    """가짜 Notion API 서버.
+
+    페이지 생성(POST /v1/pages), 하위 블록 추가(PATCH /v1/blocks/{id}/children),
+    하위 블록 조회(GET /v1/blocks/{id}/children)를 메모리에서 처리한다.
+    """
+
+    def __init__(self, config: ServerConfig | None = None):
+        config = config or ServerConfig(page_size=100)
+        super().__init__(config)
+        self.children: dict[str, list[dict]] = {}
+
+    def _handle(self, handler, verb: str) -> None:
+        path = urlparse(handler.path).path
+        params = self._read_params(handler)
+        endpoint = f"{verb} {path.split('/')[2] if path.count('/') >= 2 else path}"
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        if not self._check_rate_limit(endpoint):
+            self._send_json(
+                handler, 429,
+                {"object": "error", "status": 429, "code": "rate_limited", "message": "Rate limited"},
+                {"Retry-After": f"{self.config.retry_after:g}"},
+            )
+            return
+
+        status, body = self._dispatch(verb, path, params)
+        self._send_json(handler, status, body)
+
+    def _dispatch(self, verb: str, path: str, params: dict) -> tuple[int, dict]:
+        parts = path.strip("/").split("/")
+        if verb == "POST" and parts == ["v1", "pages"]:
+            page_id = str(uuid.uuid4())
+            children = params.get("children", [])
+            if len(children) > 100:
+                return 400, self._error("validation_error", "children length should be ≤ 100")
+            parent_id = params.get("parent", {}).get("page_id", "")
+            title = params["properties"]["title"]["title"][0]["text"]["content"]
+            self.children.setdefault(parent_id, []).append(
+                {"object": "block", "id": page_id, "type": "child_page", "child_page": {"title": title}}
+            )
+            self.children[page_id] = list(children)
+            return 200, {"object": "page", "id": page_id, "url": f"https://www.notion.so/{page_id.replace('-', '')}"}
+
+        if len(parts) == 4 and parts[:2] == ["v1", "blocks"] and parts[3] == "children":
+            block_id = parts[2]
+            if verb == "PATCH":
+                children = params.get("children", [])
+                if len(children) > 100:
+                    return 400, self._error("validation_error", "children length should be ≤ 100")
+                self.children.setdefault(block_id, []).extend(children)
+                return 200, {"object": "list", "results": children}
+            if verb == "GET":
+                items = self.children.get(block_id, [])
+                start = int(params.get("start_cursor") or 0)
+                size = min(int(params.get("page_size") or self.config.page_size), 100)
+                page = items[start : start + size]
+                has_more = start + size < len(items)
+                return 200, {
+                    "object": "list",
+                    "results": page,
+                    "has_more": has_more,
+                    "next_cursor": str(start + size) if has_more else None,
+                }
+
+        return 404, self._error("object_not_found", f"{verb} {path}", status=404)
+
+    @staticmethod
+    def _error(code: str, message: str, status: int = 400) -> dict:
+        return {"object": "error", "status": status, "code": code, "message": message}
@@ -0,0 +1,197 @@
+"""엔드투엔드 성능 벤치마크.
+
+가짜 Slack/Notion 서버를 띄우고 MCP 도구 함수를 직접 호출해
+데이터 크기별 소요 시간과 API 요청 수를 측정한다. 결과는 JSON으로 출력한다.
+
+사용법:
+    uv run python benchmarks/run.py
+    uv run python benchmarks/run.py --scenarios format_messages --latency 0.05 --output result.json
+    uv run python benchmarks/run.py --inject-429 25   # 25번째 요청마다 429 응답
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fake_servers import FakeNotionServer, FakeSlackServer, ServerConfig
+
+from slack_to_notion import clients, mcp_server
+from slack_to_notion.notion_client import NOTION_BURST, NOTION_REQUESTS_PER_SECOND, NotionClient
+from slack_to_notion.ratelimit import TokenBucket
+from slack_to_notion.slack_client import SLACK_METHOD_RATES, SlackClient
+
+RESULT_VERSION = 1
+FAKE_PARENT_PAGE_ID = "0" * 32
+
+DEFAULT_SIZES = {
+    "format_messages": [100, 500, 1000],
+    "fetch_threads": [5, 20],
+    "check_active_users": [20, 100],
+    "create_notion_page": [50, 300, 1000],
+}
+
+
+def _slack_config(args) -> ServerConfig:
+    # 실제 Slack 티어 제한을 rate_scale배 빠르게 재현한다
+    return ServerConfig(
+        latency=args.latency,
+        rate_limits={method: rate * args.rate_scale for method, rate in SLACK_METHOD_RATES.items()},
+        inject_429_every=args.inject_429,
+        retry_after=max(0.01, 1.0 / args.rate_scale),
+    )
+
+
+def _notion_config(args) -> ServerConfig:
+    return ServerConfig(
+        latency=args.latency,
+        default_rate_limit=NOTION_REQUESTS_PER_SECOND * args.rate_scale,
+        inject_429_every=args.inject_429,
+        retry_after=max(0.01, 1.0 / args.rate_scale),
+        page_size=100,
+    )
+
+
+def _slack_client(server: FakeSlackServer, cache_dir: Path, rate_scale: float) -> SlackClient:
+    client = SlackClient("xoxb-benchmark", cache_dir=cache_dir, base_url=server.api_url)
+    client.scheduler.rates = {method: rate * rate_scale for method, rate in client.scheduler.rates.items()}
+    client.scheduler.default_rate *= rate_scale
+    return client
+
+
+def _notion_client(server: FakeNotionServer, rate_scale: float) -> NotionClient:
+    client = NotionClient("ntn_benchmark", base_url=server.base_url)
+    client.rate_limiter = TokenBucket(NOTION_REQUESTS_PER_SECOND * rate_scale, NOTION_BURST)
+    return client
+
+
+def _page_content(blocks: int) -> str:
+    """블록 수가 blocks개인 마크다운 분석 결과를 만든다."""
+    lines = ["# 주간 분석 결과"]
+    for i in range(blocks - 1):
+        if i % 10 == 0:
+            lines.append(f"## 섹션 {i // 10 + 1}")
+        elif i % 3 == 0:
+            lines.append(f"- **결정 사항 {i}**: 배포 일정을 `금요일`로 확정")
+        else:
+            lines.append(f"논의 내용 {i} — 리뷰 요청과 [문서](https://example.com/{i}) 공유")
+    return "\n".join(lines)
+
+
+def _run_scenario(name: str, size: int, args, workdir: Path) -> tuple[str, FakeSlackServer | FakeNotionServer]:
+    """시나리오를 한 번 실행하고 (도구 결과, 사용한 서버)를 반환한다."""
+    cache_dir = workdir / f"cache-{time.monotonic_ns()}"
+
+    if name == "create_notion_page":
+        server = FakeNotionServer(_notion_config(args)).start()
+        clients._notion_client = _notion_client(server, args.rate_scale)
+        os.environ["NOTION_PARENT_PAGE_URL"] = FAKE_PARENT_PAGE_ID
+        return mcp_server.create_notion_page(f"벤치마크 {size}", _page_content(size)), server
+
+    if name == "format_messages":
+        server = FakeSlackServer(_slack_config(args), channels=1, messages_per_channel=size).start()
+    elif name == "fetch_threads":
+        server = FakeSlackServer(_slack_config(args), channels=1, threads_per_channel=size).start()
+    elif name == "check_active_users":
+        server = FakeSlackServer(_slack_config(args), channels=1, messages_per_channel=0, users=size).start()
+    else:
+        raise ValueError(f"알 수 없는 시나리오: {name}")
+
+    clients._slack_client = _slack_client(server, cache_dir, args.rate_scale)
+    channel_id = server.channels[0]["id"]
+    if name == "format_messages":
+        result = mcp_server.format_messages(channel_id, limit=size)
+    elif name == "fetch_threads":
+        thread_ts = [m["ts"] for m in server.messages[channel_id] if m.get("reply_count")]
+        result = mcp_server.fetch_threads(channel_id, thread_ts)
+    else:
+        result = mcp_server.check_active_users()
+    return result, server
+
+
+def run_benchmark(name: str, size: int, args, workdir: Path) -> dict:
+    """시나리오를 repeat회 실행해 소요 시간 통계와 요청 수를 반환한다."""
+    durations = []
+    stats = {}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result, server = _run_scenario(name, size, args, workdir)
+        durations.append((time.perf_counter() - start) * 1000)
+        stats = server.stats()
+        server.stop()
+        if result.startswith("[에러]"):
+            raise RuntimeError(f"{name}({size}) 실패: {result}")
+
+    return {
+        "scenario": name,
+        "size": size,
+        "runs": args.repeat,
+        "median_ms": round(statistics.median(durations), 2),
+        "min_ms": round(min(durations), 2),
+        "max_ms": round(max(durations), 2),
+        **stats,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="slack-to-notion 엔드투엔드 벤치마크")
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(DEFAULT_SIZES), default=sorted(DEFAULT_SIZES),
+        help="실행할 시나리오 (기본: 전체)",
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, help="데이터 크기 (기본: 시나리오별 기본값)")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수 (기본: 3)")
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 서버 응답 지연 (초, 기본: 0)")
+    parser.add_argument(
+        "--rate-scale", type=float, default=60.0,
+        help="API 속도 제한 배율. 60이면 분당 제한을 초당 제한으로 재현한다 (기본: 60)",
+    )
+    parser.add_argument("--inject-429", type=int, default=0, help="N번째 요청마다 429 응답 (기본: 0, 주입 안 함)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 경로 (미지정 시 stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    # 요청마다 찍히는 HTTP 로그는 측정 노이즈이므로 숨긴다
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        # 도구가 쓰는 상대 경로(.claude/...)가 저장소에 남지 않도록 임시 디렉토리에서 실행
+        os.chdir(workdir)
+        for name in args.scenarios:
+            for size in args.sizes or DEFAULT_SIZES[name]:
+                print(f"[bench] {name} size={size}", file=sys.stderr)
+                results.append(run_benchmark(name, size, args, workdir))
+
+    report = {
+        "version": RESULT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "package_version": mcp_server._get_package_version(),
+        "config": {
+            "repeat": args.repeat,
+            "latency": args.latency,
+            "rate_scale": args.rate_scale,
+            "inject_429": args.inject_429,
+        },
+        "results": results,
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
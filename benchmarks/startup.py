@@ -0,0 +1,97 @@
+"""MCP 서버 시작 시간 벤치마크.
+
+새 프로세스에서 서버 모듈 import와 도구 목록 조회(list_tools)에 걸리는 시간을 측정하고,
+python -X importtime 결과에서 누적 import 시간이 큰 모듈을 함께 출력한다.
+
+사용법:
+    uv run python benchmarks/startup.py
+    uv run python benchmarks/startup.py --repeat 10 --top 20 --output startup.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULT_VERSION = 1
+
+_STARTUP_CODE = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+from slack_to_notion import mcp_server
+imported = time.perf_counter()
+tools = asyncio.run(mcp_server.mcp.list_tools())
+listed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "list_tools_ms": (listed - imported) * 1000,
+    "tools": len(tools),
+    "sdk_loaded": sorted(m for m in ("slack_sdk", "notion_client") if m in sys.modules),
+}))
+"""
+
+
+def _run_once() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP_CODE],
+        capture_output=True, text=True, check=True,
+    )
+    sample = json.loads(result.stdout.strip().splitlines()[-1])
+    sample["modules"] = _parse_importtime(result.stderr)
+    return sample
+
+
+def _parse_importtime(output: str) -> dict[str, int]:
+    """-X importtime 출력을 {모듈: 누적 import 시간(us)}로 변환한다."""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            modules[parts[2]] = int(parts[1])
+    return modules
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="slack-to-notion MCP 서버 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수 (기본: 5)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 import 비용 상위 모듈 수 (기본: 15)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 경로 (미지정 시 stdout)")
+    args = parser.parse_args(argv)
+
+    samples = [_run_once() for _ in range(args.repeat)]
+    modules = samples[-1]["modules"]
+    top = sorted(
+        (name for name in modules if name.split(".")[0] != "encodings"),
+        key=modules.get, reverse=True,
+    )[: args.top]
+
+    report = {
+        "version": RESULT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {"repeat": args.repeat},
+        # 첫 실행은 .pyc 생성 등으로 느릴 수 있으므로 중앙값을 사용한다
+        "results": {
+            "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+            "list_tools_ms": round(statistics.median(s["list_tools_ms"] for s in samples), 1),
+            "tools": samples[-1]["tools"],
+            "sdk_loaded_at_startup": samples[-1]["sdk_loaded"],
+            "top_imports_ms": {name: round(modules[name] / 1000, 1) for name in top},
+        },
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
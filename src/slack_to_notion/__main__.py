@@ -1,5 +1,7 @@
 """python -m slack_to_notion 실행을 지원한다."""
 
+import sys
+
 from slack_to_notion.mcp_server import main
 
-main()
+sys.exit(main())
@@ -4,10 +4,20 @@
 분석 기준과 정리 방식은 플러그인 사용자가 자유롭게 지정한다.
 """
 
+import gzip
 import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+from .metrics import metrics
+from .text_index import normalize_text, tokenize
+
 
 # 사용자에게 분석 방향을 안내할 때 제시하는 예시
 ANALYSIS_GUIDE_EXAMPLES = [
@@ -48,34 +58,92 @@ def _format_timestamp(ts: str) -> str:
         return ts
 
 
-def format_messages_for_analysis(messages: list[dict], channel_name: str) -> str:
-    """Slack 메시지 리스트를 AI 분석용 텍스트로 변환."""
+def _format_message_line(msg: dict) -> str:
+    """메시지 하나를 "작성자 (시각) — 내용" 형식의 분석용 줄로 변환."""
+    ts = msg.get("ts", "")
+    user = msg.get("user_name", msg.get("user", "Unknown"))
+    text = msg.get("text", "")
+    reply_count = msg.get("reply_count", 0)
+
+    timestamp_str = _format_timestamp(ts)
+
+    msg_line = f"{user} ({timestamp_str}) \u2014 {text}"
+    if reply_count > 0:
+        msg_line += f"\n  [스레드 - 답글 {reply_count}개]"
+    return msg_line
+
+
+@metrics.timed("analyzer.format_messages")
+def format_messages_for_analysis(
+    messages: list[dict],
+    channel_name: str,
+    thread_replies: dict[str, list[dict]] | None = None,
+) -> str:
+    """Slack 메시지 리스트를 AI 분석용 텍스트로 변환.
+
+    Args:
+        messages: Slack 메시지 리스트
+        channel_name: 채널 이름
+        thread_replies: {thread_ts: 답글 리스트}. 지정된 스레드는 답글을 부모 메시지 아래에 펼쳐서 표시한다.
+    """
+    thread_replies = thread_replies or {}
     context_lines = [
         f"Channel: {channel_name}",
         f"Message count: {len(messages)}",
-        "",
-        "Messages:",
-        "",
     ]
+    if thread_replies:
+        expanded = sum(len(replies) for replies in thread_replies.values())
+        context_lines.append(f"Expanded threads: {len(thread_replies)} (replies: {expanded})")
+    context_lines += ["", "Messages:", ""]
 
     message_lines = []
     for msg in messages:
-        ts = msg.get("ts", "")
-        user = msg.get("user_name", msg.get("user", "Unknown"))
-        text = msg.get("text", "")
-        reply_count = msg.get("reply_count", 0)
+        message_lines.append(_format_message_line(msg))
+        replies = thread_replies.get(msg.get("ts", ""))
+        if replies is None:
+            continue
+        for reply in replies:
+            message_lines.append(f"  \u21b3 {_format_message_line({**reply, 'reply_count': 0})}")
+        omitted = msg.get("reply_count", 0) - len(replies)
+        if omitted > 0:
+            message_lines.append(f"  ... (답글 {omitted}개 생략)")
 
-        timestamp_str = _format_timestamp(ts)
+    return "\n".join(context_lines + message_lines)
 
-        msg_line = f"{user} ({timestamp_str}) \u2014 {text}"
-        if reply_count > 0:
-            msg_line += f"\n  [스레드 - 답글 {reply_count}개]"
 
-        message_lines.append(msg_line)
+@metrics.timed("analyzer.format_channels")
+def format_channels_for_analysis(channels: list[dict]) -> str:
+    """여러 채널의 메시지를 채널별 섹션으로 묶은 AI 분석용 텍스트로 변환.
 
-    return "\n".join(context_lines + message_lines)
+    Args:
+        channels: 채널 목록. 각 항목은 {"channel_name": str, "messages": list[dict]}이며,
+            수집에 실패한 채널은 "error" 필드에 사유를 담는다.
+
+    Returns:
+        AI 분석용 포맷 텍스트
+    """
+    total_messages = sum(len(c.get("messages", [])) for c in channels)
+    lines = [
+        f"Channel count: {len(channels)}",
+        f"Total messages: {total_messages}",
+        "",
+    ]
+
+    for channel in channels:
+        messages = channel.get("messages", [])
+        if channel.get("error"):
+            lines.append(f"=== Channel: {channel['channel_name']} (수집 실패) ===")
+            lines.append(f"[수집 실패] {channel['error']}")
+        else:
+            lines.append(f"=== Channel: {channel['channel_name']} ({len(messages)} messages) ===")
+            lines.append("")
+            lines.extend(_format_message_line(msg) for msg in messages)
+        lines.append("")
+
+    return "\n".join(lines)
 
 
+@metrics.timed("analyzer.format_threads")
 def format_threads_for_analysis(
     threads: list[dict],
     channel_name: str,
@@ -117,23 +185,147 @@ def format_threads_for_analysis(
     return "\n".join(context_lines)
 
 
-def save_result(data: dict, path: Path) -> Path:
-    """분석 결과를 JSON 파일로 로컬 저장 (백업/캐시)."""
+def format_search_results(
+    messages: list[dict],
+    query: str,
+    channel_names: dict[str, str] | None = None,
+) -> str:
+    """로컬 메시지 검색 결과를 AI 분석용 텍스트로 변환.
+
+    Args:
+        messages: 검색된 메시지 리스트 (channel_id 필드 포함)
+        query: 검색어
+        channel_names: 채널 ID → 이름 매핑 (없으면 채널 ID 표시)
+
+    Returns:
+        AI 분석용 포맷 텍스트
+    """
+    channel_names = channel_names or {}
+    lines = [
+        f"Query: {query}",
+        f"Result count: {len(messages)}",
+        "",
+    ]
+
+    for msg in messages:
+        channel_id = msg.get("channel_id", "")
+        channel = channel_names.get(channel_id, channel_id)
+        user = msg.get("user_name", msg.get("user", "Unknown"))
+        timestamp_str = _format_timestamp(msg.get("ts", ""))
+        line = f"[#{channel}] {user} ({timestamp_str}) \u2014 {msg.get('text', '')}"
+
+        thread_ts = msg.get("thread_ts")
+        if thread_ts and thread_ts != msg.get("ts"):
+            line += f"\n  [스레드 답글 - thread_ts: {thread_ts}]"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+# 압축 형식별 파일 확장자
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _zstandard():
+    """zstandard 모듈을 반환한다. 설치되어 있지 않으면 안내 메시지와 함께 실패한다."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            "zstd 압축을 사용하려면 zstandard 패키지가 필요합니다. "
+            "pip install 'slack-to-notion-mcp[zstd]'로 설치하거나 gzip 압축을 사용하세요."
+        ) from e
+    return zstandard
+
+
+def _compression_from_suffix(path: Path) -> str | None:
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            return compression
+    return None
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 이름을 바꿔, 중간에 중단돼도 기존 파일이 깨지지 않게 한다."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def save_result(data: dict, path: Path, compression: str | None = None) -> Path:
+    """분석 결과를 JSON 파일로 로컬 저장 (백업/캐시).
+
+    공백 없는 compact JSON으로 임시 파일에 쓴 뒤 교체하므로, 저장 중 서버가
+    종료돼도 잘린 파일이 남지 않는다. 저장 후 같은 디렉토리의 히스토리 인덱스에 항목을 추가한다.
+
+    Args:
+        data: 저장할 데이터
+        path: 저장 경로
+        compression: "gzip" 또는 "zstd" (미지정 시 확장자 .gz/.zst로 판단, 없으면 비압축)
+
+    Returns:
+        저장된 파일 경로
+    """
+    compression = compression or _compression_from_suffix(path)
+    if compression not in (None, *COMPRESSION_SUFFIXES):
+        raise ValueError(f"지원하지 않는 압축 형식입니다: {compression}")
+
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if compression == "gzip":
+        payload = gzip.compress(payload, compresslevel=6, mtime=0)
+    elif compression == "zstd":
+        payload = _zstandard().ZstdCompressor(level=10).compress(payload)
+
     path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, payload)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    try:
+        _update_history_index(path, data)
+    except OSError:
+        # 인덱스는 list_history에서 다시 맞추므로 저장 결과에는 영향이 없다
+        pass
 
     return path
 
 
 def load_result(path: Path) -> dict:
-    """로컬 JSON 파일에서 분석 결과 로드."""
+    """로컬 JSON 파일에서 분석 결과 로드.
+
+    비압축 JSON(이전 indent=2 형식 포함), gzip, zstd 파일을 내용으로 판별하여 읽는다.
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        ValueError: 파일 내용을 해석할 수 없는 경우
+    """
     if not path.exists():
         raise FileNotFoundError(f"분석 결과 파일을 찾을 수 없습니다: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = path.read_bytes()
+    try:
+        if raw.startswith(_GZIP_MAGIC):
+            raw = gzip.decompress(raw)
+        elif raw.startswith(_ZSTD_MAGIC):
+            zstandard = _zstandard()
+            try:
+                # 스트리밍 압축 결과처럼 원본 크기가 헤더에 없는 경우도 처리한다
+                raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+            except zstandard.ZstdError as e:
+                raise ValueError(str(e)) from e
+        return json.loads(raw.decode("utf-8"))
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        raise ValueError(f"분석 결과 파일을 읽을 수 없습니다: {path} ({e!s})") from e
 
 
 # ──────────────────────────────────────────────
@@ -142,16 +334,134 @@ def load_result(path: Path) -> dict:
 
 DEFAULT_PREFERENCES_PATH = Path(".claude/slack-to-notion/preferences.md")
 DEFAULT_HISTORY_DIR = Path(".claude/slack-to-notion/history")
+# 히스토리 디렉토리의 파일명/수정시각/크기/요약을 담는 사이드카 인덱스
+HISTORY_INDEX_FILENAME = ".index.json"
+# 히스토리 검색용 파일별 토큰 목록 (목록 조회용 인덱스를 작게 유지하기 위해 분리)
+HISTORY_TERMS_FILENAME = ".terms.json"
+# 히스토리 결과 파일로 인식하는 확장자 (비압축, gzip, zstd)
+HISTORY_SUFFIXES = (".json", ".json.gz", ".json.zst")
+# 보존 정책을 넘은 결과를 묶어 두는 보관 세그먼트 디렉토리 (history/archive/)
+HISTORY_ARCHIVE_DIRNAME = "archive"
+# 마지막 보관 세그먼트가 이 크기보다 작으면 새로 옮기는 결과와 합쳐 다시 쓴다 (작은 세그먼트가 쌓이지 않게)
+HISTORY_SEGMENT_TARGET_BYTES = 4 * 1024 * 1024
+# 한 세그먼트에 담을 결과의 수정시각 범위 (일). 보관 기간은 세그먼트의 가장 최신 결과 기준이므로
+# 세그먼트의 결과는 보관 기간보다 최대 이 기간만큼 더 남는다
+HISTORY_SEGMENT_MAX_SPAN_DAYS = 30
+# segment-{생성 시각(ns)}-{가장 최신 결과의 수정시각(초)}.jsonl.gz (이전 형식은 최신 시각 없음)
+_SEGMENT_NAME_PATTERN = re.compile(r"^segment-\d+(?:-(\d+))?\.jsonl\.gz$")
+# 보존 한도를 넘으면 한도의 80%까지 줄여, 저장할 때마다 압축이 반복되지 않게 한다
+_RETENTION_LOW_WATERMARK = 0.8
+# 파일 하나당 검색 토큰 최대 개수
+_MAX_TERMS_PER_FILE = 2000
+
+
+# 선호도 최대 보관 건수와 전체 글자 수 (넘으면 오래된 항목부터 제거)
+MAX_PREFERENCE_ENTRIES = 30
+MAX_PREFERENCE_CHARS = 4000
+_PREFERENCES_HEADER = "## 분석 선호도"
+# "- [2026-02-16] #회의록 결정사항 위주로" 형식 (#주제는 선택)
+_PREFERENCE_LINE_PATTERN = re.compile(r"^- (?:\[(\d{4}-\d{2}-\d{2})\] )?(?:#(\S+) )?(.+)$")
+
+# 경로별 선호도 캐시: {경로: ((mtime_ns, size), 항목 리스트)}
+_preferences_cache: dict[str, tuple[tuple[int, int], list[dict]]] = {}
+# 도구가 작업 스레드에서 동시에 실행되므로 선호도/히스토리 인덱스를 읽고 고쳐 쓰는 구간은 잠근다.
+# 히스토리 보존 정책은 인덱스를 갱신하는 함수를 안에서 다시 부르므로 재진입 가능한 잠금을 쓴다
+_preferences_lock = threading.Lock()
+_history_lock = threading.RLock()
+
+
+def _compact_preferences(entries: list[dict]) -> list[dict]:
+    """선호도 항목을 정리한다.
+
+    같은 내용은 최신 항목 하나만, 같은 주제(#key)도 최신 항목 하나만 남기고,
+    건수/글자 수 한도를 넘으면 오래된 항목부터 제거한다. 항목 순서는 오래된 순이다.
+    """
+    seen_texts: set[str] = set()
+    seen_keys: set[str] = set()
+    kept: list[dict] = []
+    total_chars = 0
+    for entry in reversed(entries):
+        normalized = normalize_text(entry["text"])
+        if normalized in seen_texts:
+            continue
+        if entry["key"] and entry["key"] in seen_keys:
+            continue
+        if len(kept) >= MAX_PREFERENCE_ENTRIES or total_chars + len(entry["text"]) > MAX_PREFERENCE_CHARS:
+            break
+        seen_texts.add(normalized)
+        if entry["key"]:
+            seen_keys.add(entry["key"])
+        kept.append(entry)
+        total_chars += len(entry["text"])
+    kept.reverse()
+    return kept
+
 
+def _parse_preferences(content: str) -> tuple[list[str], list[dict]]:
+    """선호도 파일 내용을 줄 리스트와 항목 리스트로 나눈다.
+
+    "- "로 시작하는 줄이 항목이며, 바로 뒤에 이어지는 빈 줄/제목이 아닌 줄은 같은 항목으로 본다
+    (이전 버전이 남긴 여러 줄 항목). 항목에는 파일에서 차지하는 줄 범위(start, end)를 함께 담는다.
+    """
+    lines = content.splitlines()
+    entries: list[dict] = []
+    current = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        match = _PREFERENCE_LINE_PATTERN.match(line) if line.startswith("- ") else None
+        if match is None and current is not None and stripped and not stripped.startswith("#"):
+            current["text"] += "\n" + stripped
+            current["end"] = index + 1
+            continue
+        match = match or _PREFERENCE_LINE_PATTERN.match(stripped)
+        if match is None:
+            current = None
+            continue
+        date, key, text = match.groups()
+        current = {"date": date or "", "key": key or "", "text": text.strip(), "start": index, "end": index + 1}
+        entries.append(current)
+    return lines, entries
 
-def save_preference(text: str, path: Path | None = None) -> Path:
-    """사용자 분석 선호도를 preferences.md에 추가한다.
 
-    append-only 방식으로 타임스탬프와 함께 축적한다.
+def _read_preferences(path: Path) -> list[dict]:
+    """선호도 파일을 정리된 항목 리스트로 읽는다. 파일이 바뀌지 않았으면 캐시를 사용한다."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return []
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(path)
+    cached = _preferences_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    _, entries = _parse_preferences(path.read_text(encoding="utf-8"))
+    entries = _compact_preferences(entries)
+    _preferences_cache[cache_key] = (signature, entries)
+    return entries
+
+
+def _render_entry(entry: dict) -> str:
+    date = f"[{entry['date']}] " if entry["date"] else ""
+    key = f"#{entry['key']} " if entry["key"] else ""
+    return f"- {date}{key}" + entry["text"].replace("\n", "\n  ")
+
+
+def _render_preferences(entries: list[dict]) -> str:
+    return "\n".join([_PREFERENCES_HEADER, "", *(_render_entry(entry) for entry in entries)]) + "\n"
+
+
+def save_preference(text: str, path: Path | None = None, key: str = "") -> Path:
+    """사용자 분석 선호도를 preferences.md에 저장한다.
+
+    타임스탬프와 함께 마지막 항목 뒤에 추가하며, 같은 내용의 항목은 새 항목으로 옮기고
+    같은 주제(key)의 이전 선호도는 새 선호도로 대체한다. 그 밖의 줄(직접 쓴 메모, 제목,
+    이전 버전의 여러 줄 항목)은 그대로 둔다. 건수/글자 수 한도는 load_preferences에서만 적용한다.
 
     Args:
         text: 저장할 선호도 텍스트
         path: 저장 경로 (기본: .claude/slack-to-notion/preferences.md)
+        key: 선호도 주제 (예: "회의록"). 같은 주제의 이전 선호도를 대체한다.
 
     Returns:
         저장된 파일 경로
@@ -160,68 +470,602 @@ def save_preference(text: str, path: Path | None = None) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y-%m-%d")
-    entry = f"- [{timestamp}] {text}\n"
+    key = key.strip().lstrip("#").replace(" ", "_")
+    text = " ".join(text.split())
+    normalized = normalize_text(text)
 
-    if not path.exists():
-        path.write_text("## 분석 선호도\n\n", encoding="utf-8")
-
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(entry)
+    with _preferences_lock:
+        try:
+            lines, entries = _parse_preferences(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            lines, entries = [_PREFERENCES_HEADER, ""], []
+        replaced = {
+            index
+            for entry in entries
+            if normalize_text(entry["text"]) == normalized or (key and entry["key"] == key)
+            for index in range(entry["start"], entry["end"])
+        }
+        kept_ends = [entry["end"] for entry in entries if entry["start"] not in replaced]
+        insert_at = kept_ends[-1] if kept_ends else len(lines)
+        new_line = _render_entry({"date": timestamp, "key": key, "text": text})
+        output = [line for index, line in enumerate(lines[:insert_at]) if index not in replaced]
+        output.append(new_line)
+        output.extend(line for index, line in enumerate(lines[insert_at:], insert_at) if index not in replaced)
 
+        _write_atomic(path, ("\n".join(output) + "\n").encode("utf-8"))
+        _preferences_cache.pop(str(path), None)
     return path
 
 
 def load_preferences(path: Path | None = None) -> str:
     """저장된 분석 선호도를 반환한다.
 
+    중복/대체된 항목을 제외하고 최근 MAX_PREFERENCE_ENTRIES건, MAX_PREFERENCE_CHARS자까지
+    정리한 목록을 반환한다. 파일이 바뀌지 않았으면 메모리 캐시를 사용한다.
+
     Args:
         path: 선호도 파일 경로 (기본: .claude/slack-to-notion/preferences.md)
 
     Returns:
-        선호도 파일 내용. 파일이 없으면 빈 문자열.
+        선호도 목록 텍스트. 파일이 없거나 항목이 없으면 빈 문자열.
     """
     path = path or DEFAULT_PREFERENCES_PATH
-    if not path.exists():
+    entries = _read_preferences(path)
+    if not entries:
         return ""
-    return path.read_text(encoding="utf-8")
+    return _render_preferences(entries)
+
+
+def _summarize(data: object) -> str:
+    """분석 결과 데이터에서 목록 표시용 요약을 추출한다."""
+    if not isinstance(data, dict):
+        return ""
+    summary = data.get("title", data.get("summary", ""))
+    if not summary:
+        # 첫 번째 키의 값을 요약으로 사용
+        for v in data.values():
+            if isinstance(v, str) and v:
+                summary = v[:100]
+                break
+    return summary
+
+
+def _history_entry(path: Path, data: object = None) -> dict:
+    """히스토리 인덱스 항목을 만든다. data가 없으면 파일을 읽어 요약을 만든다."""
+    stat = path.stat()
+    if data is None:
+        try:
+            data = load_result(path)
+        except (ValueError, RuntimeError, OSError):
+            return {"mtime": stat.st_mtime, "size": stat.st_size, "summary": "(읽기 실패)"}
+    return {"mtime": stat.st_mtime, "size": stat.st_size, "summary": _summarize(data)}
+
+
+def _scan_history_files(history_dir: Path) -> set[str]:
+    """히스토리 디렉토리의 결과 파일명 집합 (인덱스 등 숨김 파일 제외)."""
+    with os.scandir(history_dir) as it:
+        return {
+            entry.name for entry in it
+            if entry.name.endswith(HISTORY_SUFFIXES) and not entry.name.startswith(".") and entry.is_file()
+        }
+
+
+def _read_history_index(history_dir: Path) -> dict[str, dict]:
+    """히스토리 인덱스를 읽는다. 없거나 손상되었으면 빈 dict."""
+    try:
+        data = json.loads((history_dir / HISTORY_INDEX_FILENAME).read_text(encoding="utf-8"))
+        entries = data["entries"]
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _write_history_index(history_dir: Path, entries: dict[str, dict]) -> None:
+    """히스토리 인덱스를 임시 파일에 쓴 뒤 교체한다."""
+    payload = json.dumps({"version": 1, "entries": entries}, ensure_ascii=False, separators=(",", ":"))
+    _write_atomic(history_dir / HISTORY_INDEX_FILENAME, payload.encode("utf-8"))
+
+
+def _update_history_index(path: Path, data: object) -> None:
+    """저장한 결과 파일 하나를 히스토리 인덱스와 검색 토큰 목록에 반영한다."""
+    with _history_lock:
+        entries = _read_history_index(path.parent)
+        entries[path.name] = _history_entry(path, data)
+        _write_history_index(path.parent, entries)
+
+        terms = _read_history_terms(path.parent)
+        terms[path.name] = _history_terms(path.name, data)
+        _write_history_terms(path.parent, terms)
+
+
+def _collect_strings(data: object, out: list[str]) -> None:
+    """JSON 데이터의 모든 문자열 값을 수집한다."""
+    if isinstance(data, str):
+        out.append(data)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _collect_strings(value, out)
+    elif isinstance(data, list):
+        for value in data:
+            _collect_strings(value, out)
+
+
+def _history_terms(filename: str, data: object) -> list[str]:
+    """분석 결과의 검색 토큰 목록 (중복 제거, 최대 _MAX_TERMS_PER_FILE개)."""
+    strings = [filename.split(".", 1)[0]]
+    _collect_strings(data, strings)
+    terms = dict.fromkeys(t for text in strings for t in tokenize(text))
+    return list(terms)[:_MAX_TERMS_PER_FILE]
+
+
+def _read_history_terms(history_dir: Path) -> dict[str, list[str]]:
+    try:
+        data = json.loads((history_dir / HISTORY_TERMS_FILENAME).read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_history_terms(history_dir: Path, terms: dict[str, list[str]]) -> None:
+    payload = json.dumps(terms, ensure_ascii=False, separators=(",", ":"))
+    _write_atomic(history_dir / HISTORY_TERMS_FILENAME, payload.encode("utf-8"))
+
+
+def rebuild_history_index(history_dir: Path | None = None) -> int:
+    """히스토리 디렉토리의 모든 결과 파일을 다시 읽어 인덱스를 새로 만든다.
+
+    파일을 직접 수정하는 등 인덱스와 실제 파일이 어긋났을 때 사용한다.
+
+    Args:
+        history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
+
+    Returns:
+        인덱스에 등록된 파일 수
+    """
+    history_dir = history_dir or DEFAULT_HISTORY_DIR
+    if not history_dir.exists():
+        return 0
+
+    with _history_lock:
+        entries = {}
+        terms = {}
+        for name in _scan_history_files(history_dir):
+            path = history_dir / name
+            try:
+                data = load_result(path)
+            except (OSError, ValueError):
+                data = None
+            try:
+                entries[name] = _history_entry(path, data)
+            except OSError:
+                continue
+            terms[name] = _history_terms(name, data)
+
+        archive_dir = history_dir / HISTORY_ARCHIVE_DIRNAME
+        if archive_dir.exists():
+            for segment in sorted(archive_dir.glob("*.jsonl.gz")):
+                relative = f"{HISTORY_ARCHIVE_DIRNAME}/{segment.name}"
+                try:
+                    records = list(_iter_archive_segment(segment))
+                except (OSError, ValueError):
+                    continue
+                for record in records:
+                    name = record["filename"]
+                    if name in entries and "archive" not in entries[name]:
+                        continue
+                    entries[name] = {
+                        "mtime": record["mtime"],
+                        "size": record["size"],
+                        "summary": _summarize(record["data"]),
+                        "archive": relative,
+                    }
+                    terms[name] = _history_terms(name, record["data"])
+
+        _write_history_index(history_dir, entries)
+        _write_history_terms(history_dir, terms)
+    _search_cache.clear()
+    return len(entries)
+
+
+def _reconcile_history_index(history_dir: Path) -> dict[str, dict]:
+    """히스토리 인덱스를 실제 파일 목록과 맞춘 뒤 반환한다.
+
+    인덱스에 없는 파일은 추가하고 삭제된 파일은 제거한다.
+    보관 세그먼트로 옮긴 항목은 유지하되, 같은 이름의 파일이 다시 있으면 파일을 우선한다.
+    """
+    with _history_lock:
+        entries = _read_history_index(history_dir)
+        names = _scan_history_files(history_dir)
+
+        changed = False
+        for name in [n for n, e in entries.items() if "archive" not in e and n not in names]:
+            del entries[name]
+            changed = True
+        for name in names:
+            if name in entries and "archive" not in entries[name]:
+                continue
+            try:
+                entries[name] = _history_entry(history_dir / name)
+            except OSError:
+                continue
+            changed = True
+        if changed:
+            try:
+                _write_history_index(history_dir, entries)
+            except OSError:
+                pass
+    return entries
 
 
 def list_history(limit: int = 10, history_dir: Path | None = None) -> list[dict]:
     """분석 히스토리 목록을 반환한다.
 
-    history/ 디렉토리에서 최근 N건의 파일 정보를 반환한다.
+    history/ 디렉토리의 사이드카 인덱스에서 최근 N건의 정보를 반환한다.
+    인덱스에 없는 파일은 추가하고 삭제된 파일은 제거하므로,
+    결과 파일을 다시 읽는 것은 새로 생긴 파일뿐이다.
+    보관 세그먼트로 압축된 항목도 함께 반환한다 (archived=True).
 
     Args:
         limit: 반환할 최대 건수 (기본: 10)
         history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
 
     Returns:
-        히스토리 목록. 각 항목은 {"filename", "path", "summary"} 형태.
+        히스토리 목록. 각 항목은 {"filename", "path", "summary", "archived"} 형태.
     """
     history_dir = history_dir or DEFAULT_HISTORY_DIR
     if not history_dir.exists():
         return []
 
-    files = sorted(history_dir.glob("*.json"), key=lambda f: f.stat().st_mtime, reverse=True)
-    results = []
-    for f in files[:limit]:
-        summary = ""
-        try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                summary = data.get("title", data.get("summary", ""))
-                if not summary:
-                    # 첫 번째 키의 값을 요약으로 사용
-                    for v in data.values():
-                        if isinstance(v, str) and v:
-                            summary = v[:100]
-                            break
-        except (json.JSONDecodeError, OSError):
-            summary = "(읽기 실패)"
-        results.append({
-            "filename": f.name,
-            "path": str(f),
-            "summary": summary,
-        })
-
-    return results
+    entries = _reconcile_history_index(history_dir)
+    ordered = sorted(entries.items(), key=lambda item: item[1]["mtime"], reverse=True)
+    return [
+        {
+            "filename": name,
+            "path": str(history_dir / entry.get("archive", name)),
+            "summary": entry["summary"],
+            "archived": "archive" in entry,
+        }
+        for name, entry in ordered[:limit]
+    ]
+
+
+# 히스토리 디렉토리별 역색인 캐시: {디렉토리: (토큰 파일 mtime_ns, 역색인)}
+_search_cache: dict[str, tuple[int, dict[str, set[str]]]] = {}
+
+
+def _history_postings(history_dir: Path, names: set[str]) -> dict[str, set[str]]:
+    """히스토리 검색용 역색인 (토큰 → 파일명 집합).
+
+    토큰 파일이 바뀌지 않았으면 메모리에 만들어 둔 역색인을 재사용한다.
+    토큰 목록이 없는 파일(직접 복사한 파일 등)은 이때 읽어서 추가한다.
+    """
+    with _history_lock:
+        terms = _read_history_terms(history_dir)
+        missing = names - set(terms)
+        stale = set(terms) - names
+        if missing or stale:
+            for name in stale:
+                del terms[name]
+            for name in missing:
+                try:
+                    data = load_history_result(name, history_dir)
+                except (OSError, ValueError, RuntimeError):
+                    data = None
+                terms[name] = _history_terms(name, data)
+            try:
+                _write_history_terms(history_dir, terms)
+            except OSError:
+                pass
+
+    terms_path = history_dir / HISTORY_TERMS_FILENAME
+    try:
+        mtime_ns = terms_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    cache_key = str(history_dir.resolve())
+    cached = _search_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns and mtime_ns != -1:
+        return cached[1]
+
+    postings: dict[str, set[str]] = {}
+    for name, file_terms in terms.items():
+        for term in file_terms:
+            postings.setdefault(term, set()).add(name)
+    _search_cache[cache_key] = (mtime_ns, postings)
+    return postings
+
+
+def search_history_index(query: str, limit: int = 5, history_dir: Path | None = None) -> list[dict]:
+    """저장된 분석 결과를 검색어로 찾는다.
+
+    역색인에서 검색어 토큰을 포함한 파일을 찾아 IDF 가중 점수로 정렬한다.
+    결과 파일 자체는 읽지 않는다.
+
+    Args:
+        query: 검색어 (예: "마케팅 주간 회의")
+        limit: 반환할 최대 건수 (기본: 5)
+        history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
+
+    Returns:
+        검색 결과 목록. 각 항목은 {"filename", "path", "summary", "score"} 형태.
+    """
+    history_dir = history_dir or DEFAULT_HISTORY_DIR
+    query_terms = list(dict.fromkeys(tokenize(query)))
+    if not query_terms or not history_dir.exists():
+        return []
+
+    # list_history가 인덱스를 디렉토리와 맞춰 두므로 그 결과를 기준으로 삼는다
+    listed = {item["filename"]: item for item in list_history(limit=10**9, history_dir=history_dir)}
+    postings = _history_postings(history_dir, set(listed))
+
+    total = max(len(listed), 1)
+    scores: dict[str, float] = {}
+    for term in query_terms:
+        matched = postings.get(term, set())
+        if not matched:
+            continue
+        idf = math.log(1 + total / len(matched))
+        for name in matched:
+            scores[name] = scores.get(name, 0.0) + idf
+
+    max_score = sum(math.log(1 + total / len(postings[t])) for t in query_terms if postings.get(t))
+    ranked = sorted(
+        (name for name in scores if name in listed),
+        key=lambda name: (-scores[name], name),
+    )
+    return [
+        {
+            **listed[name],
+            "score": round(scores[name] / max_score, 3) if max_score else 0.0,
+        }
+        for name in ranked[:limit]
+    ]
+
+
+def load_history_result(filename: str, history_dir: Path | None = None) -> dict:
+    """히스토리 디렉토리에서 파일명으로 분석 결과를 로드한다.
+
+    보관 세그먼트로 압축된 결과도 같은 파일명으로 불러온다.
+
+    Args:
+        filename: 히스토리 파일명 (예: analysis_20260216_120000.json)
+        history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
+
+    Returns:
+        분석 결과 dict
+
+    Raises:
+        ValueError: 파일명에 경로가 포함된 경우
+        FileNotFoundError: 파일이 없는 경우
+    """
+    history_dir = history_dir or DEFAULT_HISTORY_DIR
+    if not filename or Path(filename).name != filename or filename.startswith("."):
+        raise ValueError(f"올바르지 않은 히스토리 파일명입니다: {filename}")
+
+    path = history_dir / filename
+    if path.exists():
+        return load_result(path)
+
+    entry = _read_history_index(history_dir).get(filename, {})
+    if "archive" in entry:
+        segment = history_dir / entry["archive"]
+        data = None
+        if segment.exists():
+            for record in _iter_archive_segment(segment):
+                if record["filename"] == filename:
+                    data = record["data"]
+        if data is not None:
+            return data
+
+    raise FileNotFoundError(f"분석 결과 파일을 찾을 수 없습니다: {path}")
+
+
+def _iter_archive_segment(segment: Path):
+    """보관 세그먼트(gzip JSON Lines)의 레코드를 순서대로 반환한다."""
+    with gzip.open(segment, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _segment_newest_mtime(segment: Path, fallback: float) -> float:
+    """세그먼트에 담긴 가장 최신 결과의 수정시각. 이름에 없으면 (이전 형식) 내용을 읽어 구한다."""
+    match = _SEGMENT_NAME_PATTERN.match(segment.name)
+    if match and match.group(1):
+        return float(match.group(1))
+    try:
+        return max((record["mtime"] for record in _iter_archive_segment(segment)), default=fallback)
+    except (OSError, ValueError, KeyError):
+        return fallback
+
+
+def apply_history_retention(
+    history_dir: Path | None = None,
+    max_age_days: float | None = None,
+    max_count: int | None = None,
+    max_bytes: int | None = None,
+    now: float | None = None,
+) -> list[str]:
+    """보존 한도를 넘은 히스토리 결과를 보관 세그먼트로 압축한다.
+
+    한도 판단은 인덱스의 수정시각/크기만 사용하므로 한도 안에 있으면 파일을 읽지 않는다.
+    개수/용량 한도를 넘으면 한도의 80%가 될 때까지 오래된 결과부터 옮기고,
+    가장 최근 결과 하나는 항상 파일로 남긴다.
+    옮긴 결과는 history/archive/의 gzip JSON Lines 세그먼트에 묶이며,
+    list_history, search_history_index, load_history_result에서 계속 조회된다.
+    마지막 세그먼트가 HISTORY_SEGMENT_TARGET_BYTES보다 작고 합친 결과의 수정시각 범위가
+    HISTORY_SEGMENT_MAX_SPAN_DAYS 안이면 그 세그먼트와 합쳐 새로 쓴다.
+    보관 세그먼트 자체의 삭제는 prune_history_archive가 담당한다.
+
+    Args:
+        history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
+        max_age_days: 파일로 유지할 최대 기간 (일)
+        max_count: 파일로 유지할 최대 개수
+        max_bytes: 파일로 유지할 최대 총 용량 (바이트)
+        now: 기준 시각 (테스트용, 기본: 현재 시각)
+
+    Returns:
+        보관 세그먼트로 옮긴 파일명 리스트
+    """
+    history_dir = history_dir or DEFAULT_HISTORY_DIR
+    if not history_dir.exists() or not (max_age_days or max_count or max_bytes):
+        return []
+
+    with _history_lock:
+        entries = _reconcile_history_index(history_dir)
+        live = sorted(
+            (name for name, entry in entries.items() if "archive" not in entry),
+            key=lambda name: entries[name]["mtime"],
+            reverse=True,
+        )
+        now = now if now is not None else time.time()
+
+        to_archive: list[str] = []
+        if max_age_days:
+            cutoff = now - max_age_days * 86400
+            to_archive = [name for name in live[1:] if entries[name]["mtime"] < cutoff]
+        remaining = [name for name in live if name not in to_archive]
+
+        if max_count and len(remaining) > max_count:
+            keep = max(1, int(max_count * _RETENTION_LOW_WATERMARK))
+            to_archive += remaining[keep:]
+            remaining = remaining[:keep]
+
+        if max_bytes and sum(entries[name]["size"] for name in remaining) > max_bytes:
+            budget = max_bytes * _RETENTION_LOW_WATERMARK
+            total = 0
+            for i, name in enumerate(remaining):
+                total += entries[name]["size"]
+                if i > 0 and total > budget:
+                    to_archive += remaining[i:]
+                    break
+
+        if not to_archive:
+            return []
+
+        records = []
+        for name in to_archive:
+            try:
+                data = load_result(history_dir / name)
+            except (OSError, ValueError, RuntimeError):
+                # 읽을 수 없는 파일은 그대로 둔다
+                continue
+            entry = entries[name]
+            records.append({"filename": name, "mtime": entry["mtime"], "size": entry["size"], "data": data})
+        if not records:
+            return []
+
+        archive_dir = history_dir / HISTORY_ARCHIVE_DIRNAME
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archived_names = [record["filename"] for record in records]
+
+        # 마지막 세그먼트가 작으면 아직 그 세그먼트를 가리키는 결과를 함께 옮겨 하나로 합친다
+        merged_segment = None
+        segments = sorted(archive_dir.glob("segment-*.jsonl.gz"))
+        if segments and segments[-1].stat().st_size < HISTORY_SEGMENT_TARGET_BYTES:
+            previous_relative = f"{HISTORY_ARCHIVE_DIRNAME}/{segments[-1].name}"
+            try:
+                previous = [
+                    record for record in _iter_archive_segment(segments[-1])
+                    if entries.get(record["filename"], {}).get("archive") == previous_relative
+                ]
+            except (OSError, ValueError):
+                previous = None
+            if previous is not None:
+                mtimes = [record["mtime"] for record in previous + records]
+                if max(mtimes) - min(mtimes) <= HISTORY_SEGMENT_MAX_SPAN_DAYS * 86400:
+                    merged_segment = segments[-1]
+                    records = previous + records
+
+        # 보관 기간 판단에 쓰도록 가장 최신 결과의 수정시각을 이름에 남긴다 (파일 수정시각은 합칠 때마다 바뀐다)
+        newest = math.ceil(max(record["mtime"] for record in records))
+        segment_name = f"segment-{time.time_ns()}-{newest}.jsonl.gz"
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n" for record in records
+        )
+        # 세그먼트 → 인덱스 → 원본 삭제 순서로 진행하여 중간에 중단돼도 결과가 사라지지 않게 한다
+        _write_atomic(archive_dir / segment_name, gzip.compress(lines.encode("utf-8"), mtime=0))
+
+        relative = f"{HISTORY_ARCHIVE_DIRNAME}/{segment_name}"
+        for record in records:
+            entries[record["filename"]]["archive"] = relative
+        _write_history_index(history_dir, entries)
+        if merged_segment is not None:
+            merged_segment.unlink(missing_ok=True)
+
+        archived = []
+        for name in archived_names:
+            try:
+                (history_dir / name).unlink()
+            except OSError:
+                continue
+            archived.append(name)
+    return archived
+
+
+def prune_history_archive(
+    history_dir: Path | None = None,
+    max_age_days: float | None = None,
+    max_bytes: int | None = None,
+    now: float | None = None,
+) -> list[str]:
+    """보관 한도를 넘은 오래된 보관 세그먼트와 그 결과를 삭제한다.
+
+    세그먼트에 담긴 가장 최신 결과의 수정시각이 max_age_days보다 오래되었거나,
+    세그먼트 총 용량이 max_bytes를 넘으면 오래된 세그먼트부터 지운다.
+    인덱스와 검색 토큰에서 먼저 제거한 뒤 파일을 지우므로, 중간에 중단돼도 없는 세그먼트를 가리키지 않는다.
+
+    Args:
+        history_dir: 히스토리 디렉토리 (기본: .claude/slack-to-notion/history)
+        max_age_days: 보관 세그먼트를 유지할 최대 기간 (일)
+        max_bytes: 보관 세그먼트의 최대 총 용량 (바이트)
+        now: 기준 시각 (테스트용, 기본: 현재 시각)
+
+    Returns:
+        삭제한 결과 파일명 리스트
+    """
+    history_dir = history_dir or DEFAULT_HISTORY_DIR
+    archive_dir = history_dir / HISTORY_ARCHIVE_DIRNAME
+    if not archive_dir.exists() or not (max_age_days or max_bytes):
+        return []
+
+    with _history_lock:
+        segments = []
+        for segment in sorted(archive_dir.glob("segment-*.jsonl.gz")):
+            try:
+                stat = segment.stat()
+            except OSError:
+                continue
+            segments.append((segment, _segment_newest_mtime(segment, stat.st_mtime), stat.st_size))
+        now = now if now is not None else time.time()
+
+        expired: list[Path] = []
+        if max_age_days:
+            cutoff = now - max_age_days * 86400
+            expired = [segment for segment, mtime, _ in segments if mtime < cutoff]
+        if max_bytes:
+            remaining = [(segment, size) for segment, _, size in segments if segment not in expired]
+            total = sum(size for _, size in remaining)
+            for segment, size in remaining:
+                if total <= max_bytes:
+                    break
+                expired.append(segment)
+                total -= size
+        if not expired:
+            return []
+
+        relatives = {f"{HISTORY_ARCHIVE_DIRNAME}/{segment.name}" for segment in expired}
+        entries = _read_history_index(history_dir)
+        deleted = [name for name, entry in entries.items() if entry.get("archive") in relatives]
+        for name in deleted:
+            del entries[name]
+        _write_history_index(history_dir, entries)
+        terms = _read_history_terms(history_dir)
+        if any(name in terms for name in deleted):
+            for name in deleted:
+                terms.pop(name, None)
+            _write_history_terms(history_dir, terms)
+
+        for segment in expired:
+            segment.unlink(missing_ok=True)
+    return deleted
@@ -0,0 +1,145 @@
+"""헤드리스 CLI.
+
+MCP 클라이언트 없이 cron 등에서 정기 내보내기를 실행한다. MCP 서버와 같은 clients 모듈로 클라이언트를
+만들므로 채널/사용자 캐시(작업 디렉토리의 .claude/slack-to-notion/)와 속도 제한이 그대로 적용된다.
+
+    slack-to-notion-mcp export --channels general,C0123456789 --since 1d --output daily.txt
+    slack-to-notion-mcp export --channels general --since 7d --upload --title "[general] 주간 기록"
+    slack-to-notion-mcp upload --title "주간 요약" --file summary.md
+
+종료 코드: 0 성공, 1 실패 (일부 채널 수집 실패 포함), 2 잘못된 인자
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from . import progress
+from .analyzer import format_channels_for_analysis
+from .clients import get_notion_client, get_slack_client
+from .errors import NotionClientError, SlackClientError
+from .export import (
+    DEFAULT_EXPORT_LIMIT,
+    MAX_EXPORT_LIMIT,
+    collect_channels,
+    default_title,
+    notion_parent_page_id,
+    upload_page,
+)
+from .timerange import resolve_time_range
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = ("export", "upload")
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="slack-to-notion-mcp",
+        description="Slack 메시지를 수집해 파일로 저장하거나 Notion 페이지로 업로드한다 (MCP 서버 없이 실행)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="채널 메시지를 수집해 분석용 텍스트로 저장하거나 Notion에 업로드")
+    export.add_argument("--channels", required=True, help="채널 ID 또는 이름 (쉼표로 구분, 예: general,C0123456789)")
+    export.add_argument("--since", default="", help="시작 시점 (예: 2026-02-09, 2026-02-09 09:00, 7d)")
+    export.add_argument("--until", default="", help="종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)")
+    export.add_argument("--timezone", default="", help="since/until 해석 시간대 (예: Asia/Seoul)")
+    export.add_argument(
+        "--limit", type=int, default=DEFAULT_EXPORT_LIMIT,
+        help=f"채널별 최대 메시지 수 (기본: {DEFAULT_EXPORT_LIMIT}, 최대 {MAX_EXPORT_LIMIT})",
+    )
+    export.add_argument("--output", default="-", help="저장할 파일 경로 (기본: 표준 출력)")
+    export.add_argument("--upload", action="store_true", help="파일 대신 Notion 페이지로 업로드")
+    export.add_argument("--title", default="", help="Notion 페이지 제목 (기본: \"[채널] Slack 내보내기 - 날짜\")")
+
+    upload = commands.add_parser("upload", help="작성해 둔 텍스트(마크다운)를 Notion 페이지로 업로드")
+    upload.add_argument("--title", required=True, help="Notion 페이지 제목")
+    upload.add_argument("--file", default="-", help="업로드할 파일 경로 (기본: 표준 입력)")
+    return parser
+
+
+def _log_progress(value: float, total: float | None, message: str | None) -> None:
+    logger.info("진행: %s", message or (f"{value:g}/{total:g}" if total else f"{value:g}"))
+
+
+def _parent_page_id() -> str:
+    parent_page_id = notion_parent_page_id()
+    if not parent_page_id:
+        raise ValueError("NOTION_PARENT_PAGE_URL 환경변수가 설정되지 않았습니다. Notion 페이지 링크를 입력하세요.")
+    return parent_page_id
+
+
+def _export(args: argparse.Namespace) -> int:
+    channels = [entry.strip() for entry in args.channels.split(",") if entry.strip()]
+    if not channels:
+        raise ValueError("수집할 채널을 하나 이상 지정하세요.")
+    oldest, latest = resolve_time_range(args.since, args.until, args.timezone)
+    parent_page_id = _parent_page_id() if args.upload else None
+
+    targets = collect_channels(
+        get_slack_client(), channels, max(1, min(args.limit, MAX_EXPORT_LIMIT)), oldest, latest,
+    )
+    failed = [t for t in targets if t.get("error")]
+    for target in failed:
+        print(f"[에러] {target['channel_name']}: {target['error']}", file=sys.stderr)
+    text = format_channels_for_analysis(targets)
+
+    if args.upload:
+        url = upload_page(get_notion_client(), parent_page_id, args.title or default_title(channels), text)
+        print(url)
+    elif args.output == "-":
+        sys.stdout.write(text + "\n")
+    else:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        logger.info("%s에 저장했습니다 (채널 %d개, 메시지 %d개)", args.output, len(targets),
+                    sum(len(t.get("messages", [])) for t in targets))
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def _upload(args: argparse.Namespace) -> int:
+    parent_page_id = _parent_page_id()
+    content = sys.stdin.read() if args.file == "-" else Path(args.file).read_text(encoding="utf-8")
+    if not content.strip():
+        raise ValueError("업로드할 내용이 비어 있습니다.")
+    print(upload_page(get_notion_client(), parent_page_id, args.title, content))
+    return EXIT_OK
+
+
+def main(argv: list[str]) -> int:
+    """CLI 진입점. mcp_server.main()이 첫 인자가 COMMANDS 중 하나일 때 호출한다.
+
+    Args:
+        argv: 하위 명령부터 시작하는 인자 리스트 (예: ["export", "--channels", "general"])
+
+    Returns:
+        종료 코드
+    """
+    try:
+        args = _build_parser().parse_args(argv)
+    except SystemExit as e:
+        # --help와 인자 오류 모두 SystemExit 대신 종료 코드로 돌려준다
+        return e.code if isinstance(e.code, int) else EXIT_USAGE
+
+    handler = _export if args.command == "export" else _upload
+    try:
+        with progress.use(progress.ProgressReporter(_log_progress)):
+            return handler(args)
+    except (ValueError, OSError) as e:
+        print(f"[에러] {e}", file=sys.stderr)
+        return EXIT_USAGE if isinstance(e, ValueError) else EXIT_FAILED
+    except (SlackClientError, NotionClientError) as e:
+        print(f"[에러] {e.message}", file=sys.stderr)
+        return EXIT_FAILED
+    except RuntimeError as e:
+        # 토큰 환경변수 누락
+        print(f"[에러] {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print("[안내] 중단되었습니다.", file=sys.stderr)
+        return 130
@@ -0,0 +1,87 @@
+"""Slack/Notion 클라이언트 생성 모듈.
+
+MCP 서버와 헤드리스 CLI가 같은 규칙(토큰 우선순위, 캐시 위치)으로 클라이언트를 만들도록
+환경변수에서 토큰을 읽어 프로세스당 하나의 인스턴스를 만든다.
+
+slack_sdk/notion_client는 불러오는 데 시간이 걸리므로 첫 클라이언트 생성 시점에 import한다.
+"""
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .notion_client import NotionClient
+    from .slack_client import SlackClient
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트 인스턴스 (lazy init)
+_slack_client: "SlackClient | None" = None
+_notion_client: "NotionClient | None" = None
+# 도구가 작업 스레드에서 동시에 실행되므로 클라이언트 초기화는 한 번만 수행한다
+_lock = threading.Lock()
+
+
+def get_slack_client() -> "SlackClient":
+    """SlackClient 인스턴스를 반환한다. 없으면 초기화.
+
+    봇 토큰(SLACK_BOT_TOKEN)을 우선 사용하고, 없으면 사용자 토큰(SLACK_USER_TOKEN)을 사용한다.
+    수집 메시지 로컬 저장은 SLACK_TO_NOTION_MESSAGE_STORE 환경변수로 켠 경우에만 사용한다.
+
+    Raises:
+        RuntimeError: 토큰 환경변수가 설정되지 않은 경우
+    """
+    global _slack_client
+    with _lock:
+        if _slack_client is None:
+            # 봇 토큰 우선, 없으면 사용자 토큰
+            token = os.environ.get("SLACK_BOT_TOKEN") or os.environ.get("SLACK_USER_TOKEN")
+            if not token:
+                raise RuntimeError(
+                    "SLACK_BOT_TOKEN 또는 SLACK_USER_TOKEN 환경변수가 설정되지 않았습니다. "
+                    "Claude Desktop: 설정 파일(claude_desktop_config.json)의 env 섹션을 확인하세요. "
+                    "Claude Code CLI: claude mcp add 명령의 -e 옵션을 확인하세요."
+                )
+            # 접두사로 토큰 타입 판별
+            token_type = "user" if token.startswith("xoxp-") else "bot"
+            # 토큰 접두사 로깅 (디버깅용, 값 노출 방지)
+            token_prefix = token[:10] if len(token) > 10 else token[:4]
+            logger.info(
+                "SlackClient 초기화 (token_type=%s, prefix=%s..., len=%d)",
+                token_type, token_prefix, len(token),
+            )
+            from .message_store import store_enabled, store_limits
+            from .slack_client import DEFAULT_CACHE_DIR, SlackClient
+
+            max_age_days, max_bytes = store_limits()
+            _slack_client = SlackClient(
+                token, token_type, cache_dir=DEFAULT_CACHE_DIR, store_messages=store_enabled(),
+                message_max_age_days=max_age_days, message_max_bytes=max_bytes,
+            )
+    return _slack_client
+
+
+def get_notion_client() -> "NotionClient":
+    """NotionClient 인스턴스를 반환한다. 없으면 초기화.
+
+    Raises:
+        RuntimeError: NOTION_API_KEY 환경변수가 설정되지 않은 경우
+    """
+    global _notion_client
+    with _lock:
+        if _notion_client is None:
+            api_key = os.environ.get("NOTION_API_KEY")
+            if not api_key:
+                raise RuntimeError(
+                    "NOTION_API_KEY 환경변수가 설정되지 않았습니다. "
+                    "Claude Desktop: 설정 파일(claude_desktop_config.json)의 env 섹션을 확인하세요. "
+                    "Claude Code CLI: claude mcp add 명령의 -e 옵션을 확인하세요."
+                )
+            key_prefix = api_key[:10] if len(api_key) > 10 else api_key[:4]
+            logger.info("NotionClient 초기화 (prefix=%s..., len=%d)", key_prefix, len(api_key))
+            from .notion_client import NotionClient
+
+            _notion_client = NotionClient(api_key)
+    return _notion_client
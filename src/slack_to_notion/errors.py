@@ -0,0 +1,20 @@
+"""클라이언트 에러 정의.
+
+SDK를 불러오지 않고도 에러를 처리할 수 있도록 클라이언트 모듈과 분리한다.
+"""
+
+
+class SlackClientError(Exception):
+    """Slack 클라이언트 에러."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class NotionClientError(Exception):
+    """Notion API 호출 중 발생한 에러."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,165 @@
+"""채널 내보내기 파이프라인.
+
+Slack 메시지 수집 → 분석용 텍스트 포맷팅 → Notion 페이지 업로드 단계를
+MCP 도구(format_channels), 백그라운드 작업(start_export), CLI(export/upload)가 함께 사용한다.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .errors import NotionClientError, SlackClientError
+
+# slack_sdk/notion_client import를 첫 사용 시점으로 미루기 위해 타입 검사에서만 import한다
+if TYPE_CHECKING:
+    from .notion_client import NotionClient
+    from .slack_client import SlackClient
+
+# Slack 채널 ID 형식 (공개 C, 비공개 G, DM D)
+CHANNEL_ID_PATTERN = re.compile(r"^[CGD][A-Z0-9]{8,}$")
+
+# 내보내기 작업의 채널별 기본/최대 메시지 수
+DEFAULT_EXPORT_LIMIT = 10000
+MAX_EXPORT_LIMIT = 100000
+
+
+def resolve_channels(client: "SlackClient", channels: list[str]) -> list[dict]:
+    """채널 ID 또는 이름 리스트를 수집 대상 리스트로 변환한다.
+
+    채널 이름은 캐시된 채널 디렉토리로 ID를 찾으며, 찾지 못한 채널은 error 필드에 사유를 담는다.
+
+    Returns:
+        [{"channel_id", "channel_name"} 또는 {"channel_name", "error"}] (입력 순서 유지)
+    """
+    targets = []
+    for entry in channels:
+        entry = entry.strip()
+        if CHANNEL_ID_PATTERN.match(entry):
+            targets.append({"channel_id": entry, "channel_name": client.get_channel_name(entry)})
+            continue
+        channel = client.find_channel(entry)
+        if channel is None:
+            targets.append({"channel_name": entry, "error": "채널을 찾을 수 없습니다. 채널 이름을 확인하세요."})
+        else:
+            targets.append({"channel_id": channel["id"], "channel_name": channel["name"]})
+    return targets
+
+
+def collect_channels(
+    client: "SlackClient",
+    channels: list[str],
+    limit: int,
+    oldest: str | None = None,
+    latest: str | None = None,
+) -> list[dict]:
+    """여러 채널의 메시지를 동시에 수집하고 작성자 이름을 채운다.
+
+    작성자 이름은 채널 전체에서 한 번만 조회한다. 한 채널이 실패해도 나머지 채널 결과는 반환한다.
+
+    Args:
+        client: SlackClient
+        channels: 채널 ID 또는 이름 리스트
+        limit: 채널별 조회할 최대 메시지 수
+        oldest: 시작 타임스탬프
+        latest: 종료 타임스탬프
+
+    Returns:
+        format_channels_for_analysis에 넘길 채널 리스트 (messages 또는 error 필드 포함)
+
+    Raises:
+        SlackClientError: 채널 목록 조회 등 공통 API 호출 실패 시
+    """
+    from .slack_client import DEFAULT_MAX_WORKERS
+
+    targets = resolve_channels(client, channels)
+    channel_ids = [t["channel_id"] for t in targets if "channel_id" in t]
+    results = client.fetch_channels_messages(channel_ids, limit, oldest, latest) if channel_ids else {}
+
+    all_messages = []
+    for target in targets:
+        if "channel_id" not in target:
+            continue
+        result = results[target["channel_id"]]
+        if isinstance(result, SlackClientError):
+            target["error"] = result.message
+        else:
+            target["messages"] = result
+            all_messages.extend(result)
+
+    client.resolve_user_names(all_messages, max_workers=DEFAULT_MAX_WORKERS)
+    return targets
+
+
+def default_title(channels: list[str]) -> str:
+    """내보내기 페이지 기본 제목 ("[채널, ...] Slack 내보내기 - 날짜")."""
+    names = ", ".join(entry.strip().lstrip("#") for entry in channels)
+    return f"[{names}] Slack 내보내기 - {datetime.now():%Y-%m-%d}"
+
+
+def notion_parent_page_id() -> str | None:
+    """NOTION_PARENT_PAGE_URL(또는 NOTION_PARENT_PAGE_ID) 환경변수에서 상위 페이지 ID를 읽는다.
+
+    Returns:
+        상위 페이지 ID. 환경변수가 없으면 None
+    """
+    raw_page_id = os.environ.get("NOTION_PARENT_PAGE_URL", os.environ.get("NOTION_PARENT_PAGE_ID"))
+    if not raw_page_id:
+        return None
+    from .notion_client import extract_page_id
+
+    return extract_page_id(raw_page_id)
+
+
+def upload_page(
+    client: "NotionClient",
+    parent_page_id: str,
+    title: str,
+    content: str,
+    checkpoint: Callable[..., None] | None = None,
+    resume: dict | None = None,
+) -> str:
+    """텍스트를 Notion 블록으로 변환해 상위 페이지 하위에 새 페이지로 만든다.
+
+    checkpoint를 지정하면 중복 확인을 통과한 뒤 creating=True를, 페이지 생성 후와 블록 추가 요청마다
+    page_id, page_url, appended를 키워드 인자로 전달한다. 중단된 업로드는 그 값을 resume으로 넘겨 이어서 실행한다.
+    이때 이미 만든 페이지는 중복으로 보지 않고 appended번째 블록부터 추가한다.
+
+    Args:
+        client: NotionClient
+        parent_page_id: 상위 페이지 ID
+        title: 페이지 제목
+        content: 페이지 내용 (마크다운)
+        checkpoint: 업로드 진행 상태를 받는 함수
+        resume: 이전 실행에서 checkpoint로 받은 값
+
+    Returns:
+        생성된 페이지 URL
+
+    Raises:
+        NotionClientError: 동일 제목의 페이지가 이미 있거나 API 호출 실패 시
+    """
+    resume = resume or {}
+    blocks = client.build_page_blocks(content)
+    if resume.get("creating") and not resume.get("page_id"):
+        # 페이지 생성 요청 직후 중단된 경우: 중복 확인은 통과했으므로 같은 제목의 페이지는 이 작업이 만든 것이다
+        from .notion_client import CHILDREN_LIMIT
+
+        page = client.find_page(parent_page_id, title)
+        if page is not None:
+            # 페이지는 처음 CHILDREN_LIMIT개 블록과 함께 한 번에 생성된다
+            resume = {"page_id": page["id"], "page_url": page["url"], "appended": min(len(blocks), CHILDREN_LIMIT)}
+            if checkpoint is not None:
+                checkpoint(**resume)
+    if resume.get("page_id"):
+        client.append_blocks(
+            resume["page_id"], blocks, resume["appended"], url=resume["page_url"], checkpoint=checkpoint,
+        )
+        return resume["page_url"]
+
+    if not resume.get("creating") and client.check_duplicate(parent_page_id, title):
+        raise NotionClientError(f"동일한 제목의 페이지가 이미 존재합니다: {title}. 제목을 변경하거나 기존 페이지를 확인하세요.")
+    if checkpoint is not None:
+        checkpoint(creating=True)
+    return client.create_analysis_page(parent_page_id, title, blocks, checkpoint=checkpoint)
@@ -0,0 +1,400 @@
+"""백그라운드 작업 모듈.
+
+도구 호출 제한 시간보다 오래 걸리는 작업(대량 내보내기 등)을 작업 스레드에서 실행하고,
+상태를 DEFAULT_JOBS_DIR에 {작업 ID}.json으로 기록한다. 서버가 재시작되면 끝나지 않은
+작업을 다시 대기열에 넣으며, 작업 함수는 Job.state에 남긴 중간 결과로 이어서 실행할 수 있다.
+
+작업 함수는 Job을 받아 결과 dict를 반환한다. 실행 중에는 progress.report()로 진행 상황을
+기록하고, cancel()로 취소를 요청하면 다음 확인 지점에서 멈춘다.
+
+작업을 가진 프로세스는 프로세스마다 만든 소유자 토큰을 작업에 기록하고, 살아 있는 동안
+DEFAULT_JOBS_DIR/.owners/{토큰}.lock 파일 잠금을 유지한다. 다른 프로세스가 끝냈는지는 PID가 아니라
+이 잠금으로 판단하므로, 재부팅 후 같은 PID를 다른 프로세스가 쓰더라도 작업을 이어서 실행한다.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from . import progress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS_DIR = Path(".claude/slack-to-notion/jobs")
+# 소유자 잠금 파일 디렉토리 (작업 디렉토리 아래)
+_OWNERS_DIRNAME = ".owners"
+# 끝난 작업이 이 개수를 넘으면 오래된 것부터 삭제한다
+MAX_FINISHED_JOBS = 50
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+_JOB_ID_PATTERN = re.compile(r"^\d{8}-\d{6}-[0-9a-f]{6}$")
+
+# 이 프로세스의 소유자 토큰과 디렉토리별로 잡고 있는 잠금 파일
+_OWNER_TOKEN = secrets.token_hex(8)
+_owner_locks: dict[Path, object] = {}
+_owner_locks_lock = threading.Lock()
+
+
+class JobError(Exception):
+    """작업 조회/제어 에러."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+def _now() -> str:
+    return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+def _try_lock(fd: int) -> bool:
+    """파일 잠금을 기다리지 않고 시도한다. 다른 프로세스가 잡고 있으면 False."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _hold_owner_lock(directory: Path) -> None:
+    """이 프로세스가 directory의 작업 소유자임을 나타내는 잠금을 잡는다 (프로세스 종료 시 자동 해제)."""
+    with _owner_locks_lock:
+        if directory in _owner_locks:
+            return
+        owners_dir = directory / _OWNERS_DIRNAME
+        owners_dir.mkdir(parents=True, exist_ok=True)
+        f = open(owners_dir / f"{_OWNER_TOKEN}.lock", "a+b")
+        if not _try_lock(f.fileno()):
+            f.close()
+            raise JobError(f"작업 소유자 잠금을 잡을 수 없습니다: {owners_dir}")
+        _owner_locks[directory] = f
+
+
+def _owner_alive(directory: Path, owner: str) -> bool:
+    """owner 토큰의 프로세스가 아직 잠금을 잡고 있는지 확인한다. 끝난 프로세스의 잠금 파일은 지운다."""
+    if owner == _OWNER_TOKEN:
+        return True
+    path = directory / _OWNERS_DIRNAME / f"{owner}.lock"
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return False
+    with f:
+        if not _try_lock(f.fileno()):
+            return True
+    path.unlink(missing_ok=True)
+    return False
+
+
+def _pid_alive(pid: int) -> bool:
+    """pid 프로세스가 살아 있는지 확인한다 (소유자 토큰이 없는 이전 형식의 작업용)."""
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # Windows의 os.kill은 신호 0이어도 프로세스를 종료하므로 확인하지 않는다
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+class Job:
+    """작업 함수에 전달되는 실행 중인 작업."""
+
+    def __init__(self, manager: "JobManager", record: dict):
+        self._manager = manager
+        self._record = record
+
+    @property
+    def id(self) -> str:
+        return self._record["id"]
+
+    @property
+    def params(self) -> dict:
+        return self._record["params"]
+
+    @property
+    def state(self) -> dict:
+        """재시작 후 이어서 실행하기 위한 중간 결과."""
+        return self._record["state"]
+
+    def artifact_path(self, suffix: str) -> Path:
+        """작업 결과물 파일 경로 ({작업 ID}{suffix}). 작업을 삭제할 때 함께 삭제된다."""
+        return self._manager.directory / f"{self.id}{suffix}"
+
+    def save_state(self, stage: str | None = None, **values) -> None:
+        """중간 결과와 진행 단계를 기록한다."""
+        fields = {"stage": stage} if stage else {}
+        self._record = self._manager._update(self.id, state=values, **fields)
+
+
+class JobManager:
+    """백그라운드 작업 대기열과 상태 파일을 관리한다.
+
+    작업은 등록 순서대로 작업 스레드 하나에서 실행한다. 내보내기처럼 같은 API 속도 제한을
+    나눠 쓰는 작업은 동시에 실행해도 빨라지지 않기 때문이다.
+
+    Args:
+        directory: 작업 상태 저장 디렉토리
+    """
+
+    def __init__(self, directory: Path = DEFAULT_JOBS_DIR):
+        self.directory = directory
+        self._handlers: dict[str, Callable[[Job], dict]] = {}
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._lock = threading.Lock()
+        self._reporters: dict[str, progress.ProgressReporter] = {}
+        self._worker: threading.Thread | None = None
+
+    def register(self, kind: str, handler: Callable[[Job], dict]) -> None:
+        """작업 종류별 실행 함수를 등록한다."""
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: dict) -> dict:
+        """작업을 대기열에 넣고 작업 정보를 반환한다.
+
+        Raises:
+            JobError: 등록되지 않은 작업 종류인 경우
+        """
+        if kind not in self._handlers:
+            raise JobError(f"지원하지 않는 작업 종류입니다: {kind}")
+        job_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+        record = {
+            "id": job_id,
+            "kind": kind,
+            "status": QUEUED,
+            "stage": None,
+            "params": params,
+            "state": {},
+            "progress": None,
+            "result": None,
+            "error": None,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "pid": os.getpid(),
+            "owner": _OWNER_TOKEN,
+        }
+        with self._lock:
+            self._write(record)
+        self._enqueue(job_id)
+        return record
+
+    def get(self, job_id: str) -> dict:
+        """작업 정보를 반환한다.
+
+        Raises:
+            JobError: 작업이 없는 경우
+        """
+        if not _JOB_ID_PATTERN.match(job_id):
+            raise JobError(f"작업 ID 형식이 올바르지 않습니다: {job_id}")
+        record = self._read(self._path(job_id))
+        if record is None:
+            raise JobError(f"작업을 찾을 수 없습니다: {job_id}")
+        return record
+
+    def recent(self, limit: int = 10) -> list[dict]:
+        """최근 작업 목록을 반환한다 (최신순)."""
+        records = []
+        for path in sorted(self.directory.glob("*.json"), reverse=True):
+            record = self._read(path)
+            if record is not None:
+                records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def cancel(self, job_id: str) -> dict:
+        """작업 취소를 요청한다.
+
+        대기 중인 작업은 바로 취소하고, 실행 중인 작업은 다음 확인 지점에서 멈춘다.
+
+        Raises:
+            JobError: 작업이 없거나 이미 끝났거나 다른 프로세스에서 실행 중인 경우
+        """
+        record = self.get(job_id)
+        with self._lock:
+            record = self._read(self._path(job_id)) or record
+            if record["status"] in FINISHED_STATUSES:
+                raise JobError(f"이미 끝난 작업입니다: {job_id} ({record['status']})")
+            reporter = self._reporters.get(job_id)
+            if reporter is not None:
+                reporter.cancel()
+                return record
+            if record.get("owner") != _OWNER_TOKEN and self._owner_alive(record):
+                raise JobError(f"다른 프로세스(pid {record['pid']})에서 실행 중인 작업입니다: {job_id}")
+            record.update(status=CANCELLED, finished_at=_now(), error="작업이 취소되었습니다.")
+            self._write(record)
+            return record
+
+    def resume(self) -> list[str]:
+        """이전 프로세스가 끝내지 못한 작업을 다시 대기열에 넣는다.
+
+        Returns:
+            다시 대기열에 넣은 작업 ID 리스트 (등록 순서)
+        """
+        resumed = []
+        for path in sorted(self.directory.glob("*.json")):
+            record = self._read(path)
+            if record is None or record["status"] in FINISHED_STATUSES:
+                continue
+            if self._owner_alive(record):
+                continue
+            self._update(record["id"], status=QUEUED, pid=os.getpid(), owner=_OWNER_TOKEN)
+            self._enqueue(record["id"])
+            resumed.append(record["id"])
+        return resumed
+
+    def join(self, timeout: float | None = None) -> bool:
+        """대기열의 작업이 모두 끝날 때까지 기다린다.
+
+        Returns:
+            시간 안에 모두 끝났는지 여부
+        """
+        done = threading.Event()
+
+        def wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def _enqueue(self, job_id: str) -> None:
+        self._queue.put(job_id)
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                # 서버 종료를 막지 않도록 daemon으로 실행한다. 끝나지 않은 작업은 다음 시작 시 이어서 실행한다
+                self._worker = threading.Thread(target=self._work, name="slack-to-notion-jobs", daemon=True)
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run(job_id)
+            except Exception:
+                logger.exception("작업 %s 실행 중 예상치 못한 에러 발생", job_id)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str) -> None:
+        def send(value: float, total: float | None, message: str | None) -> None:
+            self._update(job_id, progress={"progress": value, "total": total, "message": message})
+
+        reporter = progress.ProgressReporter(send)
+        with self._lock:
+            # 대기 중에 취소된 작업은 실행하지 않는다
+            record = self._read(self._path(job_id))
+            if record is None or record["status"] != QUEUED:
+                return
+            self._reporters[job_id] = reporter
+            record.update(status=RUNNING, started_at=_now())
+            self._write(record)
+
+        handler = self._handlers.get(record["kind"])
+        if handler is None:
+            with self._lock:
+                self._reporters.pop(job_id, None)
+            self._update(job_id, status=FAILED, finished_at=_now(), error=f"지원하지 않는 작업 종류입니다: {record['kind']}")
+            return
+
+        logger.info("작업 %s (%s) 시작", job_id, record["kind"])
+        try:
+            with progress.use(reporter):
+                result = handler(Job(self, record))
+        except progress.OperationCancelled as e:
+            self._update(job_id, status=CANCELLED, finished_at=_now(), error=e.message)
+            logger.info("작업 %s 취소", job_id)
+        except Exception as e:
+            message = getattr(e, "message", None) or str(e)
+            self._update(job_id, status=FAILED, finished_at=_now(), error=message)
+            logger.warning("작업 %s 실패: %s", job_id, message)
+        else:
+            self._update(job_id, status=SUCCEEDED, finished_at=_now(), result=result)
+            logger.info("작업 %s 완료", job_id)
+        finally:
+            with self._lock:
+                self._reporters.pop(job_id, None)
+            self._prune()
+
+    def _update(self, job_id: str, state: dict | None = None, **fields) -> dict:
+        """작업 정보 일부를 갱신하고 저장한다."""
+        with self._lock:
+            record = self._read(self._path(job_id))
+            if record is None:
+                raise JobError(f"작업을 찾을 수 없습니다: {job_id}")
+            record.update(fields)
+            if state:
+                record["state"].update(state)
+            self._write(record)
+            return record
+
+    def _owner_alive(self, record: dict) -> bool:
+        """작업을 가진 프로세스(이 프로세스 포함)가 살아 있는지 확인한다."""
+        owner = record.get("owner")
+        if owner is None:
+            # 이전 형식: 이 프로세스가 만든 작업이 아니므로 PID만으로 판단한다
+            return record["pid"] != os.getpid() and _pid_alive(record["pid"])
+        return _owner_alive(self.directory, owner)
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def _read(self, path: Path) -> dict | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, record: dict) -> None:
+        path = self._path(record["id"])
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _hold_owner_lock(self.directory)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _prune(self) -> None:
+        """MAX_FINISHED_JOBS개를 넘는 오래된 끝난 작업과 결과물을 삭제한다."""
+        # 같은 초에 만든 작업은 ID 순서가 생성 순서와 다를 수 있으므로 마지막으로 기록된 시각 순으로 정렬한다
+        paths = []
+        for path in self.directory.glob("*.json"):
+            try:
+                paths.append((path.stat().st_mtime_ns, path.name, path))
+            except FileNotFoundError:
+                # 다른 프로세스의 정리에서 이미 삭제된 파일
+                continue
+        paths.sort()
+        finished = [
+            record["id"]
+            for _, _, path in paths
+            if (record := self._read(path)) is not None and record["status"] in FINISHED_STATUSES
+        ]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            for path in self.directory.glob(f"{job_id}*"):
+                path.unlink(missing_ok=True)
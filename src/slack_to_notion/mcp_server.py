@@ -3,27 +3,58 @@
 FastMCP를 사용하여 Slack 수집 → 분석 → Notion 생성 기능을 MCP 도구로 제공한다.
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import logging
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import InitializedNotification
 
+from . import profiling, progress, tracing
 from .analyzer import (
-    ANALYSIS_GUIDE_EXAMPLES,
+    COMPRESSION_SUFFIXES,
+    apply_history_retention,
+    format_channels_for_analysis,
     format_messages_for_analysis,
+    format_search_results,
     format_threads_for_analysis,
     get_analysis_guide,
     list_history,
+    load_history_result,
     load_preferences,
+    prune_history_archive,
+    rebuild_history_index,
     save_preference,
     save_result,
+    search_history_index,
 )
-from .notion_client import NotionClient, NotionClientError, extract_page_id
-from .slack_client import SlackClient, SlackClientError
+from .clients import get_notion_client, get_slack_client
+from .metrics import metrics
+from .errors import NotionClientError, SlackClientError
+from .export import (
+    DEFAULT_EXPORT_LIMIT,
+    MAX_EXPORT_LIMIT,
+    collect_channels,
+    default_title,
+    notion_parent_page_id,
+    upload_page,
+)
+from .jobs import CANCELLED, FAILED, SUCCEEDED, Job, JobError, JobManager
+from .timerange import resolve_time_range
+
+# slack_sdk/notion_client는 불러오는 데 시간이 걸리므로 첫 클라이언트 생성 시점(clients)에 import한다.
+# 서버 시작과 도구 목록 응답(initialize/list_tools)은 SDK 없이 처리된다.
+if TYPE_CHECKING:
+    from .slack_client import SlackClient
 
 # stdout은 MCP 프로토콜용이므로 로깅은 stderr로
 logging.basicConfig(
@@ -36,53 +67,109 @@ logger = logging.getLogger(__name__)
 # MCP 서버 인스턴스
 mcp = FastMCP("slack-to-notion")
 
-# 클라이언트 인스턴스 (lazy init)
-_slack_client: SlackClient | None = None
-_notion_client: NotionClient | None = None
+# 작업 관리자 인스턴스 (lazy init)
+_job_manager: JobManager | None = None
+_job_manager_lock = threading.Lock()
+
+# 히스토리 보존 정책 (save_analysis_result 후 백그라운드에서 적용)
+_HISTORY_RETENTION_ENV = (
+    "SLACK_TO_NOTION_HISTORY_MAX_AGE_DAYS",
+    "SLACK_TO_NOTION_HISTORY_MAX_COUNT",
+    "SLACK_TO_NOTION_HISTORY_MAX_BYTES",
+    "SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_AGE_DAYS",
+    "SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_BYTES",
+)
+_retention_thread: threading.Thread | None = None
+_retention_pending = False
+_retention_lock = threading.Lock()
+
+_PARENT_PAGE_MISSING = "[에러] NOTION_PARENT_PAGE_URL 환경변수가 설정되지 않았습니다. Notion 페이지 링크를 입력하세요."
 
+# 서버 시작 시 클라이언트/캐시를 미리 준비할지 여부 (1, true, yes, on)
+WARMUP_ENV = "SLACK_TO_NOTION_WARMUP"
+_warm_up_started = False
 
-def _get_slack_client() -> SlackClient:
-    """SlackClient 인스턴스를 반환한다. 없으면 초기화.
 
-    봇 토큰(SLACK_BOT_TOKEN)을 우선 사용하고, 없으면 사용자 토큰(SLACK_USER_TOKEN)을 사용한다.
+def _tool():
+    """동기 도구 함수를 MCP 도구로 등록한다.
+
+    FastMCP는 동기 도구를 이벤트 루프에서 직접 실행해 다른 요청을 막으므로,
+    작업 스레드에서 실행하는 비동기 래퍼를 등록한다. 동시에 호출된 도구가
+    실제로 병렬 실행되어 SlackClient의 동일 요청 병합과 속도 제한이 효과를 낸다.
+    실행 시간은 "tool.<이름>" 구간으로 기록하고 stderr에 남기며, 트레이싱이 켜져 있으면 span을 만든다.
+    프로파일링 대상 도구이면 실행을 cProfile로 측정한다.
+    FastMCP Context를 받아 progress.report()를 MCP 진행 알림으로 전달하고,
+    클라이언트가 요청을 취소하면 작업 스레드가 다음 확인 지점에서 멈추도록 취소를 요청한다.
+    모듈에는 동기 함수를 남겨 직접 호출할 수 있다.
     """
-    global _slack_client
-    if _slack_client is None:
-        # 봇 토큰 우선, 없으면 사용자 토큰
-        token = os.environ.get("SLACK_BOT_TOKEN") or os.environ.get("SLACK_USER_TOKEN")
-        if not token:
-            raise RuntimeError(
-                "SLACK_BOT_TOKEN 또는 SLACK_USER_TOKEN 환경변수가 설정되지 않았습니다. "
-                "Claude Desktop: 설정 파일(claude_desktop_config.json)의 env 섹션을 확인하세요. "
-                "Claude Code CLI: claude mcp add 명령의 -e 옵션을 확인하세요."
-            )
-        # 접두사로 토큰 타입 판별
-        token_type = "user" if token.startswith("xoxp-") else "bot"
-        # 토큰 접두사 로깅 (디버깅용, 값 노출 방지)
-        token_prefix = token[:10] if len(token) > 10 else token[:4]
-        logger.info(
-            "SlackClient 초기화 (token_type=%s, prefix=%s..., len=%d)",
-            token_type, token_prefix, len(token),
-        )
-        _slack_client = SlackClient(token, token_type)
-    return _slack_client
-
-
-def _get_notion_client() -> NotionClient:
-    """NotionClient 인스턴스를 반환한다. 없으면 초기화."""
-    global _notion_client
-    if _notion_client is None:
-        api_key = os.environ.get("NOTION_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                "NOTION_API_KEY 환경변수가 설정되지 않았습니다. "
-                "Claude Desktop: 설정 파일(claude_desktop_config.json)의 env 섹션을 확인하세요. "
-                "Claude Code CLI: claude mcp add 명령의 -e 옵션을 확인하세요."
-            )
-        key_prefix = api_key[:10] if len(api_key) > 10 else api_key[:4]
-        logger.info("NotionClient 초기화 (prefix=%s..., len=%d)", key_prefix, len(api_key))
-        _notion_client = NotionClient(api_key)
-    return _notion_client
+    def decorator(func):
+        span_name = f"tool.{func.__name__}"
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            error = True
+            try:
+                with (
+                    tracing.span(span_name, {"mcp.tool": func.__name__}) as span,
+                    profiling.profile(func.__name__, args, kwargs),
+                ):
+                    result = func(*args, **kwargs)
+                    error = isinstance(result, str) and result.startswith("[에러]")
+                    if error:
+                        span.set_error(result)
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                metrics.record_span(span_name, elapsed, error)
+                logger.info("도구 %s %s (%.0fms)", func.__name__, "실패" if error else "완료", elapsed * 1000)
+
+        @functools.wraps(timed)
+        async def run_in_thread(*args, ctx: Context | None = None, **kwargs):
+            reporter = progress.ProgressReporter(_progress_sender(ctx) if ctx is not None else None)
+            # to_thread는 contextvars를 복사하므로 작업 스레드에서 progress.current()로 조회된다
+            with progress.use(reporter):
+                try:
+                    return await asyncio.to_thread(timed, *args, **kwargs)
+                except asyncio.CancelledError:
+                    reporter.cancel()
+                    raise
+
+        # FastMCP는 Context 타입 인자를 찾아 주입하고 입력 스키마에서는 제외한다
+        signature = inspect.signature(func)
+        run_in_thread.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("ctx", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Context),
+        ])
+        run_in_thread.__annotations__ = {**func.__annotations__, "ctx": Context}
+
+        mcp.tool()(run_in_thread)
+        return timed
+
+    return decorator
+
+
+def _progress_sender(ctx: Context):
+    """작업 스레드에서 호출해 ctx로 MCP 진행 알림을 보내는 함수를 반환한다.
+
+    요청에 progressToken이 없으면 ctx.report_progress가 아무 일도 하지 않는다.
+    """
+    loop = asyncio.get_running_loop()
+
+    def send(value: float, total: float | None, message: str | None) -> None:
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(value, total, message), loop)
+
+    return send
+
+
+def _get_job_manager() -> JobManager:
+    """백그라운드 작업 관리자를 반환한다. 없으면 초기화."""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+            _job_manager.register("export", _run_export_job)
+    return _job_manager
 
 
 # ──────────────────────────────────────────────
@@ -90,17 +177,23 @@ def _get_notion_client() -> NotionClient:
 # ──────────────────────────────────────────────
 
 
-@mcp.tool()
-def list_channels() -> str:
+@_tool()
+def list_channels(refresh: bool = False) -> str:
     """Slack 채널 목록을 조회한다.
 
+    채널 목록은 캐시되며, 새로 만든 채널이 보이지 않을 때만 refresh=True로 호출한다.
+    채널 이름을 알고 있다면 find_channel을 사용한다.
+
+    Args:
+        refresh: True이면 캐시를 무시하고 다시 조회 (기본값: False)
+
     Returns:
         채널 정보 리스트를 JSON 형식 문자열로 반환
         [{"id": "C123", "name": "general", "topic": "...", "num_members": 10}]
     """
     try:
-        client = _get_slack_client()
-        channels = client.list_channels()
+        client = get_slack_client()
+        channels = client.list_channels(refresh=refresh)
         return json.dumps(channels, ensure_ascii=False)
     except SlackClientError as e:
         return f"[에러] {e.message}"
@@ -109,26 +202,95 @@ def list_channels() -> str:
         return f"[에러] 채널 목록 조회 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
+def find_channel(name: str) -> str:
+    """채널 이름으로 채널 ID와 정보를 조회한다.
+
+    전체 채널 목록을 받지 않고 이름 하나로 채널을 찾을 때 사용한다.
+
+    Args:
+        name: 채널 이름 (예: "general" 또는 "#general")
+
+    Returns:
+        채널 정보를 JSON 형식 문자열로 반환
+        {"id": "C123", "name": "general", "topic": "...", "num_members": 10}
+    """
+    try:
+        client = get_slack_client()
+        channel = client.find_channel(name)
+        if channel is None:
+            return f"[안내] '{name}' 채널을 찾을 수 없습니다. 채널 이름을 확인하세요."
+        return json.dumps(channel, ensure_ascii=False)
+    except SlackClientError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 채널 조회 실패: {e!s}"
+
+
+@_tool()
+def search_channels(query: str, limit: int = 10) -> str:
+    """채널 이름이나 주제로 채널을 검색한다.
+
+    정확한 채널 이름을 모를 때 list_channels 대신 사용한다.
+    오타나 일부 단어만으로도 검색되며, 관련도가 높은 채널만 반환한다.
+
+    Args:
+        query: 검색어 (예: "백엔드 배포", "dev-back")
+        limit: 반환할 최대 건수 (기본값: 10, 최대 50)
+
+    Returns:
+        채널 정보 리스트를 JSON 형식 문자열로 반환 (관련도 순)
+        [{"id": "C123", "name": "dev-backend", "topic": "...", "num_members": 10, "score": 1.2}]
+    """
+    try:
+        client = get_slack_client()
+        limit = max(1, min(limit, 50))
+        channels = client.search_channels(query, limit)
+        if not channels:
+            return f"[안내] '{query}'와 일치하는 채널이 없습니다."
+        return json.dumps(channels, ensure_ascii=False)
+    except SlackClientError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 채널 검색 실패: {e!s}"
+
+
+@_tool()
 def fetch_messages(
     channel_id: str,
     limit: int = 100,
     oldest: str | None = None,
+    since: str = "",
+    until: str = "",
+    timezone: str = "",
 ) -> str:
     """Slack 채널의 메시지를 조회한다.
 
+    "지난주 메시지"처럼 기간이 정해진 요청은 since/until을 사용하면
+    기간 밖 메시지를 받지 않고 필요한 페이지만 조회한다.
+
     Args:
         channel_id: 채널 ID (예: C0123456789)
-        limit: 조회할 메시지 수 (기본값: 100)
-        oldest: 시작 타임스탬프 (해당 시점 이후 메시지만 조회)
+        limit: 조회할 최대 메시지 수 (기본값: 100)
+        oldest: 시작 타임스탬프 (since를 지정하면 무시)
+        since: 시작 시점 (예: 2026-02-09, 2026-02-09 09:00, 7d)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: since/until 해석 시간대 (예: Asia/Seoul, 미지정 시 시스템 시간대)
 
     Returns:
         메시지 리스트를 JSON 형식 문자열로 반환
     """
     try:
-        client = _get_slack_client()
+        since_ts, latest = resolve_time_range(since, until, timezone)
+    except ValueError as e:
+        return f"[에러] {e}"
+
+    try:
+        client = get_slack_client()
         limit = max(1, min(limit, 1000))
-        messages = client.fetch_channel_messages(channel_id, limit, oldest)
+        messages = client.fetch_channel_messages(channel_id, limit, since_ts or oldest, latest)
         client.resolve_user_names(messages)
         filtered = [
             {k: m[k] for k in ("ts", "user", "user_name", "text", "reply_count", "thread_ts") if k in m}
@@ -137,12 +299,14 @@ def fetch_messages(
         return json.dumps(filtered, ensure_ascii=False)
     except SlackClientError as e:
         return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
     except Exception as e:
         logger.exception("예상치 못한 에러 발생")
         return f"[에러] 메시지 조회 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def fetch_thread(channel_id: str, thread_ts: str) -> str:
     """Slack 스레드의 메시지를 조회한다.
 
@@ -154,7 +318,7 @@ def fetch_thread(channel_id: str, thread_ts: str) -> str:
         스레드 메시지 리스트를 JSON 형식 문자열로 반환
     """
     try:
-        client = _get_slack_client()
+        client = get_slack_client()
         messages = client.fetch_thread_replies(channel_id, thread_ts)
         client.resolve_user_names(messages)
         filtered = [
@@ -169,7 +333,7 @@ def fetch_thread(channel_id: str, thread_ts: str) -> str:
         return f"[에러] 스레드 조회 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def fetch_threads(
     channel_id: str,
     thread_ts_list: list[str],
@@ -189,11 +353,12 @@ def fetch_threads(
         AI 분석용으로 포맷팅된 복수 스레드 메시지 텍스트
     """
     try:
-        client = _get_slack_client()
+        client = get_slack_client()
         display_name = channel_name or channel_id
 
         threads = []
-        for thread_ts in thread_ts_list:
+        for done, thread_ts in enumerate(thread_ts_list):
+            progress.report(done, len(thread_ts_list), f"스레드 {done}/{len(thread_ts_list)}개 수집")
             try:
                 messages = client.fetch_thread_replies(channel_id, thread_ts)
                 client.resolve_user_names(messages)
@@ -203,17 +368,20 @@ def fetch_threads(
                     "thread_ts": thread_ts,
                     "messages": [{"text": f"[수집 실패] {e.message}", "user": "system", "ts": thread_ts}],
                 })
+        progress.report(len(thread_ts_list), len(thread_ts_list), f"스레드 {len(thread_ts_list)}개 수집 완료")
 
         return format_threads_for_analysis(threads, display_name)
 
     except SlackClientError as e:
         return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
     except Exception as e:
         logger.exception("예상치 못한 에러 발생")
         return f"[에러] 스레드 수집 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def check_active_users() -> str:
     """워크스페이스에서 현재 활성(온라인) 상태인 사용자 목록을 조회한다.
 
@@ -224,29 +392,35 @@ def check_active_users() -> str:
         [{"id": "U123", "name": "홍길동", "real_name": "홍길동", "presence": "active"}]
     """
     try:
-        client = _get_slack_client()
+        client = get_slack_client()
         active_users = client.get_active_users()
         return json.dumps(active_users, ensure_ascii=False)
     except SlackClientError as e:
         return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
     except Exception as e:
         logger.exception("예상치 못한 에러 발생")
         return f"[에러] 활성 사용자 조회 실패: {e!s}"
 
 
-@mcp.tool()
-def fetch_channel_info(channel_id: str) -> str:
+@_tool()
+def fetch_channel_info(channel_id: str, refresh: bool = False) -> str:
     """Slack 채널의 상세 정보를 조회한다.
 
+    채널 정보는 캐시되며, 채널 이름만 필요하다면 format_messages에서 channel_name을
+    생략하면 자동으로 채워지므로 이 도구를 따로 호출하지 않아도 된다.
+
     Args:
         channel_id: 채널 ID (예: C0123456789)
+        refresh: True이면 캐시를 무시하고 다시 조회
 
     Returns:
         채널 정보를 JSON 형식 문자열로 반환
     """
     try:
-        client = _get_slack_client()
-        info = client.fetch_channel_info(channel_id)
+        client = get_slack_client()
+        info = client.fetch_channel_info(channel_id, refresh=refresh)
         filtered = {k: info[k] for k in ("id", "name", "topic", "purpose", "num_members", "is_private") if k in info}
         return json.dumps(filtered, ensure_ascii=False)
     except SlackClientError as e:
@@ -256,12 +430,77 @@ def fetch_channel_info(channel_id: str) -> str:
         return f"[에러] 채널 정보 조회 실패: {e!s}"
 
 
+@_tool()
+def search_messages(
+    query: str = "",
+    channel_id: str = "",
+    user: str = "",
+    since: str = "",
+    until: str = "",
+    limit: int = 20,
+    timezone: str = "",
+) -> str:
+    """이전에 수집한 Slack 메시지를 로컬 인덱스에서 검색한다.
+
+    fetch_messages, fetch_thread, fetch_threads, format_messages로 수집한 메시지가 검색 대상이며,
+    SLACK_TO_NOTION_MESSAGE_STORE 환경변수로 로컬 저장을 켠 경우에만 사용할 수 있다.
+    채널 전체를 다시 수집하지 않고 특정 내용을 찾을 때 사용한다.
+
+    Args:
+        query: 검색어 (공백으로 구분한 단어를 모두 포함하는 메시지 검색)
+        channel_id: 채널 ID 필터 (예: C0123456789)
+        user: 작성자 ID 또는 표시 이름 필터
+        since: 시작 시점 (예: 2026-02-09, 2026-02-09 09:00, 7d)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: since/until 해석 시간대 (예: Asia/Seoul, 미지정 시 시스템 시간대)
+        limit: 반환할 최대 건수 (기본값: 20, 최대 200)
+
+    Returns:
+        검색 결과를 AI 분석용으로 포맷팅한 텍스트
+    """
+    try:
+        since_ts, until_ts = resolve_time_range(since, until, timezone)
+    except ValueError as e:
+        return f"[에러] {e}"
+    oldest = float(since_ts) if since_ts else None
+    # 로컬 검색의 latest는 경계를 포함하므로 종료 시점 직전까지로 맞춘다
+    latest = float(until_ts) - 0.000001 if until_ts else None
+
+    try:
+        client = get_slack_client()
+        if client.message_store is None:
+            return (
+                "[안내] 수집 메시지 로컬 저장이 꺼져 있어 검색할 수 없습니다. "
+                "SLACK_TO_NOTION_MESSAGE_STORE=1 환경변수로 켜면 이후 수집하는 메시지부터 검색할 수 있습니다."
+            )
+        limit = max(1, min(limit, 200))
+        messages = client.search_messages(
+            query, channel_id or None, user or None, oldest, latest, limit,
+        )
+        if not messages:
+            return (
+                "[안내] 검색 결과가 없습니다. 로컬 검색은 이전에 수집한 메시지만 대상으로 하므로, "
+                "필요하면 fetch_messages 또는 format_messages로 먼저 수집하세요."
+            )
+        channel_names = {}
+        for msg in messages:
+            cid = msg["channel_id"]
+            if cid not in channel_names:
+                channel_names[cid] = client.get_cached_channel_name(cid) or cid
+        return format_search_results(messages, query, channel_names)
+    except SlackClientError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 메시지 검색 실패: {e!s}"
+
+
 # ──────────────────────────────────────────────
 # 분석 도구
 # ──────────────────────────────────────────────
 
 
-@mcp.tool()
+@_tool()
 def get_analysis_guide_tool() -> str:
     """분석 방향 안내를 반환한다.
 
@@ -274,44 +513,156 @@ def get_analysis_guide_tool() -> str:
     return get_analysis_guide()
 
 
-@mcp.tool()
+@_tool()
 def format_messages(
     channel_id: str,
-    channel_name: str,
+    channel_name: str = "",
     limit: int = 100,
     oldest: str | None = None,
+    since: str = "",
+    until: str = "",
+    timezone: str = "",
+    expand_threads: bool = False,
+    min_replies: int = 1,
+    max_replies: int = 200,
 ) -> str:
     """Slack 채널 메시지를 수집하고 AI 분석용 텍스트로 포맷팅한다.
 
     메시지 수집과 포맷팅을 한 번에 수행한다.
+    expand_threads를 켜면 스레드 답글도 함께 수집해 부모 메시지 아래에 펼쳐 보여주므로
+    fetch_thread를 따로 호출하지 않아도 된다.
 
     Args:
         channel_id: 채널 ID (예: C0123456789)
-        channel_name: 채널 이름 (포맷팅 헤더에 표시)
-        limit: 조회할 메시지 수 (기본값: 100)
-        oldest: 시작 타임스탬프 (해당 시점 이후 메시지만 조회)
+        channel_name: 채널 이름 (포맷팅 헤더에 표시, 생략하면 캐시된 채널 정보로 자동 입력)
+        limit: 조회할 최대 메시지 수 (기본값: 100)
+        oldest: 시작 타임스탬프 (since를 지정하면 무시)
+        since: 시작 시점 (예: 2026-02-09, 2026-02-09 09:00, 7d)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: since/until 해석 시간대 (예: Asia/Seoul, 미지정 시 시스템 시간대)
+        expand_threads: 스레드 답글을 펼쳐서 포함할지 여부 (기본값: False)
+        min_replies: 펼칠 스레드의 최소 답글 수 (기본값: 1)
+        max_replies: 전체 스레드에서 포함할 최대 답글 수 (기본값: 200, 답글이 많은 스레드부터 배정)
 
     Returns:
         AI 분석용으로 포맷팅된 메시지 텍스트
     """
     try:
-        client = _get_slack_client()
-        messages = client.fetch_channel_messages(channel_id, limit, oldest)
-        client.resolve_user_names(messages)
-        return format_messages_for_analysis(messages, channel_name)
+        since_ts, latest = resolve_time_range(since, until, timezone)
+    except ValueError as e:
+        return f"[에러] {e}"
+
+    try:
+        client = get_slack_client()
+        messages = client.fetch_channel_messages(channel_id, limit, since_ts or oldest, latest)
+        thread_replies = None
+        if expand_threads:
+            from .slack_client import DEFAULT_MAX_WORKERS
+
+            thread_replies = _expand_threads(client, channel_id, messages, min_replies, max_replies)
+            replies = [reply for items in thread_replies.values() for reply in items]
+            client.resolve_user_names(messages + replies, max_workers=DEFAULT_MAX_WORKERS)
+        else:
+            client.resolve_user_names(messages)
+        channel_name = channel_name or client.get_channel_name(channel_id)
+        return format_messages_for_analysis(messages, channel_name, thread_replies)
     except SlackClientError as e:
         return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
     except Exception as e:
         logger.exception("예상치 못한 에러 발생")
         return f"[에러] 메시지 포맷팅 실패: {e!s}"
 
 
+def _expand_threads(
+    client: "SlackClient",
+    channel_id: str,
+    messages: list[dict],
+    min_replies: int,
+    max_replies: int,
+) -> dict[str, list[dict]]:
+    """답글 수 기준을 넘는 스레드의 답글을 동시에 수집한다.
+
+    답글 예산(max_replies)은 답글이 많은 스레드부터 배정하며,
+    수집에 실패한 스레드는 펼치지 않고 답글 수 표시만 남긴다.
+
+    Returns:
+        {thread_ts: 답글 리스트 (부모 메시지 제외)}
+    """
+    candidates = sorted(
+        (m for m in messages if m.get("reply_count", 0) >= max(1, min_replies)),
+        key=lambda m: -m["reply_count"],
+    )
+    allotment: dict[str, int] = {}
+    budget = max(0, max_replies)
+    for msg in candidates:
+        if budget <= 0:
+            break
+        allotment[msg["ts"]] = min(msg["reply_count"], budget)
+        budget -= allotment[msg["ts"]]
+
+    parents = [m for m in candidates if m["ts"] in allotment]
+    thread_replies = {}
+    for thread_ts, result in client.fetch_threads_replies(channel_id, parents).items():
+        if isinstance(result, SlackClientError):
+            logger.warning("스레드 답글 수집 실패 (%s): %s", thread_ts, result.message)
+            continue
+        replies = [reply for reply in result if reply.get("ts") != thread_ts]
+        thread_replies[thread_ts] = replies[: allotment[thread_ts]]
+    return thread_replies
+
+
+@_tool()
+def format_channels(
+    channels: list[str],
+    limit: int = 100,
+    since: str = "",
+    until: str = "",
+    timezone: str = "",
+) -> str:
+    """여러 Slack 채널의 메시지를 동시에 수집하고 채널별로 묶어 AI 분석용 텍스트로 포맷팅한다.
+
+    팀의 한 주를 요약하는 것처럼 여러 채널을 함께 정리할 때 채널마다
+    format_messages를 호출하는 대신 사용한다. 작성자 이름은 채널 전체에서 한 번만 조회한다.
+
+    Args:
+        channels: 채널 ID 또는 이름 리스트 (예: ["C0123456789", "#dev-backend"])
+        limit: 채널별 조회할 최대 메시지 수 (기본값: 100, 최대 1000)
+        since: 시작 시점 (예: 2026-02-09, 2026-02-09 09:00, 7d)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: since/until 해석 시간대 (예: Asia/Seoul, 미지정 시 시스템 시간대)
+
+    Returns:
+        채널별 섹션으로 구성된 AI 분석용 텍스트
+    """
+    if not channels:
+        return "[에러] 수집할 채널을 하나 이상 지정하세요."
+    try:
+        oldest, latest = resolve_time_range(since, until, timezone)
+    except ValueError as e:
+        return f"[에러] {e}"
+
+    try:
+        client = get_slack_client()
+        limit = max(1, min(limit, 1000))
+        targets = collect_channels(client, channels, limit, oldest, latest)
+        return format_channels_for_analysis(targets)
+    except SlackClientError as e:
+        return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 채널 메시지 포맷팅 실패: {e!s}"
+
+
 # ──────────────────────────────────────────────
 # Notion 도구
 # ──────────────────────────────────────────────
 
 
-@mcp.tool()
+@_tool()
 def create_notion_page(
     title: str,
     content: str,
@@ -329,13 +680,10 @@ def create_notion_page(
         생성된 Notion 페이지 URL 또는 에러 메시지
     """
     try:
-        client = _get_notion_client()
-        raw_page_id = os.environ.get(
-            "NOTION_PARENT_PAGE_URL", os.environ.get("NOTION_PARENT_PAGE_ID")
-        )
-        if not raw_page_id:
-            return "[에러] NOTION_PARENT_PAGE_URL 환경변수가 설정되지 않았습니다. Notion 페이지 링크를 입력하세요."
-        parent_page_id = extract_page_id(raw_page_id)
+        client = get_notion_client()
+        parent_page_id = notion_parent_page_id()
+        if not parent_page_id:
+            return _PARENT_PAGE_MISSING
 
         # 중복 체크
         if client.check_duplicate(parent_page_id, title):
@@ -351,12 +699,14 @@ def create_notion_page(
 
     except NotionClientError as e:
         return f"[에러] {e.message}"
+    except progress.OperationCancelled as e:
+        return f"[안내] {e.message}"
     except Exception as e:
         logger.exception("예상치 못한 에러 발생")
         return f"[에러] Notion 페이지 생성 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def save_analysis_result(data_json: str, filename: str = "") -> str:
     """분석 결과를 로컬 JSON 파일로 백업한다.
 
@@ -376,8 +726,24 @@ def save_analysis_result(data_json: str, filename: str = "") -> str:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"analysis_{timestamp}.json"
 
+        # 히스토리 압축 형식 (gzip 또는 zstd, 미설정 시 비압축)
+        compression = os.environ.get("SLACK_TO_NOTION_HISTORY_COMPRESSION", "").strip().lower() or None
+        if compression in ("none", "off"):
+            compression = None
+        if compression is not None:
+            if compression not in COMPRESSION_SUFFIXES:
+                return (
+                    f"[에러] SLACK_TO_NOTION_HISTORY_COMPRESSION 값이 올바르지 않습니다: {compression} "
+                    "(gzip, zstd, none 중 하나)"
+                )
+            suffix = COMPRESSION_SUFFIXES[compression]
+            if not filename.endswith(suffix):
+                filename += suffix
+
         save_dir = Path(".claude/slack-to-notion/history")
-        path = save_result(data, save_dir / filename)
+        path = save_result(data, save_dir / filename, compression)
+        # 보존 정책은 이전 결과를 읽고 압축하므로 응답을 늦추지 않도록 백그라운드에서 적용한다
+        _schedule_history_retention(save_dir)
         return f"분석 결과가 저장되었습니다: {path}"
 
     except json.JSONDecodeError:
@@ -387,33 +753,120 @@ def save_analysis_result(data_json: str, filename: str = "") -> str:
         return f"[에러] 저장 실패: {e!s}"
 
 
+def _env_number(name: str) -> float | None:
+    """숫자 환경변수를 읽는다. 미설정이거나 0 이하, 숫자가 아니면 None."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("%s 값이 숫자가 아니어서 무시합니다: %s", name, raw)
+        return None
+    return value if value > 0 else None
+
+
+def _apply_history_retention(history_dir: Path) -> None:
+    """환경변수의 보존 한도에 따라 히스토리를 정리한다. 실패해도 로그만 남긴다.
+
+    SLACK_TO_NOTION_HISTORY_MAX_AGE_DAYS, SLACK_TO_NOTION_HISTORY_MAX_COUNT,
+    SLACK_TO_NOTION_HISTORY_MAX_BYTES를 넘은 결과는 보관 세그먼트로 압축하고,
+    SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_AGE_DAYS, SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_BYTES를 넘은
+    보관 세그먼트는 삭제한다.
+    """
+    max_age_days = _env_number("SLACK_TO_NOTION_HISTORY_MAX_AGE_DAYS")
+    max_count = _env_number("SLACK_TO_NOTION_HISTORY_MAX_COUNT")
+    max_bytes = _env_number("SLACK_TO_NOTION_HISTORY_MAX_BYTES")
+    archive_max_age_days = _env_number("SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_AGE_DAYS")
+    archive_max_bytes = _env_number("SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_BYTES")
+    try:
+        if max_age_days or max_count or max_bytes:
+            archived = apply_history_retention(
+                history_dir,
+                max_age_days=max_age_days,
+                max_count=int(max_count) if max_count else None,
+                max_bytes=int(max_bytes) if max_bytes else None,
+            )
+            if archived:
+                logger.info("보존 한도를 넘은 이전 분석 결과 %d건을 보관 파일로 압축했습니다", len(archived))
+        if archive_max_age_days or archive_max_bytes:
+            deleted = prune_history_archive(
+                history_dir,
+                max_age_days=archive_max_age_days,
+                max_bytes=int(archive_max_bytes) if archive_max_bytes else None,
+            )
+            if deleted:
+                logger.info("보관 한도를 넘은 분석 결과 %d건을 삭제했습니다", len(deleted))
+    except Exception:
+        logger.exception("히스토리 보존 정책 적용 실패")
+
+
+def _history_retention_enabled() -> bool:
+    return any(_env_number(name) for name in _HISTORY_RETENTION_ENV)
+
+
+def _schedule_history_retention(history_dir: Path) -> threading.Thread | None:
+    """보존 한도가 설정되어 있으면 백그라운드 스레드에서 히스토리를 정리한다.
+
+    정리 중에 다시 저장되면 진행 중인 정리가 끝난 뒤 한 번 더 실행한다.
+
+    Returns:
+        새로 시작한 스레드 (이미 실행 중이거나 한도가 없으면 None)
+    """
+    global _retention_thread, _retention_pending
+    if not _history_retention_enabled():
+        return None
+    with _retention_lock:
+        if _retention_thread is not None:
+            _retention_pending = True
+            return None
+        _retention_thread = threading.Thread(
+            target=_run_history_retention, args=(history_dir,), name="slack-to-notion-retention", daemon=True,
+        )
+        _retention_thread.start()
+        return _retention_thread
+
+
+def _run_history_retention(history_dir: Path) -> None:
+    global _retention_thread, _retention_pending
+    while True:
+        _apply_history_retention(history_dir)
+        with _retention_lock:
+            if not _retention_pending:
+                _retention_thread = None
+                return
+            _retention_pending = False
+
+
 # ──────────────────────────────────────────────
 # 커스터마이징 도구
 # ──────────────────────────────────────────────
 
 
-@mcp.tool()
-def save_preference_tool(text: str) -> str:
+@_tool()
+def save_preference_tool(text: str, key: str = "") -> str:
     """사용자의 분석 선호도를 저장한다.
 
     사용자가 "기억해줘", "앞으로 ~해줘", "다음에는 ~방식으로" 등
     분석 방향에 대한 선호를 표현할 때 호출한다.
+    이전 선호도를 바꾸는 경우("이제는 ~로 해줘") 같은 key를 지정하면 이전 항목이 대체된다.
 
     Args:
         text: 저장할 선호도 (예: "회의록은 결정사항 위주로 정리해줘")
+        key: 선호도 주제 (예: "회의록", "말투"). 같은 주제의 이전 선호도를 대체한다.
 
     Returns:
         저장 결과 메시지
     """
     try:
-        path = save_preference(text)
+        save_preference(text, key=key)
         return f"선호도가 저장되었습니다: {text}"
     except Exception as e:
         logger.exception("선호도 저장 실패")
         return f"[에러] 선호도 저장 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def get_preferences() -> str:
     """저장된 분석 선호도를 조회한다.
 
@@ -433,7 +886,7 @@ def get_preferences() -> str:
         return f"[에러] 선호도 조회 실패: {e!s}"
 
 
-@mcp.tool()
+@_tool()
 def list_analysis_history(limit: int = 10) -> str:
     """과거 분석 결과 히스토리를 조회한다.
 
@@ -454,13 +907,362 @@ def list_analysis_history(limit: int = 10) -> str:
         lines = [f"최근 분석 히스토리 ({len(history)}건):"]
         for i, item in enumerate(history, 1):
             summary = item["summary"] or "(요약 없음)"
-            lines.append(f"  {i}. {item['filename']} - {summary}")
+            archived = " (보관됨)" if item.get("archived") else ""
+            lines.append(f"  {i}. {item['filename']} - {summary}{archived}")
         return "\n".join(lines)
     except Exception as e:
         logger.exception("히스토리 조회 실패")
         return f"[에러] 히스토리 조회 실패: {e!s}"
 
 
+@_tool()
+def search_history(query: str, limit: int = 5) -> str:
+    """과거 분석 결과를 검색어로 찾는다.
+
+    사용자가 "지난번 마케팅 회의 정리처럼" 등 특정 분석을 가리킬 때 호출한다.
+    파일 내용을 읽지 않고 인덱스로 검색하며, 찾은 결과는 load_history로 불러온다.
+
+    Args:
+        query: 검색어 (채널 이름, 주제, 제목 등)
+        limit: 반환할 최대 건수 (기본값: 5, 최대 20)
+
+    Returns:
+        검색 결과 목록 (파일명, 요약, 관련도 포함)
+    """
+    try:
+        limit = max(1, min(limit, 20))
+        results = search_history_index(query, limit)
+        if not results:
+            return f"'{query}'와 관련된 분석 히스토리가 없습니다."
+
+        lines = [f"분석 히스토리 검색 결과 ({len(results)}건):"]
+        for i, item in enumerate(results, 1):
+            summary = item["summary"] or "(요약 없음)"
+            lines.append(f"  {i}. {item['filename']} - {summary} (관련도 {item['score']})")
+        return "\n".join(lines)
+    except Exception as e:
+        logger.exception("히스토리 검색 실패")
+        return f"[에러] 히스토리 검색 실패: {e!s}"
+
+
+@_tool()
+def load_history(filename: str) -> str:
+    """저장된 분석 결과 하나를 불러온다.
+
+    list_analysis_history 또는 search_history에서 찾은 파일명을 사용한다.
+
+    Args:
+        filename: 히스토리 파일명 (예: analysis_20260216_120000.json)
+
+    Returns:
+        분석 결과를 JSON 형식 문자열로 반환
+    """
+    try:
+        data = load_history_result(filename)
+        return json.dumps(data, ensure_ascii=False)
+    except (ValueError, FileNotFoundError) as e:
+        return f"[에러] {e!s}"
+    except Exception as e:
+        logger.exception("히스토리 로드 실패")
+        return f"[에러] 히스토리 로드 실패: {e!s}"
+
+
+@_tool()
+def rebuild_history_index_tool() -> str:
+    """분석 히스토리 인덱스를 다시 만든다.
+
+    히스토리 목록의 요약이 실제 파일 내용과 다르거나,
+    사용자가 히스토리 파일을 직접 수정/삭제했을 때 호출한다.
+
+    Returns:
+        재구성 결과 메시지
+    """
+    try:
+        count = rebuild_history_index()
+        return f"히스토리 인덱스를 다시 만들었습니다 ({count}건)."
+    except Exception as e:
+        logger.exception("히스토리 인덱스 재구성 실패")
+        return f"[에러] 히스토리 인덱스 재구성 실패: {e!s}"
+
+
+# ──────────────────────────────────────────────
+# 백그라운드 작업 도구
+# ──────────────────────────────────────────────
+
+# job_result가 한 번에 반환하는 최대 글자 수
+DEFAULT_JOB_RESULT_CHARS = 50000
+
+
+def _run_export_job(job: Job) -> dict:
+    """내보내기 작업: Slack 수집 → 분석용 포맷팅 → (선택) Notion 업로드.
+
+    단계를 마칠 때마다 결과를 작업 상태에 남기므로, 서버가 재시작되면 마친 단계는 건너뛴다.
+    """
+    params = job.params
+    text_path = job.artifact_path(".txt")
+    if "messages" not in job.state or not text_path.exists():
+        job.save_state(stage="collecting")
+        targets = collect_channels(
+            get_slack_client(), params["channels"], params["limit"], params["oldest"], params["latest"],
+        )
+        tmp_path = text_path.with_name(f"{text_path.name}.tmp")
+        tmp_path.write_text(format_channels_for_analysis(targets), encoding="utf-8")
+        os.replace(tmp_path, text_path)
+        job.save_state(
+            stage="collected",
+            channels=len(targets),
+            messages=sum(len(t.get("messages", [])) for t in targets),
+            failed_channels={t["channel_name"]: t["error"] for t in targets if t.get("error")},
+        )
+
+    if params["upload"] and "url" not in job.state:
+        # 업로드 중 중단되었으면 이미 만든 페이지에 남은 블록만 추가한다
+        resume = {key: job.state[key] for key in ("creating", "page_id", "page_url", "appended") if key in job.state}
+        job.save_state(stage="uploading")
+        url = upload_page(
+            get_notion_client(), params["parent_page_id"], params["title"], text_path.read_text(encoding="utf-8"),
+            checkpoint=job.save_state, resume=resume,
+        )
+        job.save_state(stage="uploaded", url=url)
+
+    return {key: job.state[key] for key in ("channels", "messages", "failed_channels", "url") if key in job.state}
+
+
+@_tool()
+def start_export(
+    channels: list[str],
+    since: str = "",
+    until: str = "",
+    timezone: str = "",
+    limit: int = DEFAULT_EXPORT_LIMIT,
+    title: str = "",
+    upload: bool = True,
+) -> str:
+    """여러 채널의 대량 메시지 내보내기를 백그라운드 작업으로 시작하고 작업 ID를 반환한다.
+
+    한 분기 분량처럼 도구 호출 제한 시간 안에 끝나지 않는 수집에 사용한다.
+    메시지 수집 → 분석용 포맷팅 → Notion 페이지 업로드를 서버에서 이어서 수행하며,
+    서버가 재시작되어도 작업은 이어서 실행된다. job_status로 진행 상황을, job_result로 결과를 확인한다.
+
+    Args:
+        channels: 채널 ID 또는 이름 리스트 (예: ["C0123456789", "#dev-backend"])
+        since: 시작 시점 (예: 2026-01-01, 90d)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: since/until 해석 시간대 (예: Asia/Seoul, 미지정 시 시스템 시간대)
+        limit: 채널별 최대 메시지 수 (기본값: 10000, 최대 100000)
+        title: Notion 페이지 제목 (미지정 시 "[채널] Slack 내보내기 - 날짜")
+        upload: 수집한 텍스트를 Notion 페이지로 업로드할지 여부 (False면 job_result로 텍스트를 받음)
+
+    Returns:
+        작업 ID 안내 또는 에러 메시지
+    """
+    if not channels:
+        return "[에러] 내보낼 채널을 하나 이상 지정하세요."
+    try:
+        # 재시작 후에도 같은 기간을 수집하도록 "7d" 같은 상대 시점은 지금 타임스탬프로 고정한다
+        oldest, latest = resolve_time_range(since, until, timezone)
+    except ValueError as e:
+        return f"[에러] {e}"
+
+    try:
+        # 토큰 설정 오류는 작업이 시작되기 전에 알린다
+        get_slack_client()
+        params = {
+            "channels": channels,
+            "oldest": oldest,
+            "latest": latest,
+            "limit": max(1, min(limit, MAX_EXPORT_LIMIT)),
+            "upload": upload,
+        }
+        if upload:
+            get_notion_client()
+            parent_page_id = notion_parent_page_id()
+            if not parent_page_id:
+                return _PARENT_PAGE_MISSING
+            params["parent_page_id"] = parent_page_id
+            params["title"] = title or default_title(channels)
+        job = _get_job_manager().submit("export", params)
+        return (
+            f"내보내기 작업을 시작했습니다 (작업 ID: {job['id']}). "
+            f"job_status로 진행 상황을, 끝나면 job_result로 결과를 확인하세요."
+        )
+    except JobError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 내보내기 작업 시작 실패: {e!s}"
+
+
+@_tool()
+def job_status(job_id: str = "", limit: int = 10) -> str:
+    """백그라운드 작업의 상태와 진행 상황을 조회한다.
+
+    Args:
+        job_id: 작업 ID (미지정 시 최근 작업 목록)
+        limit: 작업 ID 미지정 시 조회할 최근 작업 수 (기본값: 10)
+
+    Returns:
+        작업 정보(status, stage, progress, error, result 등)를 JSON 형식 문자열로 반환
+        status: queued(대기), running(실행 중), succeeded(완료), failed(실패), cancelled(취소)
+    """
+    try:
+        manager = _get_job_manager()
+        if job_id:
+            return json.dumps(manager.get(job_id.strip()), ensure_ascii=False)
+        return json.dumps(manager.recent(max(1, limit)), ensure_ascii=False)
+    except JobError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 작업 조회 실패: {e!s}"
+
+
+@_tool()
+def job_result(job_id: str, offset: int = 0, max_chars: int = DEFAULT_JOB_RESULT_CHARS) -> str:
+    """끝난 백그라운드 작업의 결과를 반환한다.
+
+    Notion에 업로드한 작업은 페이지 URL을, 업로드하지 않은 작업은 수집한 분석용 텍스트를 반환한다.
+    텍스트가 길면 max_chars씩 나누어 반환하므로 안내된 offset으로 이어서 호출한다.
+
+    Args:
+        job_id: 작업 ID
+        offset: 텍스트 시작 위치 (기본값: 0)
+        max_chars: 한 번에 반환할 최대 글자 수 (기본값: 50000)
+
+    Returns:
+        Notion 페이지 URL, 분석용 텍스트 또는 안내/에러 메시지
+    """
+    try:
+        job = _get_job_manager().get(job_id.strip())
+        if job["status"] == FAILED:
+            return f"[에러] 작업이 실패했습니다: {job['error']}"
+        if job["status"] == CANCELLED:
+            return f"[안내] 취소된 작업입니다: {job['error']}"
+        if job["status"] != SUCCEEDED:
+            detail = (job["progress"] or {}).get("message") or job["stage"] or job["status"]
+            return f"[안내] 작업이 아직 끝나지 않았습니다 ({job['status']}: {detail}). 잠시 후 다시 확인하세요."
+
+        result = job["result"] or {}
+        if result.get("url"):
+            return f"Notion 페이지가 생성되었습니다: {result['url']} (채널 {result['channels']}개, 메시지 {result['messages']}개)"
+
+        text_path = _get_job_manager().directory / f"{job['id']}.txt"
+        if not text_path.exists():
+            return f"[에러] 작업 결과 파일을 찾을 수 없습니다: {text_path}"
+        text = text_path.read_text(encoding="utf-8")
+        offset = max(0, offset)
+        end = offset + max(1, max_chars)
+        chunk = text[offset:end]
+        if end < len(text):
+            chunk += (
+                f"\n\n[안내] 전체 {len(text)}자 중 {offset}~{end}자를 표시했습니다. "
+                f"이어서 보려면 offset={end}로 다시 호출하세요."
+            )
+        return chunk
+    except JobError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 작업 결과 조회 실패: {e!s}"
+
+
+@_tool()
+def cancel_job(job_id: str) -> str:
+    """대기 중이거나 실행 중인 백그라운드 작업을 취소한다.
+
+    실행 중인 작업은 진행 중인 API 호출이 끝난 뒤 멈춘다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        취소 결과 안내 또는 에러 메시지
+    """
+    try:
+        job = _get_job_manager().cancel(job_id.strip())
+        if job["status"] == CANCELLED:
+            return f"작업을 취소했습니다: {job['id']}"
+        return f"작업 취소를 요청했습니다: {job['id']}. job_status로 멈췄는지 확인하세요."
+    except JobError as e:
+        return f"[에러] {e.message}"
+    except Exception as e:
+        logger.exception("예상치 못한 에러 발생")
+        return f"[에러] 작업 취소 실패: {e!s}"
+
+
+# ──────────────────────────────────────────────
+# 진단 도구
+# ──────────────────────────────────────────────
+
+
+@_tool()
+def get_metrics(reset: bool = False) -> str:
+    """서버 시작(또는 마지막 초기화) 이후의 실행 지표를 조회한다.
+
+    도구가 느릴 때 시간이 어디에 쓰였는지 확인하는 용도다.
+    도구/내부 단계별 소요 시간(spans), API 메서드별 호출 수·재시도·응답 크기(api),
+    캐시 적중률(caches)을 반환한다.
+
+    Args:
+        reset: True이면 조회 후 지표를 초기화 (기본값: False)
+
+    Returns:
+        지표를 JSON 형식 문자열로 반환
+    """
+    snapshot = metrics.snapshot()
+    if reset:
+        metrics.reset()
+    return json.dumps(snapshot, ensure_ascii=False, indent=2)
+
+
+def _warm_up() -> None:
+    """토큰이 설정된 클라이언트를 미리 만들고 토큰 확인, 연결, 디스크 캐시 로드를 수행한다.
+
+    백그라운드 스레드에서 실행되며, 실패해도 로그만 남기고 도구 실행에는 영향을 주지 않는다.
+    채널 디렉토리를 API로 다시 조회하지 않으므로 첫 도구 호출이 warm-up을 기다리지 않는다.
+    """
+    if os.environ.get("SLACK_BOT_TOKEN") or os.environ.get("SLACK_USER_TOKEN"):
+        try:
+            with metrics.span("warmup.slack"):
+                info = get_slack_client().warm_up()
+            logger.info(
+                "Slack warm-up 완료 (team=%s, 캐시된 채널 %d개, 캐시된 사용자 %d명)",
+                info["team"], info["channels"], info["cached_users"],
+            )
+        except Exception as e:
+            logger.warning("Slack warm-up 실패: %s", getattr(e, "message", e))
+
+    if os.environ.get("NOTION_API_KEY"):
+        try:
+            with metrics.span("warmup.notion"):
+                name = get_notion_client().warm_up()
+            logger.info("Notion warm-up 완료 (integration=%s)", name)
+        except Exception as e:
+            logger.warning("Notion warm-up 실패: %s", getattr(e, "message", e))
+
+
+def _start_warm_up() -> threading.Thread | None:
+    """SLACK_TO_NOTION_WARMUP이 켜져 있으면 warm-up을 백그라운드에서 시작한다 (프로세스당 한 번)."""
+    global _warm_up_started
+    if os.environ.get(WARMUP_ENV, "").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    if _warm_up_started:
+        return None
+    _warm_up_started = True
+    thread = threading.Thread(target=_warm_up, name="slack-to-notion-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+async def _on_initialized(notification: InitializedNotification) -> None:
+    # initialize 응답을 보낸 뒤 클라이언트가 보내는 알림이므로, warm-up이 핸드셰이크를 늦추지 않는다
+    _start_warm_up()
+
+
+# FastMCP는 initialized 알림 훅을 제공하지 않으므로 하위 서버의 알림 핸들러에 등록한다
+mcp._mcp_server.notification_handlers[InitializedNotification] = _on_initialized
+
+
 def _get_package_version() -> str:
     """패키지 버전을 반환한다."""
     try:
@@ -471,7 +1273,14 @@ def _get_package_version() -> str:
 
 
 def main():
-    """MCP 서버 진입점. uvx 및 python -m 실행 시 호출된다."""
+    """MCP 서버 진입점. uvx 및 python -m 실행 시 호출된다.
+
+    첫 인자가 CLI 하위 명령(export, upload)이면 서버 대신 CLI를 실행하고 종료 코드를 반환한다.
+    """
+    from . import cli
+
+    if len(sys.argv) > 1 and sys.argv[1] in cli.COMMANDS:
+        return cli.main(sys.argv[1:])
     if "--help" in sys.argv or "-h" in sys.argv:
         print("slack-to-notion-mcp — Slack 메시지를 Notion 페이지로 정리하는 MCP 서버")
         print()
@@ -479,6 +1288,12 @@ def main():
         print("  uvx slack-to-notion-mcp          MCP 서버 실행 (Claude Code가 자동 호출)")
         print("  uvx slack-to-notion-mcp --help    이 도움말 표시")
         print()
+        print("헤드리스 실행 (cron 등):")
+        print("  uvx slack-to-notion-mcp export --channels general --since 1d --output daily.txt")
+        print("  uvx slack-to-notion-mcp export --channels general --since 7d --upload")
+        print("  uvx slack-to-notion-mcp upload --title \"주간 요약\" --file summary.md")
+        print("  각 명령의 옵션: uvx slack-to-notion-mcp export --help")
+        print()
         print("설치:")
         print("  curl -sL https://raw.githubusercontent.com/dykim-base-project/")
         print("    claude-slack-to-notion/main/scripts/setup.sh | bash")
@@ -488,6 +1303,21 @@ def main():
         return
     pkg_version = _get_package_version()
     logger.info("Slack-to-Notion MCP 서버 시작 (v%s)", pkg_version)
+    try:
+        tracing_mode = tracing.configure()
+    except (ValueError, RuntimeError) as e:
+        logger.warning("트레이싱을 사용하지 않습니다: %s", e)
+    else:
+        if tracing_mode:
+            logger.info("트레이싱 사용 (%s)", tracing_mode)
+    try:
+        if profiling.configure():
+            logger.info("프로파일링 사용 (%s)", profiling.DEFAULT_PROFILE_DIR)
+    except ValueError as e:
+        logger.warning("프로파일링을 사용하지 않습니다: %s", e)
+    resumed = _get_job_manager().resume()
+    if resumed:
+        logger.info("끝나지 않은 작업 %d개를 이어서 실행합니다: %s", len(resumed), ", ".join(resumed))
     mcp.run()
 
 
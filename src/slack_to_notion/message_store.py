@@ -0,0 +1,346 @@
+"""수집된 메시지 로컬 저장 및 전문 검색 모듈.
+
+fetch로 수집한 Slack 메시지를 SQLite에 저장하고 FTS5 인덱스로 검색한다.
+채널 전체를 다시 수집하지 않고도 과거 대화를 찾을 수 있다.
+
+메시지 원문이 디스크에 남으므로 SLACK_TO_NOTION_MESSAGE_STORE 환경변수로 켠 경우에만 저장한다.
+저장한 지 보존 기간(SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS)이 지난 메시지를 지우고,
+DB 크기가 한도(SLACK_TO_NOTION_MESSAGE_STORE_MAX_BYTES)를 넘으면 먼저 저장한 메시지부터 지운다.
+오래전 대화를 수집해도 저장 시각 기준이므로 바로 지워지지 않는다. 정리는 PRUNE_INTERVAL마다 한 번 수행한다.
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_STORE_ENV = "SLACK_TO_NOTION_MESSAGE_STORE"
+MAX_AGE_DAYS_ENV = "SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS"
+MAX_BYTES_ENV = "SLACK_TO_NOTION_MESSAGE_STORE_MAX_BYTES"
+DEFAULT_MAX_AGE_DAYS = 90.0
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+# 크기 한도를 넘으면 한도의 이 비율까지 줄여 저장할 때마다 정리하지 않게 한다
+_PRUNE_LOW_WATERMARK = 0.8
+# 보존 한도 정리 최소 간격 (초). 수집은 페이지마다 저장하므로 매번 정리하지 않는다
+PRUNE_INTERVAL = 300.0
+
+# FTS5 trigram 토크나이저가 인덱싱하는 최소 글자 수
+_MIN_FTS_TERM_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    ts_num REAL NOT NULL,
+    thread_ts TEXT,
+    user TEXT,
+    text TEXT NOT NULL DEFAULT '',
+    stored_at REAL NOT NULL DEFAULT 0,
+    UNIQUE (channel_id, ts)
+);
+CREATE INDEX IF NOT EXISTS idx_messages_channel_ts ON messages (channel_id, ts_num);
+"""
+
+# 보존 한도는 저장 시각 기준이다. stored_at이 없는 이전 DB는 _connect에서 열을 추가한 뒤 만든다
+_STORED_AT_INDEX = """
+DROP INDEX IF EXISTS idx_messages_ts;
+CREATE INDEX IF NOT EXISTS idx_messages_stored_at ON messages (stored_at);
+"""
+
+# trigram 토크나이저는 공백이 없는 한글 부분 문자열도 검색할 수 있다 (SQLite 3.34+)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, content='messages', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE OF text ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO messages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+def _to_float(ts: str) -> float:
+    try:
+        return float(ts)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _env_limit(name: str, default: float) -> float | None:
+    """한도 환경변수를 읽는다. 미설정이거나 숫자가 아니면 default, 0 이하이면 None(한도 없음)."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("%s 값이 숫자가 아니어서 기본값(%g)을 사용합니다: %s", name, default, raw)
+        return default
+    return value if value > 0 else None
+
+
+def store_enabled() -> bool:
+    """SLACK_TO_NOTION_MESSAGE_STORE 환경변수로 메시지 저장을 켰는지 여부."""
+    return os.environ.get(MESSAGE_STORE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def store_limits() -> tuple[float | None, int | None]:
+    """환경변수의 보존 한도를 읽는다.
+
+    Returns:
+        (보존 기간(일), 최대 DB 크기(바이트)). 0 이하로 설정한 한도는 None (제한 없음)
+    """
+    max_age_days = _env_limit(MAX_AGE_DAYS_ENV, DEFAULT_MAX_AGE_DAYS)
+    max_bytes = _env_limit(MAX_BYTES_ENV, DEFAULT_MAX_BYTES)
+    return max_age_days, int(max_bytes) if max_bytes else None
+
+
+class MessageStore:
+    """SQLite 기반 메시지 저장소.
+
+    FTS5(trigram)를 사용할 수 없는 SQLite 빌드에서는 LIKE 검색으로 대체한다.
+
+    Args:
+        path: DB 파일 경로
+        max_age_days: 저장 시각 기준 보존 기간 (일, None이면 제한 없음)
+        max_bytes: 최대 DB 크기 (바이트, None이면 제한 없음)
+    """
+
+    def __init__(self, path: Path, max_age_days: float | None = None, max_bytes: int | None = None):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self._has_fts: bool | None = None
+        # 마지막 정리 시각 (time.monotonic, None이면 아직 정리하지 않음)
+        self._pruned_at: float | None = None
+        self._prune_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if self._has_fts is None:
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(messages)")}
+            if "stored_at" not in columns:
+                # 저장 시각이 없던 DB: 기존 메시지는 지금 저장한 것으로 보고 보존 기간을 새로 적용한다
+                conn.execute("ALTER TABLE messages ADD COLUMN stored_at REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE messages SET stored_at = ?", (time.time(),))
+            conn.executescript(_STORED_AT_INDEX)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+                self._has_fts = True
+            except sqlite3.OperationalError:
+                self._has_fts = False
+            conn.commit()
+        return conn
+
+    def add_messages(self, channel_id: str, messages: list[dict]) -> int:
+        """메시지를 저장한다. 같은 채널/ts의 메시지는 최신 내용으로 갱신한다.
+
+        다시 저장한 메시지는 저장 시각도 갱신한다. 마지막 정리 후 PRUNE_INTERVAL이 지났으면
+        저장한 뒤 보존 한도를 넘은 메시지를 지운다.
+
+        Args:
+            channel_id: 채널 ID
+            messages: Slack 메시지 리스트
+
+        Returns:
+            저장한 메시지 수
+        """
+        stored_at = time.time()
+        rows = [
+            (
+                channel_id,
+                msg["ts"],
+                _to_float(msg["ts"]),
+                msg.get("thread_ts"),
+                msg.get("user"),
+                msg.get("text", ""),
+                stored_at,
+            )
+            for msg in messages
+            if msg.get("ts")
+        ]
+        if not rows:
+            return 0
+
+        with closing(self._connect()) as conn:
+            conn.executemany(
+                "INSERT INTO messages (channel_id, ts, ts_num, thread_ts, user, text, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (channel_id, ts) DO UPDATE SET "
+                "text = excluded.text, "
+                "stored_at = excluded.stored_at, "
+                "thread_ts = COALESCE(excluded.thread_ts, messages.thread_ts), "
+                "user = COALESCE(excluded.user, messages.user)",
+                rows,
+            )
+            conn.commit()
+            if self._prune_due():
+                self._prune(conn)
+        return len(rows)
+
+    def _prune_due(self) -> bool:
+        """정리할 때가 되었는지 확인하고, 되었으면 정리 시각을 기록한다."""
+        if not (self.max_age_days or self.max_bytes):
+            return False
+        with self._prune_lock:
+            now = time.monotonic()
+            if self._pruned_at is not None and now - self._pruned_at < PRUNE_INTERVAL:
+                return False
+            self._pruned_at = now
+            return True
+
+    def prune(self) -> int:
+        """보존 한도를 넘은 메시지를 바로 지운다.
+
+        Returns:
+            삭제한 메시지 수
+        """
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn:
+            return self._prune(conn)
+
+    def _used_bytes(self, conn: sqlite3.Connection) -> int:
+        """빈 페이지를 제외한 DB 크기 (바이트)."""
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free_pages) * page_size
+
+    def _prune(self, conn: sqlite3.Connection) -> int:
+        """보존 기간이 지난 메시지와 크기 한도를 넘은 먼저 저장한 메시지를 지운다.
+
+        Returns:
+            삭제한 메시지 수
+        """
+        deleted = 0
+        if self.max_age_days:
+            cutoff = time.time() - self.max_age_days * 86400
+            deleted += conn.execute("DELETE FROM messages WHERE stored_at < ?", (cutoff,)).rowcount
+            conn.commit()
+
+        if self.max_bytes:
+            used = self._used_bytes(conn)
+            if used > self.max_bytes:
+                target = self.max_bytes * _PRUNE_LOW_WATERMARK
+                while used > target:
+                    total = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+                    if not total:
+                        break
+                    # 메시지당 크기가 비슷하다고 보고 target에 맞을 만큼 지운다
+                    remove = max(1, math.ceil(total * (1 - target / used)))
+                    deleted += conn.execute(
+                        "DELETE FROM messages WHERE id IN (SELECT id FROM messages ORDER BY stored_at, ts_num LIMIT ?)",
+                        (remove,),
+                    ).rowcount
+                    if self._has_fts:
+                        # 삭제 기록을 병합해 FTS 인덱스도 함께 줄인다
+                        conn.execute("INSERT INTO messages_fts (messages_fts) VALUES ('optimize')")
+                    conn.commit()
+                    previous, used = used, self._used_bytes(conn)
+                    if used >= previous:
+                        break
+                # 지운 페이지를 파일에서 반환한다
+                conn.execute("VACUUM")
+
+        if deleted:
+            logger.info("메시지 저장소 보존 한도를 넘은 메시지 %d건을 삭제했습니다", deleted)
+        return deleted
+
+    def count(self) -> int:
+        """저장된 메시지 수를 반환한다."""
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    def search(
+        self,
+        query: str = "",
+        channel_id: str | None = None,
+        user_ids: list[str] | None = None,
+        oldest: float | None = None,
+        latest: float | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """저장된 메시지를 검색한다.
+
+        검색어는 공백으로 나눈 모든 단어를 포함하는 메시지를 찾는다 (AND).
+        3글자 이상 단어는 FTS 인덱스로, 더 짧은 단어는 LIKE로 매칭한다.
+
+        Args:
+            query: 검색어 (빈 문자열이면 필터만 적용)
+            channel_id: 채널 ID 필터
+            user_ids: 작성자 ID 필터 (하나라도 일치)
+            oldest: 시작 Unix timestamp (포함)
+            latest: 종료 Unix timestamp (포함)
+            limit: 반환할 최대 건수
+
+        Returns:
+            메시지 리스트 [{"channel_id", "ts", "thread_ts", "user", "text"}]
+            FTS 매칭 시 관련도 순, 아니면 최신순.
+        """
+        if not self.path.exists():
+            return []
+
+        with closing(self._connect()) as conn:
+            fts_terms = []
+            where = []
+            params: list = []
+
+            for term in query.split():
+                if self._has_fts and len(term) >= _MIN_FTS_TERM_LENGTH:
+                    fts_terms.append('"{}"'.format(term.replace('"', '""')))
+                else:
+                    where.append("m.text LIKE ? ESCAPE '\\'")
+                    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    params.append(f"%{escaped}%")
+
+            if channel_id:
+                where.append("m.channel_id = ?")
+                params.append(channel_id)
+            if user_ids:
+                where.append(f"m.user IN ({', '.join('?' * len(user_ids))})")
+                params.extend(user_ids)
+            if oldest is not None:
+                where.append("m.ts_num >= ?")
+                params.append(oldest)
+            if latest is not None:
+                where.append("m.ts_num <= ?")
+                params.append(latest)
+
+            columns = "m.channel_id, m.ts, m.thread_ts, m.user, m.text"
+            if fts_terms:
+                sql = (
+                    f"SELECT {columns} FROM messages_fts f JOIN messages m ON m.id = f.rowid "
+                    "WHERE messages_fts MATCH ?"
+                )
+                params.insert(0, " AND ".join(fts_terms))
+                if where:
+                    sql += " AND " + " AND ".join(where)
+                sql += " ORDER BY f.rank"
+            else:
+                sql = f"SELECT {columns} FROM messages m"
+                if where:
+                    sql += " WHERE " + " AND ".join(where)
+                sql += " ORDER BY m.ts_num DESC"
+            sql += " LIMIT ?"
+            params.append(limit)
+
+            return [dict(row) for row in conn.execute(sql, params)]
@@ -0,0 +1,183 @@
+"""실행 계측 모듈.
+
+도구 실행과 내부 단계의 소요 시간, API 메서드별 호출 수·재시도·응답 크기,
+캐시 적중률을 프로세스 전역으로 집계한다. get_metrics 도구로 조회한다.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from . import tracing
+
+
+class _Timing:
+    """소요 시간 집계."""
+
+    __slots__ = ("count", "errors", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float, error: bool) -> None:
+        self.count += 1
+        self.errors += int(error)
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 1),
+            "avg_ms": round(self.total * 1000 / self.count, 1) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class _ApiStat(_Timing):
+    """API 메서드별 호출 집계."""
+
+    __slots__ = ("retries", "bytes")
+
+    def __init__(self):
+        super().__init__()
+        self.retries = 0
+        self.bytes = 0
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), "retries": self.retries, "bytes": self.bytes}
+
+
+class Metrics:
+    """스레드 안전한 실행 지표 수집기."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 지표를 초기화한다."""
+        with self._lock:
+            self._since = datetime.now().astimezone()
+            self._spans: dict[str, _Timing] = {}
+            self._api: dict[tuple[str, str], _ApiStat] = {}
+            self._caches: dict[str, list[int]] = {}
+
+    def record_span(self, name: str, seconds: float, error: bool = False) -> None:
+        """구간 실행 시간을 기록한다."""
+        with self._lock:
+            self._spans.setdefault(name, _Timing()).add(seconds, error)
+
+    @contextmanager
+    def span(self, name: str):
+        """with 블록의 실행 시간을 name 구간으로 기록한다. 예외가 나면 에러로 센다.
+
+        트레이싱이 켜져 있으면 같은 이름의 span도 만든다.
+        """
+        start = time.perf_counter()
+        error = False
+        try:
+            with tracing.span(name):
+                yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record_span(name, time.perf_counter() - start, error)
+
+    def timed(self, name: str):
+        """함수 실행 시간을 name 구간으로 기록하는 데코레이터."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record_api_call(
+        self, service: str, method: str, seconds: float, size: int = 0, error: bool = False,
+    ) -> None:
+        """외부 API 호출 한 번을 기록한다.
+
+        Args:
+            service: 서비스 이름 ("slack", "notion")
+            method: API 메서드 이름
+            seconds: 호출 소요 시간 (SDK 내부 재시도 포함)
+            size: 응답 크기 (바이트)
+            error: 호출 실패 여부
+        """
+        with self._lock:
+            stat = self._api.setdefault((service, method), _ApiStat())
+            stat.add(seconds, error)
+            stat.bytes += size
+
+    def record_retry(self, service: str, method: str) -> None:
+        """API 재시도 한 번을 기록한다."""
+        with self._lock:
+            self._api.setdefault((service, method), _ApiStat()).retries += 1
+
+    def record_cache(self, name: str, hits: int = 0, misses: int = 0) -> None:
+        """캐시 적중/미적중 수를 기록한다."""
+        if not hits and not misses:
+            return
+        with self._lock:
+            counts = self._caches.setdefault(name, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+
+    def snapshot(self) -> dict:
+        """현재까지의 지표를 dict로 반환한다."""
+        with self._lock:
+            api: dict[str, dict] = {}
+            for (service, method), stat in sorted(self._api.items()):
+                api.setdefault(service, {})[method] = stat.to_dict()
+            return {
+                "since": self._since.isoformat(timespec="seconds"),
+                "spans": {name: timing.to_dict() for name, timing in sorted(self._spans.items())},
+                "api": api,
+                "caches": {
+                    name: {
+                        "hits": hits,
+                        "misses": misses,
+                        "hit_rate": round(hits / (hits + misses), 3),
+                    }
+                    for name, (hits, misses) in sorted(self._caches.items())
+                },
+            }
+
+
+def payload_size(data) -> int:
+    """API 응답 본문의 대략적인 크기(UTF-8 JSON 바이트)를 계산한다."""
+    try:
+        return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+def response_size(headers, data) -> int:
+    """API 응답 크기(바이트)를 구한다.
+
+    전송 계층이 받은 Content-Length 헤더를 사용한다. 헤더가 없으면(chunked 응답 등)
+    트레이싱이 켜진 경우에만 payload_size로 본문을 다시 직렬화하고, 그 외에는 0을 반환한다.
+    """
+    for key, value in (headers or {}).items():
+        if key.lower() == "content-length":
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                break
+    return payload_size(data) if tracing.enabled() else 0
+
+
+# 프로세스 전역 수집기
+metrics = Metrics()
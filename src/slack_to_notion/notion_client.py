@@ -3,11 +3,38 @@
 notion-client를 사용하여 분석 결과를 Notion 페이지로 생성한다.
 """
 
+import logging
+import random
 import re
+import threading
+import time
+from collections.abc import Callable
 from urllib.parse import urlparse
 
 from notion_client import Client
-from notion_client.errors import APIResponseError
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from . import progress, tracing
+from .errors import NotionClientError
+from .metrics import metrics, response_size
+from .ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Notion API 평균 허용 속도 (초당 3회)와 순간 허용 호출 수
+NOTION_REQUESTS_PER_SECOND = 3
+NOTION_BURST = 3
+# 재시도 횟수와 지수 백오프 간격 (초)
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+# 요청 하나에 넣을 수 있는 최대 하위 블록 수
+CHILDREN_LIMIT = 100
+
+# 요청이 처리되지 않았음이 확실해 항상 재시도할 수 있는 에러
+_REJECTED_CODES = {"rate_limited"}
+# 일시적인 서버 에러 (요청이 처리되었을 수도 있음)
+_TRANSIENT_CODES = {"internal_server_error", "service_unavailable", "conflict_error"}
 
 
 def extract_page_id(value: str) -> str:
@@ -41,12 +68,19 @@ def extract_page_id(value: str) -> str:
     return value
 
 
-class NotionClientError(Exception):
-    """Notion API 호출 중 발생한 에러."""
+def _method_name(func: Callable) -> str:
+    """SDK 메서드를 API 메서드 이름으로 변환한다 (예: BlocksChildrenEndpoint.list → blocks.children.list)."""
+    name = getattr(func, "__name__", "request")
+    owner = getattr(func, "__self__", None)
+    if owner is None:
+        return name
+    words = re.findall(r"[A-Z][a-z]*", type(owner).__name__.removesuffix("Endpoint"))
+    return ".".join([*(word.lower() for word in words), name])
+
 
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
+def _page_url(page_id: str) -> str:
+    """페이지 ID로 Notion 페이지 URL을 만든다."""
+    return f"https://www.notion.so/{page_id.replace('-', '')}"
 
 
 def _parse_inline_markdown(text: str) -> list[dict]:
@@ -157,14 +191,116 @@ def split_rich_text(text: str, max_len: int = 2000) -> list[dict]:
 
 
 class NotionClient:
-    """Notion API 클라이언트."""
+    """Notion API 클라이언트.
 
-    def __init__(self, api_key: str):
-        self.client = Client(auth=api_key)
+    모든 요청은 초당 NOTION_REQUESTS_PER_SECOND회로 속도를 맞추고,
+    rate limit과 일시적인 서버 에러는 지수 백오프로 재시도한다.
+    """
+
+    def __init__(self, api_key: str, base_url: str | None = None):
+        """클라이언트 초기화.
 
-    def _format_error_message(self, error: APIResponseError) -> str:
-        """APIResponseError를 사용자 친화적 한글 메시지로 변환."""
+        Args:
+            api_key: Notion API 키
+            base_url: Notion API 주소 (미지정 시 https://api.notion.com, 벤치마크용 가짜 서버 등에 사용)
+        """
+        if base_url:
+            self.client = Client(auth=api_key, base_url=base_url)
+        else:
+            self.client = Client(auth=api_key)
+        # 응답 크기는 SDK가 돌려준 dict를 다시 직렬화하지 않고 httpx 응답 헤더에서 읽는다 (요청한 스레드별로 기록)
+        self._transport = threading.local()
+        self.client.client.event_hooks["response"].append(self._record_response)
+        self.rate_limiter = TokenBucket(NOTION_REQUESTS_PER_SECOND, NOTION_BURST)
+
+    def _record_response(self, response) -> None:
+        """httpx 응답 훅. 마지막 응답 헤더를 요청한 스레드에 기록한다."""
+        self._transport.headers = response.headers
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """재시도 전 대기 시간을 계산한다. Retry-After 헤더가 있으면 우선한다."""
+        headers = getattr(error, "headers", None)
+        retry_after = headers.get("retry-after") if headers is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+    def _request(
+        self,
+        func: Callable,
+        idempotent: bool = True,
+        verify: Callable[[], object] | None = None,
+        **kwargs,
+    ):
+        """속도 제한과 재시도를 적용해 Notion API를 호출한다.
+
+        rate limit(429)은 요청이 처리되지 않은 것이므로 항상 재시도한다.
+        타임아웃과 5xx 에러는 요청이 처리되었을 수도 있으므로 idempotent 요청만 재시도하고,
+        그 외 요청은 verify로 이미 반영되었는지 확인한 뒤 반영되지 않은 경우에만 재시도한다.
+
+        Args:
+            func: 호출할 API 메서드
+            idempotent: 같은 요청을 반복해도 결과가 같은지 여부
+            verify: 요청이 이미 반영되었으면 그 결과를, 아니면 None을 반환하는 함수
+            **kwargs: API 인자
+
+        Raises:
+            HTTPResponseError, RequestTimeoutError: 재시도할 수 없거나 재시도 횟수를 초과한 경우
+        """
+        method = _method_name(func)
+        attributes = {"rpc.system": "notion", "rpc.method": method}
+        if "children" in kwargs:
+            attributes["notion.block_count"] = len(kwargs["children"])
+        with tracing.span(f"notion {method}", attributes) as span:
+            attempt = 0
+            while True:
+                self.rate_limiter.acquire()
+                start = time.perf_counter()
+                self._transport.headers = None
+                try:
+                    response = func(**kwargs)
+                    size = response_size(self._transport.headers, response)
+                    metrics.record_api_call("notion", method, time.perf_counter() - start, size=size)
+                    span.set_attribute("http.response_size", size)
+                    span.set_attribute("notion.retries", attempt)
+                    return response
+                except (HTTPResponseError, RequestTimeoutError) as e:
+                    metrics.record_api_call("notion", method, time.perf_counter() - start, error=True)
+                    code = str(getattr(e.code, "value", e.code))
+                    status = getattr(e, "status", 0)
+                    span.set_attribute("http.status_code", status)
+                    span.set_attribute("notion.retries", attempt)
+                    if attempt >= MAX_RETRIES:
+                        raise
+                    if code in _REJECTED_CODES or status == 429:
+                        delay = self._retry_delay(e, attempt)
+                        self.rate_limiter.pause(delay)
+                    elif isinstance(e, RequestTimeoutError) or code in _TRANSIENT_CODES or status >= 500:
+                        if not idempotent:
+                            if verify is None:
+                                raise
+                            applied = verify()
+                            if applied is not None:
+                                span.add_event("verified_applied", {"code": code})
+                                return applied
+                        delay = self._retry_delay(e, attempt)
+                    else:
+                        raise
+                    attempt += 1
+                    metrics.record_retry("notion", method)
+                    span.add_event("retry", {"attempt": attempt, "code": code, "delay": delay})
+                    logger.warning("Notion API 재시도 %d/%d (%s): %.1f초 후", attempt, MAX_RETRIES, code, delay)
+                    time.sleep(delay)
+
+    def _format_error_message(self, error: HTTPResponseError | RequestTimeoutError) -> str:
+        """Notion API 에러를 사용자 친화적 한글 메시지로 변환."""
         code = error.code
+        if isinstance(error, RequestTimeoutError):
+            return "Notion API 응답이 지연되고 있습니다. 잠시 후 다시 시도하세요."
         if code in ("unauthorized", "invalid_api_key"):
             return "Notion API 키가 올바르지 않습니다. NOTION_API_KEY 값을 확인하세요. 토큰은 ntn_ 또는 secret_로 시작해야 합니다."
         elif code == "object_not_found":
@@ -176,45 +312,107 @@ class NotionClient:
         else:
             return f"예상치 못한 오류가 발생했습니다 ({code}). 문제가 지속되면 README.md를 참고하세요."
 
+    def warm_up(self) -> str:
+        """API 키를 확인하고 HTTP 연결을 미리 열어 둔다.
+
+        Returns:
+            Integration(봇) 이름
+
+        Raises:
+            NotionClientError: API 키가 유효하지 않거나 API 호출 실패 시
+        """
+        try:
+            response = self._request(self.client.users.me)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            raise NotionClientError(self._format_error_message(e)) from e
+        return response.get("name") or ""
+
+    def _iter_children(self, block_id: str):
+        """블록의 하위 블록을 pagination으로 모두 순회한다."""
+        cursor = None
+        while True:
+            kwargs: dict = {"block_id": block_id}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            response = self._request(self.client.blocks.children.list, **kwargs)
+            yield from response.get("results", [])
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+
+    def _find_child_page(self, parent_page_id: str, title: str) -> dict | None:
+        """상위 페이지 하위에서 제목이 같은 첫 번째 페이지 블록을 찾는다."""
+        for block in self._iter_children(parent_page_id):
+            if block["type"] == "child_page":
+                page_title = block.get("child_page", {}).get("title", "")
+                if page_title == title:
+                    return block
+        return None
+
     def check_duplicate(self, parent_page_id: str, title: str) -> bool:
         """상위 페이지 하위에서 동일 제목의 페이지가 있는지 확인.
 
         하위 페이지가 100개 초과인 경우에도 pagination으로 전체 조회한다.
         """
         try:
-            cursor = None
-            while True:
-                kwargs: dict = {"block_id": parent_page_id}
-                if cursor:
-                    kwargs["start_cursor"] = cursor
-                response = self.client.blocks.children.list(**kwargs)
-                for block in response.get("results", []):
-                    if block["type"] == "child_page":
-                        page_title = block.get("child_page", {}).get("title", "")
-                        if page_title == title:
-                            return True
-                if not response.get("has_more"):
-                    break
-                cursor = response.get("next_cursor")
-            return False
-        except APIResponseError as e:
+            return self._find_child_page(parent_page_id, title) is not None
+        except (HTTPResponseError, RequestTimeoutError) as e:
             raise NotionClientError(self._format_error_message(e)) from e
 
+    def find_page(self, parent_page_id: str, title: str) -> dict | None:
+        """상위 페이지 하위에서 제목이 같은 첫 번째 페이지를 찾는다.
+
+        Returns:
+            {"id", "url"} 또는 None
+
+        Raises:
+            NotionClientError: API 호출 실패 시
+        """
+        try:
+            block = self._find_child_page(parent_page_id, title)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            raise NotionClientError(self._format_error_message(e)) from e
+        if block is None:
+            return None
+        return {"id": block["id"], "url": block.get("url") or _page_url(block["id"])}
+
+    @metrics.timed("notion.create_analysis_page")
     def create_analysis_page(
         self,
         parent_page_id: str,
         title: str,
         blocks: list[dict],
+        checkpoint: Callable[..., None] | None = None,
     ) -> str:
         """상위 페이지 하위에 분석 결과 페이지를 생성.
 
         Notion API는 children 배열 최대 100개 제한이 있으므로,
-        100개 초과 시 처음 100개로 페이지를 생성한 뒤 나머지를 100개씩 분할하여 append한다.
+        100개 초과 시 처음 100개로 페이지를 생성한 뒤 나머지를 append_blocks로 100개씩 추가한다.
+
+        생성/추가 요청은 반복하면 중복이 생기므로, 서버 에러 후에는 페이지가 이미 생성되었는지,
+        블록이 이미 추가되었는지 확인한 뒤 반영되지 않은 경우에만 재시도한다.
+
+        Args:
+            parent_page_id: 상위 페이지 ID
+            title: 페이지 제목
+            blocks: 페이지에 넣을 블록 리스트
+            checkpoint: 페이지 생성 후와 블록 추가 요청마다 page_id, page_url, appended(추가된 블록 수)를
+                키워드 인자로 받는 함수. 프로세스가 중단되면 이 값으로 append_blocks를 호출해 이어서 추가한다.
+
+        Raises:
+            NotionClientError: API 호출 실패 시
+            OperationCancelled: 작업이 취소된 경우 (메시지에 일부만 작성된 페이지 URL 포함)
         """
-        _BLOCK_LIMIT = 100
+        first_batch = blocks[:CHILDREN_LIMIT]
+
+        def find_created_page():
+            return self._find_child_page(parent_page_id, title)
+
         try:
-            first_batch = blocks[:_BLOCK_LIMIT]
-            response = self.client.pages.create(
+            response = self._request(
+                self.client.pages.create,
+                idempotent=False,
+                verify=find_created_page,
                 parent={"page_id": parent_page_id},
                 properties={
                     "title": {
@@ -223,19 +421,70 @@ class NotionClient:
                 },
                 children=first_batch,
             )
-            page_id = response["id"]
-            # 100개 초과분을 100개씩 분할하여 append
-            remaining = blocks[_BLOCK_LIMIT:]
-            for i in range(0, len(remaining), _BLOCK_LIMIT):
-                batch = remaining[i : i + _BLOCK_LIMIT]
-                self.client.blocks.children.append(
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            raise NotionClientError(self._format_error_message(e)) from e
+        page_id = response["id"]
+        url = response.get("url") or _page_url(page_id)
+        if checkpoint is not None:
+            checkpoint(page_id=page_id, page_url=url, appended=len(first_batch))
+        self.append_blocks(page_id, blocks, len(first_batch), url=url, checkpoint=checkpoint)
+        return url
+
+    def append_blocks(
+        self,
+        page_id: str,
+        blocks: list[dict],
+        start: int = 0,
+        url: str | None = None,
+        checkpoint: Callable[..., None] | None = None,
+    ) -> None:
+        """blocks[start:]를 페이지 끝에 100개씩 추가한다.
+
+        앞의 start개 블록은 이미 페이지에 있다고 보고, 요청마다 추가된 블록 수로 진행 상황을 알린다.
+        취소되면 남은 블록을 추가하지 않는다.
+
+        Args:
+            page_id: 블록을 추가할 페이지 ID
+            blocks: 페이지 전체 블록 리스트
+            start: 이미 추가된 블록 수
+            url: 취소 메시지에 넣을 페이지 URL (미지정 시 page_id로 생성)
+            checkpoint: 요청마다 appended(추가된 블록 수)를 키워드 인자로 받는 함수
+
+        Raises:
+            NotionClientError: API 호출 실패 시
+            OperationCancelled: 작업이 취소된 경우 (메시지에 일부만 작성된 페이지 URL 포함)
+        """
+        url = url or _page_url(page_id)
+        appended = start
+        try:
+            while appended < len(blocks):
+                try:
+                    progress.report(appended, len(blocks), f"블록 {appended}/{len(blocks)}개 추가")
+                except progress.OperationCancelled:
+                    raise progress.OperationCancelled(
+                        f"페이지 생성이 취소되었습니다. 블록 {appended}/{len(blocks)}개만 추가된 페이지가 남아 있습니다: {url}"
+                    ) from None
+                batch = blocks[appended : appended + CHILDREN_LIMIT]
+                expected = appended + len(batch)
+
+                def find_appended_batch(expected=expected):
+                    count = sum(1 for _ in self._iter_children(page_id))
+                    return {"results": []} if count >= expected else None
+
+                self._request(
+                    self.client.blocks.children.append,
+                    idempotent=False,
+                    verify=find_appended_batch,
                     block_id=page_id,
                     children=batch,
                 )
-            return response["url"]
-        except APIResponseError as e:
+                appended = expected
+                if checkpoint is not None:
+                    checkpoint(appended=appended)
+        except (HTTPResponseError, RequestTimeoutError) as e:
             raise NotionClientError(self._format_error_message(e)) from e
 
+    @metrics.timed("notion.build_page_blocks")
     def build_page_blocks(self, content_text: str) -> list[dict]:
         """자유 형식 텍스트를 Notion 블록으로 변환."""
         blocks = []
@@ -0,0 +1,186 @@
+"""도구 실행 프로파일링 모듈.
+
+SLACK_TO_NOTION_PROFILE 환경변수로 켜며, 지정한 도구의 실행을 cProfile로 측정해
+기준 시간(SLACK_TO_NOTION_PROFILE_THRESHOLD_MS) 이상 걸린 경우에만
+DEFAULT_PROFILE_DIR에 {도구}-{시각}-{인자 해시}.prof 파일로 저장한다.
+
+    SLACK_TO_NOTION_PROFILE=create_notion_page,format_messages   # 특정 도구만
+    SLACK_TO_NOTION_PROFILE=all                                  # 모든 도구
+
+저장된 파일은 python -m pstats 또는 snakeviz 등으로 분석한다.
+"""
+
+import cProfile
+import hashlib
+import json
+import logging
+import marshal
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "SLACK_TO_NOTION_PROFILE"
+PROFILE_THRESHOLD_ENV = "SLACK_TO_NOTION_PROFILE_THRESHOLD_MS"
+DEFAULT_PROFILE_DIR = Path(".claude/slack-to-notion/profiles")
+DEFAULT_THRESHOLD_MS = 1000.0
+# 프로파일 파일이 이 개수를 넘으면 오래된 것부터 삭제한다
+MAX_PROFILES = 100
+
+_ALL_TOOLS = {"all", "*", "1", "true"}
+_DISABLED = nullcontext()
+
+
+class _Settings:
+    def __init__(self, tools: set[str] | None, threshold_ms: float, directory: Path):
+        self.tools = tools
+        self.threshold_ms = threshold_ms
+        self.directory = directory
+
+
+# 현재 설정 (None이면 비활성)
+_settings: _Settings | None = None
+# cProfile은 동시에 하나만 켤 수 있으므로 프로파일링 중인 도구가 있으면 나머지는 측정하지 않는다
+_profiler_lock = threading.Lock()
+
+
+def configure(
+    tools: str | None = None,
+    threshold_ms: float | None = None,
+    directory: Path = DEFAULT_PROFILE_DIR,
+) -> bool:
+    """프로파일링을 설정한다.
+
+    Args:
+        tools: 쉼표로 구분한 도구 이름 또는 "all". 미지정 시 SLACK_TO_NOTION_PROFILE 환경변수 사용
+        threshold_ms: 저장 기준 실행 시간 (밀리초). 미지정 시 SLACK_TO_NOTION_PROFILE_THRESHOLD_MS
+            환경변수, 없으면 DEFAULT_THRESHOLD_MS
+        directory: 프로파일 저장 디렉토리
+
+    Returns:
+        프로파일링이 켜졌는지 여부
+
+    Raises:
+        ValueError: 기준 시간이 숫자가 아닌 경우
+    """
+    global _settings
+    if tools is None:
+        tools = os.environ.get(PROFILE_ENV, "")
+    names = {name.strip() for name in tools.split(",") if name.strip()}
+    if not names or names & {"0", "off", "false", "none"}:
+        _settings = None
+        return False
+
+    if threshold_ms is None:
+        raw = os.environ.get(PROFILE_THRESHOLD_ENV, "").strip()
+        try:
+            threshold_ms = float(raw) if raw else DEFAULT_THRESHOLD_MS
+        except ValueError:
+            raise ValueError(f"{PROFILE_THRESHOLD_ENV} 값은 숫자(밀리초)여야 합니다: {raw}") from None
+
+    _settings = _Settings(
+        None if names & _ALL_TOOLS else names,
+        threshold_ms,
+        directory,
+    )
+    return True
+
+
+def enabled() -> bool:
+    """프로파일링이 켜져 있는지 여부."""
+    return _settings is not None
+
+
+def profile(tool_name: str, args: tuple = (), kwargs: dict | None = None):
+    """도구 실행을 프로파일링하는 context manager를 반환한다.
+
+    프로파일링이 꺼져 있거나 대상 도구가 아니면 아무 일도 하지 않는다.
+    """
+    settings = _settings
+    if settings is None or (settings.tools is not None and tool_name not in settings.tools):
+        return _DISABLED
+    return _profile(settings, tool_name, args, kwargs or {})
+
+
+@contextmanager
+def _profile(settings: _Settings, tool_name: str, args: tuple, kwargs: dict):
+    if not _profiler_lock.acquire(blocking=False):
+        logger.debug("다른 도구를 프로파일링 중이라 %s는 측정하지 않습니다", tool_name)
+        yield
+        return
+
+    try:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일러(디버거 등)가 이미 켜져 있는 경우
+            logger.debug("프로파일러를 켤 수 없어 %s는 측정하지 않습니다", tool_name)
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms >= settings.threshold_ms:
+                _save(profiler, settings.directory, tool_name, args, kwargs, elapsed_ms)
+    finally:
+        _profiler_lock.release()
+
+
+def _args_hash(args: tuple, kwargs: dict) -> str:
+    """인자 내용을 파일 이름에 남기지 않도록 해시로 변환한다."""
+    payload = json.dumps({"args": args, "kwargs": kwargs}, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+
+
+def _save(
+    profiler: cProfile.Profile,
+    directory: Path,
+    tool_name: str,
+    args: tuple,
+    kwargs: dict,
+    elapsed_ms: float,
+) -> None:
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    stem = f"{tool_name}-{timestamp}-{_args_hash(args, kwargs)}"
+    path = directory / f"{stem}.prof"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        profiler.create_stats()
+        # 같은 이름의 파일이 있으면 (다른 스레드가 같은 시각에 저장한 경우 포함) 번호를 붙여 새로 만든다
+        suffix = 1
+        while True:
+            try:
+                with open(path, "xb") as f:
+                    marshal.dump(profiler.stats, f)
+                break
+            except FileExistsError:
+                path = directory / f"{stem}-{suffix}.prof"
+                suffix += 1
+        _prune(directory)
+    except OSError as e:
+        logger.warning("프로파일 저장 실패 (%s): %s", path, e)
+        return
+    logger.info("도구 %s 프로파일 저장 (%.0fms): %s", tool_name, elapsed_ms, path)
+
+
+def _prune(directory: Path) -> None:
+    """MAX_PROFILES개를 넘는 오래된 프로파일을 삭제한다."""
+    profiles = []
+    for path in directory.glob("*.prof"):
+        try:
+            profiles.append((path.stat().st_mtime, path.name, path))
+        except FileNotFoundError:
+            # 다른 스레드의 정리에서 이미 삭제된 파일
+            continue
+    profiles.sort()
+    for _, _, path in profiles[: max(0, len(profiles) - MAX_PROFILES)]:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,131 @@
+"""진행 상황 보고와 협조적 취소 모듈.
+
+오래 걸리는 작업(스레드 수집, 사용자 상태 확인, 블록 추가 등)은 반복마다
+report()로 진행 상황을 알리고 check_cancelled()로 취소 여부를 확인한다.
+MCP 도구로 실행되면 mcp_server가 현재 작업에 ProgressReporter를 설정해
+진행 알림(notifications/progress)을 보내고, 클라이언트가 요청을 취소하면
+다음 확인 지점에서 OperationCancelled를 발생시킨다.
+설정된 reporter가 없으면 모든 함수가 아무 일도 하지 않는다.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 진행 알림을 보내는 최소 간격 (초). 마지막 단계(progress == total)는 항상 보낸다
+MIN_REPORT_INTERVAL = 0.2
+
+
+class OperationCancelled(Exception):
+    """작업이 취소된 경우."""
+
+    def __init__(self, message: str = "작업이 취소되었습니다."):
+        self.message = message
+        super().__init__(message)
+
+
+class ProgressReporter:
+    """작업 하나의 진행 상황을 전달하고 취소 요청을 기록한다.
+
+    Args:
+        send: (progress, total, message)를 받아 진행 상황을 전달하는 함수. None이면 보내지 않는다
+        cancel_event: 취소 여부를 공유할 이벤트. None이면 새로 만든다
+    """
+
+    def __init__(
+        self,
+        send: Callable[[float, float | None, str | None], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ):
+        self._send = send
+        self._cancel_event = cancel_event or threading.Event()
+        self._lock = threading.Lock()
+        self._last_sent = 0.0
+        # MCP 진행 값은 계속 증가해야 하므로 단계가 바뀌면 이전 단계까지의 값을 더해 보낸다
+        self._offset = 0.0
+        self._last: tuple[float, float | None] = (0.0, None)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """취소를 요청한다. 작업은 다음 확인 지점에서 멈춘다."""
+        self._cancel_event.set()
+
+    def check_cancelled(self) -> None:
+        """취소가 요청되었으면 OperationCancelled를 발생시킨다."""
+        if self._cancel_event.is_set():
+            raise OperationCancelled()
+
+    def report(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        """진행 상황을 알린다. 취소가 요청되었으면 OperationCancelled를 발생시킨다.
+
+        한 작업이 여러 단계(메시지 수집 → 스레드 수집 등)로 나뉘어 total이 바뀌거나 progress가
+        줄어들면 새 단계로 보고, 이전 단계의 진행 값을 더해 알림 값이 줄어들지 않게 한다.
+        """
+        self.check_cancelled()
+        if self._send is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            last_progress, last_total = self._last
+            if total != last_total or progress < last_progress:
+                self._offset += last_progress
+            self._last = (progress, total)
+            if now - self._last_sent < MIN_REPORT_INTERVAL and progress != total:
+                return
+            self._last_sent = now
+            value = self._offset + progress
+            total = None if total is None else self._offset + total
+        try:
+            self._send(value, total, message)
+        except Exception as e:
+            # 진행 알림 실패로 작업을 멈추지 않는다
+            logger.debug("진행 알림 전송 실패: %s", e)
+
+    def quiet(self) -> "ProgressReporter":
+        """취소 여부만 공유하고 진행 알림은 보내지 않는 reporter를 반환한다.
+
+        병렬 작업 스레드가 각자 진행 상황을 보내면 값이 뒤섞이므로,
+        작업 스레드에는 이 reporter를 설정하고 진행 알림은 조정 스레드에서 보낸다.
+        """
+        return ProgressReporter(cancel_event=self._cancel_event)
+
+
+# 설정된 reporter가 없을 때 사용한다. 취소되지 않고 알림도 보내지 않는다
+_NOOP = ProgressReporter()
+
+_current: contextvars.ContextVar[ProgressReporter] = contextvars.ContextVar(
+    "slack_to_notion_progress", default=_NOOP,
+)
+
+
+def current() -> ProgressReporter:
+    """현재 작업의 reporter를 반환한다."""
+    return _current.get()
+
+
+@contextmanager
+def use(reporter: ProgressReporter):
+    """with 블록 안에서 reporter를 현재 작업의 reporter로 설정한다."""
+    token = _current.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current.reset(token)
+
+
+def report(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """현재 작업의 진행 상황을 알린다. 취소가 요청되었으면 OperationCancelled를 발생시킨다."""
+    _current.get().report(progress, total, message)
+
+
+def check_cancelled() -> None:
+    """현재 작업의 취소가 요청되었으면 OperationCancelled를 발생시킨다."""
+    _current.get().check_cancelled()
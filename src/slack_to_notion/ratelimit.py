@@ -0,0 +1,145 @@
+"""API 호출 속도 제한 모듈.
+
+여러 스레드가 동시에 API를 호출해도 정해진 속도를 넘지 않도록 토큰 버킷으로 조절한다.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 429 응답 시 호출 속도를 줄이는 비율과, 성공 시 최대 속도로 회복하는 비율
+_DECREASE_FACTOR = 0.5
+_RECOVERY_STEP = 0.05
+# 속도를 줄여도 유지하는 최대 속도 대비 최소 비율
+_MIN_RATE_RATIO = 0.05
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷.
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 대기한 뒤 하나를 소비한다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """버킷 초기화.
+
+        Args:
+            rate: 초당 허용 호출 수
+            capacity: 순간 허용 호출 수 (미지정 시 rate와 같음, 최소 1)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """토큰 하나를 소비한다. 토큰이 없으면 채워질 때까지 대기한다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def set_rate(self, rate: float) -> None:
+        """초당 허용 호출 수를 변경한다. 이미 쌓인 토큰은 유지한다."""
+        with self._lock:
+            self._refill(max(time.monotonic(), self._updated_at))
+            self.rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """지정한 시간 동안 토큰 발급을 멈추고 쌓인 토큰을 비운다."""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._updated_at = self._blocked_until
+
+
+class RateLimitScheduler:
+    """API 메서드별 토큰 버킷 스케줄러.
+
+    메서드마다 허용 속도(티어)가 다른 API에서 호출 전에 acquire()로 속도를 맞춘다.
+    rate limit 응답을 받으면 해당 메서드를 Retry-After 동안 멈추고 속도를 절반으로 줄이며,
+    이후 성공할 때마다 조금씩 원래 속도로 회복한다.
+    """
+
+    def __init__(self, rates: dict[str, float], default_rate: float, burst: float):
+        """스케줄러 초기화.
+
+        Args:
+            rates: {메서드 이름: 초당 허용 호출 수}
+            default_rate: rates에 없는 메서드의 초당 허용 호출 수
+            burst: 메서드별 순간 허용 호출 수 상한
+        """
+        self.rates = dict(rates)
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _max_rate(self, method: str) -> float:
+        return self.rates.get(method, self.default_rate)
+
+    def bucket(self, method: str) -> TokenBucket:
+        """메서드의 토큰 버킷을 반환한다. 없으면 생성한다."""
+        with self._lock:
+            bucket = self._buckets.get(method)
+            if bucket is None:
+                rate = self._max_rate(method)
+                # 분당 허용량보다 큰 버스트는 허용하지 않는다
+                bucket = TokenBucket(rate, min(self.burst, rate * 60))
+                self._buckets[method] = bucket
+            return bucket
+
+    def acquire(self, method: str) -> float:
+        """메서드 호출 전에 토큰을 받는다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        return self.bucket(method).acquire()
+
+    def record_success(self, method: str) -> None:
+        """호출 성공을 기록하고 줄어든 속도를 조금씩 회복한다."""
+        bucket = self.bucket(method)
+        max_rate = self._max_rate(method)
+        if bucket.rate < max_rate:
+            bucket.set_rate(min(max_rate, bucket.rate + max_rate * _RECOVERY_STEP))
+
+    def record_rate_limited(self, method: str, retry_after: float) -> None:
+        """rate limit 응답을 기록한다.
+
+        Args:
+            method: API 메서드 이름
+            retry_after: 응답의 Retry-After 값 (초)
+        """
+        bucket = self.bucket(method)
+        max_rate = self._max_rate(method)
+        new_rate = max(max_rate * _MIN_RATE_RATIO, bucket.rate * _DECREASE_FACTOR)
+        bucket.pause(retry_after)
+        bucket.set_rate(new_rate)
+        logger.warning(
+            "%s rate limit — %.1f초 대기 후 초당 %.2f회로 조정", method, retry_after, new_rate,
+        )
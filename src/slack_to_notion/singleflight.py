@@ -0,0 +1,91 @@
+"""동일 요청 병합 모듈.
+
+여러 스레드가 같은 요청을 동시에 보내면 하나만 실제로 실행하고
+나머지는 그 결과를 함께 받도록 한다. 호출자가 결과를 수정한다면 clone으로 대기한 호출마다 복사본을 받는다.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+
+
+class _Call:
+    """진행 중인 요청 하나의 상태."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+        # 대기한 호출에 나눠 줄 결과 복사본 (clone을 지정한 경우)
+        self.copies: list | None = None
+
+
+class SingleFlight:
+    """키별 진행 중 요청 병합기.
+
+    같은 키로 진행 중인 요청이 있으면 새로 실행하지 않고 완료를 기다려
+    같은 결과(또는 같은 예외)를 반환한다. 완료된 결과는 보관하지 않는다.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], object],
+        clone: Callable[[object], object] | None = None,
+    ) -> tuple[object, bool]:
+        """key에 해당하는 요청을 실행하거나 진행 중인 요청의 결과를 기다린다.
+
+        clone을 지정하면 실행한 호출은 원본을, 대기한 호출은 각자의 복사본을 받는다.
+        복사본은 실행한 호출이 반환하기 전에 만들므로 반환 후 원본을 수정해도 다른 호출에 영향이 없다.
+
+        Args:
+            key: 요청 식별 키
+            func: 실제 요청을 수행하는 함수
+            clone: 결과 복사 함수 (예: copy.deepcopy)
+
+        Returns:
+            (결과, 다른 요청과 결과를 공유했는지 여부)
+
+        Raises:
+            func가 발생시킨 예외 (대기하던 호출에도 같은 예외가 전달된다)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if call.copies is not None:
+                return call.copies.pop(), True
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            raise
+
+        try:
+            # 키를 지운 뒤에는 대기하는 호출이 더 늘지 않는다
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            if clone is not None and waiters:
+                call.copies = [clone(call.result) for _ in range(waiters)]
+        finally:
+            call.done.set()
+        return call.result, waiters > 0
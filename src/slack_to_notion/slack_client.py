@@ -3,60 +3,356 @@
 slack_sdk를 사용하여 채널 메시지와 스레드를 수집한다.
 """
 
+import copy
+import hashlib
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
-
-class SlackClientError(Exception):
-    """Slack 클라이언트 에러."""
-
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
+from . import progress, tracing
+from .errors import SlackClientError
+from .message_store import MessageStore
+from .metrics import metrics, response_size
+from .ratelimit import RateLimitScheduler
+from .singleflight import SingleFlight
+from .text_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".claude/slack-to-notion/cache")
+
+# 채널 디렉토리 캐시 유효 시간 (초)
+CHANNEL_CACHE_TTL = 60 * 60
+# 사용자 이름 디스크 캐시 유효 시간 (초, 7일)
+USER_CACHE_TTL = 7 * 24 * 60 * 60
+# 이름 조회 실패 시 재조회를 허용하는 최소 간격 (초)
+CHANNEL_MISS_REFRESH_INTERVAL = 5 * 60
+
+# Slack API 메서드별 초당 허용 호출 수 (Tier 2: 분당 20회, Tier 3: 50회, Tier 4: 100회)
+SLACK_METHOD_RATES = {
+    "conversations.history": 50 / 60,
+    "conversations.replies": 50 / 60,
+    "conversations.info": 50 / 60,
+    "conversations.list": 20 / 60,
+    "users.info": 100 / 60,
+    "users.getPresence": 50 / 60,
+    "users.list": 20 / 60,
+}
+# 목록에 없는 메서드는 Tier 2로 취급
+DEFAULT_METHOD_RATE = 20 / 60
+RATE_LIMIT_BURST = 20
+# 여러 채널/사용자를 동시에 조회할 때 기본 작업 스레드 수
+DEFAULT_MAX_WORKERS = 4
+# 메모리에 보관하는 스레드 답글 캐시 최대 개수
+THREAD_CACHE_SIZE = 256
+
+
+def _copy_response(response):
+    """API 응답 복사본. SlackResponse는 클라이언트 참조는 공유하고 본문(data)만 깊은 복사한다."""
+    if not hasattr(response, "data"):
+        return copy.deepcopy(response)
+    clone = copy.copy(response)
+    clone.data = copy.deepcopy(response.data)
+    return clone
+
+
+class AdaptiveRateLimitRetryHandler(RateLimitErrorRetryHandler):
+    """429 응답의 Retry-After를 스케줄러에 알리는 재시도 핸들러.
+
+    같은 메서드를 호출하려는 다른 스레드도 Retry-After 동안 대기하고,
+    이후 해당 메서드의 호출 속도가 줄어든다.
+    """
+
+    def __init__(self, scheduler: RateLimitScheduler, max_retry_count: int = 3):
+        super().__init__(max_retry_count=max_retry_count)
+        self.scheduler = scheduler
+
+    def prepare_for_next_attempt(self, *, state, request, response=None, error=None) -> None:
+        if response is None:
+            raise error
+
+        retry_after = 1.0
+        for key, value in response.headers.items():
+            if key.lower() == "retry-after":
+                try:
+                    retry_after = float(value[0] if isinstance(value, list) else value)
+                except (TypeError, ValueError):
+                    pass
+                break
+        method = request.url.split("?", 1)[0].rsplit("/", 1)[-1]
+        self.scheduler.record_rate_limited(method, retry_after)
+        metrics.record_retry("slack", method)
+        tracing.current_span().add_event("rate_limited", {"retry_after": retry_after})
+
+        state.next_attempt_requested = True
+        time.sleep(retry_after + random.random())
+        state.increment_current_attempt()
 
 
 class SlackClient:
     """Slack API 클라이언트."""
 
-    def __init__(self, token: str, token_type: str = "bot"):
+    def __init__(
+        self,
+        token: str,
+        token_type: str = "bot",
+        cache_dir: Path | None = None,
+        channel_cache_ttl: float = CHANNEL_CACHE_TTL,
+        base_url: str | None = None,
+        store_messages: bool = False,
+        message_max_age_days: float | None = None,
+        message_max_bytes: int | None = None,
+    ):
         """클라이언트 초기화.
 
         Args:
             token: Slack 토큰 (봇 또는 사용자)
             token_type: 토큰 타입 ("bot" 또는 "user", 기본값 "bot")
+            cache_dir: 디스크 캐시 디렉토리 (미지정 시 메모리 캐시만 사용)
+            channel_cache_ttl: 채널 디렉토리 캐시 유효 시간 (초)
+            base_url: Slack API 주소 (미지정 시 https://slack.com/api/, 벤치마크용 가짜 서버 등에 사용)
+            store_messages: 수집한 메시지를 cache_dir의 로컬 검색 저장소에 기록할지 여부
+            message_max_age_days: 로컬 저장소의 메시지 보존 기간 (일, None이면 제한 없음)
+            message_max_bytes: 로컬 저장소 최대 크기 (바이트, None이면 제한 없음)
         """
-        self.client = WebClient(token=token)
+        if base_url:
+            self.client = WebClient(token=token, base_url=base_url)
+        else:
+            self.client = WebClient(token=token)
         self.token_type = token_type
+        self.cache_dir = cache_dir
+        self.channel_cache_ttl = channel_cache_ttl
         self._user_cache: dict[str, str] = {}
-        retry_handler = RateLimitErrorRetryHandler(max_retry_count=3)
+        self._user_lock = threading.Lock()
+        self._user_cache_loaded = False
+        # 모든 API 호출이 공유하는 메서드별 호출 속도 제한
+        self.scheduler = RateLimitScheduler(SLACK_METHOD_RATES, DEFAULT_METHOD_RATE, RATE_LIMIT_BURST)
+        # 동시에 들어온 동일 요청은 한 번만 호출한다
+        self._inflight = SingleFlight()
+        # 스레드 답글 캐시: (채널 ID, thread_ts, latest_reply) → 메시지 리스트
+        self._thread_cache: OrderedDict[tuple[str, str, str], list[dict]] = OrderedDict()
+        self._thread_lock = threading.Lock()
+        # 토큰별 캐시 구분용 키 (토큰 원문은 디스크에 남기지 않는다)
+        self._token_key = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        # scope 확인 결과 ("public_channel,private_channel" 또는 "public_channel")
+        self._channel_types: str | None = None
+        self._channels: list[dict] | None = None
+        self._channels_fetched_at = 0.0
+        self._channel_name_index: dict[str, str] = {}
+        self._channel_id_index: dict[str, dict] = {}
+        # conversations.info 결과 캐시: 채널 ID → (조회 시각, 채널 정보)
+        self._channel_info: dict[str, tuple[float, dict]] = {}
+        self._channel_lock = threading.Lock()
+        self._channel_search_index: TrigramIndex | None = None
+        # 수집한 메시지를 저장하는 로컬 검색 저장소 (store_messages로 켠 경우에만)
+        self.message_store: MessageStore | None = None
+        if cache_dir is not None and store_messages:
+            self.message_store = MessageStore(
+                cache_dir / f"messages-{self._token_key}.db", message_max_age_days, message_max_bytes,
+            )
+        retry_handler = AdaptiveRateLimitRetryHandler(self.scheduler, max_retry_count=3)
         self.client.retry_handlers.append(retry_handler)
 
-    def list_channels(self) -> list[dict]:
+    def _call(self, method: str, **kwargs):
+        """스케줄러로 호출 속도를 맞춘 뒤 Slack API 메서드를 호출한다.
+
+        메서드와 인자가 같은 요청이 이미 진행 중이면 새로 호출하지 않고
+        그 응답을 함께 사용한다. 모든 호출이 조회 API이므로 결과를 공유해도 안전하다.
+
+        Args:
+            method: API 메서드 이름 (예: "conversations.history")
+            **kwargs: API 인자
+
+        Returns:
+            API 응답
+
+        Raises:
+            SlackApiError: API 호출 실패 시
+        """
+        def call():
+            with tracing.span(f"slack {method}", {"rpc.system": "slack", "rpc.method": method}) as span:
+                span.set_attribute("slack.scheduler_wait_ms", round(self.scheduler.acquire(method) * 1000, 1))
+                start = time.perf_counter()
+                try:
+                    response = getattr(self.client, method.replace(".", "_"))(**kwargs)
+                except SlackApiError as e:
+                    metrics.record_api_call("slack", method, time.perf_counter() - start, error=True)
+                    span.set_attribute("http.status_code", getattr(e.response, "status_code", 0))
+                    span.set_error(str(e.response.get("error", "")))
+                    raise
+                size = response_size(getattr(response, "headers", None), getattr(response, "data", response))
+                metrics.record_api_call("slack", method, time.perf_counter() - start, size=size)
+                span.set_attribute("http.response_size", size)
+                span.set_attribute("slack.paginated", "cursor" in kwargs)
+                self.scheduler.record_success(method)
+                return response
+
+        key = (method, json.dumps(kwargs, sort_keys=True, default=str))
+        # 호출자가 응답의 메시지를 수정하므로 (user_name 채우기 등) 병합된 호출은 각자 복사본을 받는다
+        response, shared = self._inflight.do(key, call, clone=_copy_response)
+        if shared:
+            logger.debug("동일 요청 병합: %s", method)
+        metrics.record_cache("slack.inflight", hits=int(shared), misses=int(not shared))
+        return response
+
+    def list_channels(self, refresh: bool = False) -> list[dict]:
         """채널 목록 조회.
 
+        메모리 → 디스크 캐시 순으로 확인하고, 유효 시간(channel_cache_ttl)이
+        지났거나 refresh=True이면 API로 전체 목록을 다시 조회한다.
+
+        Args:
+            refresh: True이면 캐시를 무시하고 다시 조회
+
         Returns:
             채널 정보 리스트 [{"id", "name", "topic", "num_members"}]
 
         Raises:
             SlackClientError: API 호출 실패 시
         """
+        if not refresh:
+            if self._channels is None:
+                self._load_channel_cache()
+            if self._channels is not None and not self._is_channel_cache_expired():
+                metrics.record_cache("slack.channels", hits=1)
+                return list(self._channels)
+
+        metrics.record_cache("slack.channels", misses=1)
+        channels = self._fetch_channels()
+        self._set_channels(channels, time.time())
+        self._save_channel_cache()
+        return list(channels)
+
+    def find_channel(self, name: str) -> dict | None:
+        """채널 이름으로 채널 정보를 찾는다.
+
+        캐시된 채널 디렉토리의 이름 인덱스를 사용한다. 찾지 못하면
+        마지막 조회 후 CHANNEL_MISS_REFRESH_INTERVAL이 지난 경우에만 한 번 다시 조회한다.
+
+        Args:
+            name: 채널 이름 (앞의 # 허용, 대소문자 무시)
+
+        Returns:
+            채널 정보 dict. 없으면 None.
+
+        Raises:
+            SlackClientError: API 호출 실패 시
+        """
+        key = name.strip().lstrip("#").lower()
+        self.list_channels()
+        channel_id = self._channel_name_index.get(key)
+
+        if channel_id is None:
+            if time.time() - self._channels_fetched_at < CHANNEL_MISS_REFRESH_INTERVAL:
+                return None
+            self.list_channels(refresh=True)
+            channel_id = self._channel_name_index.get(key)
+            if channel_id is None:
+                return None
+
+        for channel in self._channels or []:
+            if channel["id"] == channel_id:
+                return dict(channel)
+        return None
+
+    def get_cached_channel_name(self, channel_id: str) -> str | None:
+        """캐시된 채널 정보에서 채널 이름을 찾는다. API는 호출하지 않는다.
+
+        유효 시간 안의 채널 상세 정보 캐시를 먼저 확인하고, 없으면 채널 디렉토리를 사용한다.
+        """
+        info = self._get_cached_channel_info(channel_id)
+        if info is not None:
+            return info.get("name")
+        if self._channels is None:
+            self._load_channel_cache()
+        channel = self._channel_id_index.get(channel_id)
+        return channel["name"] if channel else None
+
+    def get_channel_name(self, channel_id: str) -> str:
+        """채널 ID를 채널 이름으로 변환.
+
+        캐시에 없으면 conversations.info로 조회한다. 조회에 실패하면 채널 ID를 반환한다.
+        """
+        name = self.get_cached_channel_name(channel_id)
+        if name:
+            return name
+        try:
+            return self.fetch_channel_info(channel_id).get("name") or channel_id
+        except SlackClientError:
+            return channel_id
+
+    def search_channels(self, query: str, limit: int = 10) -> list[dict]:
+        """채널 이름/주제로 퍼지 검색한다.
+
+        캐시된 채널 디렉토리로 만든 트라이그램 인덱스를 사용하며,
+        채널 디렉토리가 갱신되면 인덱스도 다시 만든다.
+
+        Args:
+            query: 검색어 (오타, 일부 단어 허용)
+            limit: 반환할 최대 건수
+
+        Returns:
+            채널 정보 리스트. 각 항목에 "score" 필드가 추가된다.
+
+        Raises:
+            SlackClientError: API 호출 실패 시
+        """
+        self.list_channels()
+        if self._channel_search_index is None:
+            index = TrigramIndex()
+            for channel in self._channels or []:
+                index.add(channel["id"], channel["name"], weight=1.0, payload=channel)
+                index.add(channel["id"], channel.get("topic", ""), weight=0.6)
+            self._channel_search_index = index
+
+        return [
+            {**channel, "score": score}
+            for score, channel in self._channel_search_index.search(query, limit)
+        ]
+
+    def _resolve_channel_types(self) -> str:
+        """조회 가능한 채널 타입을 확인한다.
+
+        groups:read 권한이 없으면 공개 채널만 조회한다.
+        결과는 토큰이 유지되는 동안 재사용한다.
+        """
+        if self._channel_types is not None:
+            return self._channel_types
+
+        types = "public_channel,private_channel"
+        try:
+            # 비공개 채널 포함 조회 시도
+            self._call("conversations.list", types=types, limit=1)
+        except SlackApiError as e:
+            if e.response.get("error") == "missing_scope":
+                types = "public_channel"
+            else:
+                raise
+
+        self._channel_types = types
+        return types
+
+    def _fetch_channels(self) -> list[dict]:
+        """API로 전체 채널 목록을 조회한다."""
         try:
             channels = []
             cursor = None
-            types = "public_channel,private_channel"
-
-            try:
-                # 비공개 채널 포함 조회 시도
-                self.client.conversations_list(types=types, limit=1)
-            except SlackApiError as e:
-                if e.response.get("error") == "missing_scope":
-                    types = "public_channel"
-                else:
-                    raise
+            types = self._resolve_channel_types()
 
             while True:
-                response = self.client.conversations_list(
+                response = self._call(
+                    "conversations.list",
                     types=types,
                     cursor=cursor,
                     limit=200,
@@ -79,36 +375,240 @@ class SlackClient:
         except SlackApiError as e:
             raise SlackClientError(self._format_error_message(e)) from e
 
+    def _set_channels(self, channels: list[dict], fetched_at: float) -> None:
+        """채널 디렉토리와 이름 인덱스를 갱신한다."""
+        self._channels = channels
+        self._channels_fetched_at = fetched_at
+        self._channel_name_index = {c["name"].lower(): c["id"] for c in channels}
+        self._channel_id_index = {c["id"]: c for c in channels}
+        self._channel_search_index = None
+        # 디렉토리보다 먼저 조회한 상세 정보는 이름이 바뀌었을 수 있으므로 버린다
+        with self._channel_lock:
+            self._channel_info = {
+                cid: entry for cid, entry in self._channel_info.items() if entry[0] >= fetched_at
+            }
+
+    def _is_channel_cache_expired(self) -> bool:
+        return time.time() - self._channels_fetched_at > self.channel_cache_ttl
+
+    def _channel_cache_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"channels-{self._token_key}.json"
+
+    def _load_channel_cache(self) -> None:
+        """디스크 캐시에서 채널 디렉토리와 scope 확인 결과를 불러온다.
+
+        파일이 없거나 손상된 경우 무시한다.
+        """
+        path = self._channel_cache_path()
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if self._channel_types is None and data.get("types"):
+                self._channel_types = data["types"]
+            self._set_channels(data["channels"], float(data["fetched_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+    def _save_channel_cache(self) -> None:
+        """채널 디렉토리를 디스크 캐시에 저장한다. 실패해도 조회 결과에는 영향이 없다."""
+        path = self._channel_cache_path()
+        if path is None or self._channels is None:
+            return
+        data = {
+            "fetched_at": self._channels_fetched_at,
+            "types": self._channel_types,
+            "channels": self._channels,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+    def _user_cache_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"users-{self._token_key}.json"
+
+    def _load_user_cache(self) -> int:
+        """디스크 캐시의 사용자 이름을 메모리 캐시에 불러온다 (처음 한 번만).
+
+        유효 시간(USER_CACHE_TTL)이 지났거나 파일이 손상된 경우 무시한다.
+
+        Returns:
+            불러온 사용자 수
+        """
+        with self._user_lock:
+            if self._user_cache_loaded:
+                return 0
+            self._user_cache_loaded = True
+        path = self._user_cache_path()
+        if path is None or not path.exists():
+            return 0
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - float(data["fetched_at"]) > USER_CACHE_TTL:
+                return 0
+            users = {str(uid): str(name) for uid, name in data["users"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return 0
+        with self._user_lock:
+            for uid, name in users.items():
+                # 이번 실행에서 조회한 이름이 더 최신이다
+                self._user_cache.setdefault(uid, name)
+        return len(users)
+
+    def _save_user_cache(self) -> None:
+        """사용자 이름 캐시를 디스크에 저장한다. 실패해도 조회 결과에는 영향이 없다."""
+        path = self._user_cache_path()
+        if path is None:
+            return
+        with self._user_lock:
+            # 조회에 실패해 ID를 그대로 쓴 항목은 다음 실행에서 다시 조회하도록 저장하지 않는다
+            users = {uid: name for uid, name in self._user_cache.items() if isinstance(name, str) and name != uid}
+        data = {"fetched_at": time.time(), "users": users}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+    def warm_up(self) -> dict:
+        """첫 도구 호출이 빠르도록 토큰 확인과 캐시 로드를 미리 수행한다.
+
+        auth.test로 토큰을 확인하고, 디스크의 사용자 이름 캐시와 채널 디렉토리를 불러온다.
+        채널 디렉토리는 디스크 캐시만 불러오며, 없거나 만료되었어도 API로 다시 조회하지 않는다
+        (전체 채널 조회는 오래 걸려 같은 요청을 기다리는 도구 호출을 막으므로 첫 사용 시점에 한다).
+
+        Returns:
+            {"team", "user", "channels", "cached_users"}
+
+        Raises:
+            SlackClientError: 토큰이 유효하지 않거나 API 호출 실패 시
+        """
+        try:
+            auth = self._call("auth.test")
+        except SlackApiError as e:
+            raise SlackClientError(self._format_error_message(e)) from e
+        cached_users = self._load_user_cache()
+        if self._channels is None:
+            self._load_channel_cache()
+        return {
+            "team": auth.get("team", ""),
+            "user": auth.get("user", ""),
+            "channels": len(self._channels or []),
+            "cached_users": cached_users,
+        }
+
+    @metrics.timed("slack.fetch_channel_messages")
     def fetch_channel_messages(
         self,
         channel_id: str,
         limit: int = 100,
         oldest: str | None = None,
+        latest: str | None = None,
     ) -> list[dict]:
         """채널 메시지 조회.
 
+        oldest/latest 범위는 Slack API에 그대로 전달되므로 범위 밖 메시지는 받지 않는다.
+        한 페이지에 limit개를 다 받지 못하면 커서로 다음 페이지를 이어서 조회하고,
+        limit에 도달하거나 범위 끝(has_more=False)에 닿으면 멈춘다.
+        페이지마다 진행 상황을 알리고 취소 여부를 확인한다.
+
         Args:
             channel_id: 채널 ID
-            limit: 조회할 메시지 수
+            limit: 조회할 최대 메시지 수
             oldest: 시작 타임스탬프 (해당 시점 이후 메시지만 조회)
+            latest: 종료 타임스탬프 (해당 시점 이전 메시지만 조회)
 
         Returns:
-            메시지 리스트
+            메시지 리스트 (최신순)
 
         Raises:
             SlackClientError: API 호출 실패 시
+            OperationCancelled: 작업이 취소된 경우
         """
         try:
-            kwargs = {"channel": channel_id, "limit": limit}
-            if oldest:
-                kwargs["oldest"] = oldest
+            messages: list[dict] = []
+            cursor = None
+            pages = 0
+            while True:
+                kwargs = {"channel": channel_id, "limit": limit - len(messages)}
+                if oldest:
+                    kwargs["oldest"] = oldest
+                if latest:
+                    kwargs["latest"] = latest
+                if cursor:
+                    kwargs["cursor"] = cursor
+
+                response = self._call("conversations.history", **kwargs)
+                pages += 1
+                messages.extend(response["messages"])
+                progress.report(len(messages), limit, f"메시지 {len(messages)}개 수집 ({pages}페이지)")
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not response.get("has_more") or not cursor or len(messages) >= limit:
+                    break
 
-            response = self.client.conversations_history(**kwargs)
-            return response["messages"]
+            span = tracing.current_span()
+            span.set_attribute("slack.pages", pages)
+            span.set_attribute("slack.messages", len(messages))
+            self._store_messages(channel_id, messages)
+            return messages
 
         except SlackApiError as e:
             raise SlackClientError(self._format_error_message(e)) from e
 
+    def fetch_channels_messages(
+        self,
+        channel_ids: list[str],
+        limit: int = 100,
+        oldest: str | None = None,
+        latest: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, list[dict] | SlackClientError]:
+        """여러 채널의 메시지를 동시에 조회.
+
+        채널별 조회는 작업 스레드에서 병렬로 수행하며, 호출 속도는 클라이언트의
+        속도 제한을 공유한다. 한 채널이 실패해도 나머지 채널 결과는 반환한다.
+        진행 상황은 완료된 채널 수로 알린다.
+
+        Args:
+            channel_ids: 채널 ID 리스트
+            limit: 채널별 조회할 최대 메시지 수
+            oldest: 시작 타임스탬프
+            latest: 종료 타임스탬프
+            max_workers: 동시에 조회할 최대 채널 수
+
+        Returns:
+            {채널 ID: 메시지 리스트 또는 SlackClientError} (입력 순서 유지)
+        """
+        unique_ids = list(dict.fromkeys(channel_ids))
+        reporter = progress.current()
+        # 채널이 하나면 페이지 단위 진행 상황을 그대로 보내고, 여러 채널이면 완료된 채널 수로만 알린다
+        worker_reporter = reporter if len(unique_ids) == 1 else reporter.quiet()
+
+        def fetch(channel_id: str) -> list[dict] | SlackClientError:
+            with progress.use(worker_reporter):
+                try:
+                    return self.fetch_channel_messages(channel_id, limit, oldest, latest)
+                except SlackClientError as e:
+                    return e
+
+        workers = max(1, min(max_workers, len(unique_ids)))
+        results: dict[str, list[dict] | SlackClientError] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for channel_id, result in zip(unique_ids, executor.map(tracing.propagate(fetch), unique_ids)):
+                results[channel_id] = result
+                reporter.report(len(results), len(unique_ids), f"채널 {len(results)}/{len(unique_ids)}개 수집")
+        return results
+
     def fetch_thread_replies(self, channel_id: str, thread_ts: str) -> list[dict]:
         """스레드 메시지 조회.
 
@@ -123,20 +623,141 @@ class SlackClient:
             SlackClientError: API 호출 실패 시
         """
         try:
-            response = self.client.conversations_replies(
+            response = self._call(
+                "conversations.replies",
                 channel=channel_id,
                 ts=thread_ts,
             )
-            return response["messages"]
+            messages = response["messages"]
+            self._store_messages(channel_id, messages)
+            return messages
 
         except SlackApiError as e:
             raise SlackClientError(self._format_error_message(e)) from e
 
-    def fetch_channel_info(self, channel_id: str) -> dict:
+    @metrics.timed("slack.fetch_threads_replies")
+    def fetch_threads_replies(
+        self,
+        channel_id: str,
+        parents: list[dict],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, list[dict] | SlackClientError]:
+        """여러 스레드의 답글을 동시에 조회.
+
+        부모 메시지의 latest_reply가 같으면 이전에 조회한 결과를 재사용하므로,
+        새 답글이 달린 스레드만 다시 조회한다. 진행 상황은 완료된 스레드 수로 알리며,
+        취소되면 아직 시작하지 않은 스레드는 조회하지 않는다.
+
+        Args:
+            channel_id: 채널 ID
+            parents: 스레드 부모 메시지 리스트 (ts, latest_reply 필드 사용)
+            max_workers: 동시에 조회할 최대 스레드 수
+
+        Returns:
+            {thread_ts: 스레드 메시지 리스트 또는 SlackClientError} (입력 순서 유지)
+
+        Raises:
+            OperationCancelled: 작업이 취소된 경우
+        """
+        reporter = progress.current()
+
+        def fetch(parent: dict) -> list[dict] | SlackClientError:
+            reporter.check_cancelled()
+            key = (channel_id, parent["ts"], parent.get("latest_reply", ""))
+            with self._thread_lock:
+                if key in self._thread_cache:
+                    self._thread_cache.move_to_end(key)
+                    metrics.record_cache("slack.threads", hits=1)
+                    # 호출자가 메시지를 수정해도 캐시에는 영향이 없도록 복사본을 반환한다
+                    return copy.deepcopy(self._thread_cache[key])
+            metrics.record_cache("slack.threads", misses=1)
+            try:
+                messages = self.fetch_thread_replies(channel_id, parent["ts"])
+            except SlackClientError as e:
+                return e
+            with self._thread_lock:
+                self._thread_cache[key] = copy.deepcopy(messages)
+                while len(self._thread_cache) > THREAD_CACHE_SIZE:
+                    self._thread_cache.popitem(last=False)
+            return messages
+
+        unique = list({parent["ts"]: parent for parent in parents}.values())
+        if not unique:
+            return {}
+        workers = max(1, min(max_workers, len(unique)))
+        results: dict[str, list[dict] | SlackClientError] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for parent, result in zip(unique, executor.map(tracing.propagate(fetch), unique)):
+                results[parent["ts"]] = result
+                reporter.report(len(results), len(unique), f"스레드 {len(results)}/{len(unique)}개 수집")
+        return results
+
+    def _store_messages(self, channel_id: str, messages: list[dict]) -> None:
+        """수집한 메시지를 로컬 검색 저장소에 기록한다. 실패해도 수집 결과에는 영향이 없다."""
+        if self.message_store is None or not messages:
+            return
+        try:
+            self.message_store.add_messages(channel_id, messages)
+        except (sqlite3.Error, OSError):
+            logger.warning("메시지 로컬 저장 실패 (channel=%s)", channel_id, exc_info=True)
+
+    def search_messages(
+        self,
+        query: str = "",
+        channel_id: str | None = None,
+        user: str | None = None,
+        oldest: float | None = None,
+        latest: float | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """로컬에 저장된 메시지를 검색한다.
+
+        API를 호출하지 않으며, 이전에 수집한 메시지만 검색 대상이다.
+        결과 메시지에는 user_name 필드가 추가된다.
+
+        Args:
+            query: 검색어
+            channel_id: 채널 ID 필터
+            user: 작성자 ID 또는 표시 이름 필터
+            oldest: 시작 Unix timestamp
+            latest: 종료 Unix timestamp
+            limit: 반환할 최대 건수
+
+        Returns:
+            메시지 리스트 [{"channel_id", "ts", "thread_ts", "user", "user_name", "text"}]
+        """
+        if self.message_store is None:
+            return []
+
+        user_ids = None
+        if user:
+            # 표시 이름으로 지정한 경우 캐시된 사용자 중 이름이 같은 ID를 모두 포함
+            with self._user_lock:
+                user_ids = [user] + [
+                    uid for uid, name in self._user_cache.items()
+                    if name.lower() == user.lower() and uid != user
+                ]
+
+        results = self.message_store.search(query, channel_id, user_ids, oldest, latest, limit)
+        return self.resolve_user_names(results)
+
+    def _get_cached_channel_info(self, channel_id: str) -> dict | None:
+        """유효 시간 안의 채널 상세 정보 캐시를 반환한다."""
+        with self._channel_lock:
+            entry = self._channel_info.get(channel_id)
+        if entry is None or time.time() - entry[0] > self.channel_cache_ttl:
+            return None
+        return entry[1]
+
+    def fetch_channel_info(self, channel_id: str, refresh: bool = False) -> dict:
         """채널 정보 조회.
 
+        조회 결과는 채널 디렉토리와 같은 유효 시간(channel_cache_ttl) 동안 캐시하고,
+        디렉토리의 채널 이름도 함께 갱신한다.
+
         Args:
             channel_id: 채널 ID
+            refresh: True이면 캐시를 무시하고 다시 조회
 
         Returns:
             채널 정보 dict
@@ -144,13 +765,29 @@ class SlackClient:
         Raises:
             SlackClientError: API 호출 실패 시
         """
-        try:
-            response = self.client.conversations_info(channel=channel_id)
-            return response["channel"]
+        if not refresh:
+            cached = self._get_cached_channel_info(channel_id)
+            if cached is not None:
+                metrics.record_cache("slack.channel_info", hits=1)
+                return dict(cached)
 
+        metrics.record_cache("slack.channel_info", misses=1)
+        try:
+            response = self._call("conversations.info", channel=channel_id)
+            info = response["channel"]
         except SlackApiError as e:
             raise SlackClientError(self._format_error_message(e)) from e
 
+        with self._channel_lock:
+            self._channel_info[channel_id] = (time.time(), info)
+        channel = self._channel_id_index.get(channel_id)
+        if channel is not None and info.get("name") and channel["name"] != info["name"]:
+            self._channel_name_index.pop(channel["name"].lower(), None)
+            channel["name"] = info["name"]
+            self._channel_name_index[info["name"].lower()] = channel_id
+            self._channel_search_index = None
+        return dict(info)
+
     def get_user_name(self, user_id: str) -> str:
         """사용자 ID를 표시 이름으로 변환.
 
@@ -163,11 +800,12 @@ class SlackClient:
         Returns:
             표시 이름. 실패 시 원본 user_id.
         """
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        with self._user_lock:
+            if user_id in self._user_cache:
+                return self._user_cache[user_id]
 
         try:
-            response = self.client.users_info(user=user_id)
+            response = self._call("users.info", user=user_id)
             user = response["user"]
             profile = user.get("profile", {})
             name = (
@@ -176,11 +814,11 @@ class SlackClient:
                 or user.get("real_name")
                 or user_id
             )
-            self._user_cache[user_id] = name
-            return name
         except SlackApiError:
-            self._user_cache[user_id] = user_id
-            return user_id
+            name = user_id
+        with self._user_lock:
+            self._user_cache[user_id] = name
+        return name
 
     def list_users(self) -> list[dict]:
         """워크스페이스 전체 사용자 목록 조회.
@@ -198,7 +836,7 @@ class SlackClient:
             cursor = None
 
             while True:
-                response = self.client.users_list(cursor=cursor, limit=200)
+                response = self._call("users.list", cursor=cursor, limit=200)
 
                 for user in response["members"]:
                     if user.get("is_bot") or user.get("deleted") or user.get("id") == "USLACKBOT":
@@ -215,12 +853,15 @@ class SlackClient:
                         "name": name,
                         "real_name": user.get("real_name", ""),
                     })
-                    self._user_cache[user["id"]] = name
 
                 cursor = response.get("response_metadata", {}).get("next_cursor")
                 if not cursor:
                     break
 
+            # 도구가 동시에 실행되므로 캐시는 다른 조회와 같은 잠금 아래에서 갱신한다
+            with self._user_lock:
+                self._user_cache.update((user["id"], user["name"]) for user in users)
+            self._save_user_cache()
             return users
 
         except SlackApiError as e:
@@ -239,7 +880,7 @@ class SlackClient:
             SlackClientError: API 호출 실패 시
         """
         try:
-            response = self.client.users_getPresence(user=user_id)
+            response = self._call("users.getPresence", user=user_id)
             return response.get("presence", "away")
         except SlackApiError as e:
             raise SlackClientError(self._format_error_message(e)) from e
@@ -249,43 +890,61 @@ class SlackClient:
 
         워크스페이스 전체 사용자를 조회한 뒤, 각 사용자의
         온라인 상태를 확인하여 활성(active) 사용자만 반환한다.
+        사용자마다 진행 상황을 알리고 취소 여부를 확인한다.
 
         Returns:
             활성 사용자 리스트 [{"id", "name", "real_name", "presence"}]
 
         Raises:
             SlackClientError: API 호출 실패 시
+            OperationCancelled: 작업이 취소된 경우
         """
         users = self.list_users()
         active_users = []
 
-        for user in users:
+        for checked, user in enumerate(users, 1):
+            progress.check_cancelled()
             try:
                 presence = self.get_user_presence(user["id"])
                 if presence == "active":
                     user["presence"] = presence
                     active_users.append(user)
             except SlackClientError:
-                continue
+                pass
+            progress.report(checked, len(users), f"사용자 {checked}/{len(users)}명 상태 확인")
 
         return active_users
 
-    def resolve_user_names(self, messages: list[dict]) -> list[dict]:
+    @metrics.timed("slack.resolve_user_names")
+    def resolve_user_names(self, messages: list[dict], max_workers: int = 1) -> list[dict]:
         """메시지 리스트의 user ID를 표시 이름으로 변환.
 
         각 메시지에 user_name 필드를 추가한다.
-        원본 user 필드는 유지된다.
+        원본 user 필드는 유지된다. 고유 사용자 ID별로 한 번만 조회한다.
 
         Args:
             messages: Slack 메시지 리스트
+            max_workers: 캐시에 없는 사용자를 동시에 조회할 최대 스레드 수
 
         Returns:
             user_name 필드가 추가된 메시지 리스트
         """
+        user_ids = list(dict.fromkeys(msg["user"] for msg in messages if msg.get("user")))
+        self._load_user_cache()
+        with self._user_lock:
+            missing = [uid for uid in user_ids if uid not in self._user_cache]
+        metrics.record_cache("slack.users", hits=len(user_ids) - len(missing), misses=len(missing))
+        if max_workers > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                list(executor.map(tracing.propagate(self.get_user_name), missing))
+
+        names = {uid: self.get_user_name(uid) for uid in user_ids}
+        if missing:
+            self._save_user_cache()
         for msg in messages:
             user_id = msg.get("user")
             if user_id:
-                msg["user_name"] = self.get_user_name(user_id)
+                msg["user_name"] = names[user_id]
         return messages
 
     def _format_error_message(self, error: SlackApiError) -> str:
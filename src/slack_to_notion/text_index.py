@@ -0,0 +1,133 @@
+"""로컬 텍스트 검색 인덱스 모듈.
+
+채널 목록처럼 자주 조회하는 데이터를 API 호출 없이 퍼지 검색하기 위한
+트라이그램 인덱스와, 저장된 분석 결과 검색용 토크나이저를 제공한다.
+"""
+
+import re
+import unicodedata
+
+# 채널 이름에서 단어 구분자로 쓰이는 문자
+_SEPARATOR_PATTERN = re.compile(r"[\s\-_.#/]+")
+_WORD_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile(r"[\uac00-\ud7a3]")
+
+
+def normalize_text(text: str) -> str:
+    """검색용으로 텍스트를 정규화한다.
+
+    유니코드 NFKC 정규화, 소문자 변환 후 구분자(공백, -, _, ., #, /)를 공백 하나로 통일한다.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _SEPARATOR_PATTERN.sub(" ", text).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """정규화된 텍스트의 트라이그램 집합을 반환한다.
+
+    짧은 단어도 매칭되도록 앞뒤에 공백 패딩을 붙인다.
+    """
+    if not text:
+        return set()
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def tokenize(text: str) -> list[str]:
+    """역색인용 토큰 리스트를 반환한다.
+
+    영문/숫자 단어는 소문자 단어 그대로 사용한다. 한글 단어는 조사가 붙어도
+    매칭되도록 두 글자씩 끊은 바이그램을 사용한다 (예: "배포는" → "배포", "포는").
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if _HANGUL_PATTERN.search(word) and len(word) > 2:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1 or _HANGUL_PATTERN.match(word):
+            tokens.append(word)
+    return tokens
+
+
+class TrigramIndex:
+    """트라이그램 기반 퍼지 검색 인덱스.
+
+    하나의 문서(key)에 여러 필드를 가중치와 함께 추가할 수 있으며,
+    검색 점수는 필드별 점수 중 가장 높은 값을 사용한다.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, set[int]] = {}
+        # 필드 목록: (key, 정규화 텍스트, 트라이그램, 가중치)
+        self._fields: list[tuple[str, str, set[str], float]] = []
+        self._payloads: dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def add(self, key: str, text: str, weight: float = 1.0, payload: object = None) -> None:
+        """문서 필드를 인덱스에 추가한다.
+
+        Args:
+            key: 문서 식별자 (예: 채널 ID)
+            text: 검색 대상 텍스트
+            weight: 필드 가중치 (이름 1.0, 설명 0.6 등)
+            payload: 검색 결과로 돌려줄 값 (미지정 시 key)
+        """
+        if key not in self._payloads or payload is not None:
+            self._payloads[key] = payload if payload is not None else key
+
+        normalized = normalize_text(text)
+        if not normalized:
+            return
+
+        grams = trigrams(normalized)
+        field_id = len(self._fields)
+        self._fields.append((key, normalized, grams, weight))
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(field_id)
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.3) -> list[tuple[float, object]]:
+        """퍼지 검색을 수행한다.
+
+        점수는 쿼리 트라이그램 포함률과 Dice 계수를 조합하고,
+        부분 문자열/완전 일치 시 가산점을 준다.
+
+        Args:
+            query: 검색어
+            limit: 반환할 최대 건수
+            min_score: 결과에 포함할 최소 점수
+
+        Returns:
+            (점수, payload) 리스트. 점수 내림차순.
+        """
+        normalized = normalize_text(query)
+        if not normalized:
+            return []
+
+        query_grams = trigrams(normalized)
+        counts: dict[int, int] = {}
+        for gram in query_grams:
+            for field_id in self._postings.get(gram, ()):
+                counts[field_id] = counts.get(field_id, 0) + 1
+
+        best: dict[str, float] = {}
+        for field_id, shared in counts.items():
+            key, text, grams, weight = self._fields[field_id]
+            containment = shared / len(query_grams)
+            dice = 2 * shared / (len(query_grams) + len(grams))
+            score = 0.7 * containment + 0.3 * dice
+            if text == normalized:
+                score += 1.0
+            elif text.startswith(normalized):
+                score += 0.5
+            elif normalized in text:
+                score += 0.3
+            score *= weight
+            if score > best.get(key, 0.0):
+                best[key] = score
+
+        ranked = sorted(
+            ((score, key) for key, score in best.items() if score >= min_score),
+            key=lambda item: (-item[0], item[1]),
+        )
+        return [(round(score, 3), self._payloads[key]) for score, key in ranked[:limit]]
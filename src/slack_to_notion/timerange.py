@@ -0,0 +1,142 @@
+"""날짜/시간 범위 변환 모듈.
+
+"2026-02-09", "2026-02-09 09:00", "7d" 같은 입력을 Slack API의 oldest/latest 타임스탬프로 변환한다.
+"""
+
+import os
+import re
+from datetime import datetime, time, timedelta, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_RELATIVE_PATTERN = re.compile(r"^(\d+)\s*([mhdw])$")
+_RELATIVE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+# Unix timestamp는 10자리 이상 정수부(2001년 이후) 또는 소수점이 있어야 한다. "2026", "20260101"이 1970년으로 해석되지 않게 한다
+_TIMESTAMP_PATTERN = re.compile(r"^(\d{10,}(\.\d*)?|\d*\.\d+)$")
+_BARE_NUMBER_PATTERN = re.compile(r"^\d+$")
+_DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M")
+
+
+def resolve_timezone(name: str = "") -> tzinfo | None:
+    """시간대 이름을 tzinfo로 변환한다.
+
+    name이 없으면 SLACK_TO_NOTION_TIMEZONE 환경변수를 사용하고,
+    그것도 없으면 None(시스템 로컬 시간대)을 반환한다.
+
+    Raises:
+        ValueError: 알 수 없는 시간대 이름인 경우
+    """
+    name = name.strip() or os.environ.get("SLACK_TO_NOTION_TIMEZONE", "").strip()
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"알 수 없는 시간대입니다: {name} (예: Asia/Seoul)") from e
+
+
+def _now(tz: tzinfo | None) -> datetime:
+    return datetime.now(tz) if tz else datetime.now().astimezone()
+
+
+def parse_time_bound(value: str, tz: tzinfo | None = None, end: bool = False) -> float:
+    """날짜/시간 문자열을 Unix timestamp로 변환한다.
+
+    지원 형식:
+        - 날짜: 2026-02-09 (end=True이면 다음 날 0시, 즉 해당 날짜 전체 포함)
+        - 날짜+시간: 2026-02-09 09:00, 2026-02-09T09:00:00
+        - 시간대 포함 ISO 8601: 2026-02-09T09:00:00+09:00
+        - 상대 시간: 30m, 12h, 7d, 2w (현재 시각 기준 이전)
+        - today/오늘, yesterday/어제
+        - Unix timestamp: 1739612400.000000 (정수부 10자리 이상 또는 소수점 포함)
+
+    Args:
+        value: 변환할 문자열
+        tz: 시간대가 없는 입력에 적용할 시간대 (None이면 시스템 로컬)
+        end: 범위의 끝으로 해석할지 여부
+
+    Raises:
+        ValueError: 해석할 수 없는 형식인 경우
+    """
+    text = value.strip()
+    lowered = text.lower()
+
+    relative = _RELATIVE_PATTERN.match(lowered)
+    if relative:
+        amount, unit = relative.groups()
+        delta = timedelta(**{_RELATIVE_UNITS[unit]: int(amount)})
+        return (_now(tz) - delta).timestamp()
+
+    if lowered in ("today", "오늘", "yesterday", "어제"):
+        day = _now(tz).date()
+        if lowered in ("yesterday", "어제"):
+            day -= timedelta(days=1)
+        if end:
+            day += timedelta(days=1)
+        return _localize(datetime.combine(day, time()), tz).timestamp()
+
+    if _TIMESTAMP_PATTERN.match(text):
+        return float(text)
+    if _BARE_NUMBER_PATTERN.match(text):
+        raise ValueError(
+            f"날짜 형식이 올바르지 않습니다: {value} "
+            "(날짜는 YYYY-MM-DD로, Unix timestamp는 1739612400처럼 10자리 이상으로 입력하세요)"
+        )
+
+    try:
+        day = datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        day = None
+    if day is not None:
+        if end:
+            day += timedelta(days=1)
+        return _localize(day, tz).timestamp()
+
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return _localize(datetime.strptime(text, fmt), tz).timestamp()
+        except ValueError:
+            continue
+
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(
+            f"날짜 형식이 올바르지 않습니다: {value} "
+            "(YYYY-MM-DD, YYYY-MM-DD HH:MM 또는 7d 같은 상대 시간으로 입력하세요)"
+        ) from None
+    return _localize(parsed, tz).timestamp()
+
+
+def _localize(dt: datetime, tz: tzinfo | None) -> datetime:
+    if dt.tzinfo is not None:
+        return dt
+    return dt.replace(tzinfo=tz) if tz else dt.astimezone()
+
+
+def resolve_time_range(
+    since: str = "",
+    until: str = "",
+    timezone: str = "",
+) -> tuple[str | None, str | None]:
+    """since/until 입력을 Slack API의 oldest/latest 값으로 변환한다.
+
+    Args:
+        since: 시작 시점 (포함)
+        until: 종료 시점 (날짜만 지정하면 해당 날짜 전체 포함)
+        timezone: 시간대 이름 (예: Asia/Seoul, 미지정 시 SLACK_TO_NOTION_TIMEZONE 또는 시스템 로컬)
+
+    Returns:
+        (oldest, latest) 타임스탬프 문자열. 지정하지 않은 쪽은 None.
+
+    Raises:
+        ValueError: 형식이 올바르지 않거나 since가 until보다 늦은 경우
+    """
+    tz = resolve_timezone(timezone)
+    oldest = parse_time_bound(since, tz) if since.strip() else None
+    latest = parse_time_bound(until, tz, end=True) if until.strip() else None
+    if oldest is not None and latest is not None and oldest >= latest:
+        raise ValueError(f"시작 시점이 종료 시점보다 늦습니다: since={since}, until={until}")
+    return (
+        f"{oldest:.6f}" if oldest is not None else None,
+        f"{latest:.6f}" if latest is not None else None,
+    )
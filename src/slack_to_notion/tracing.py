@@ -0,0 +1,248 @@
+"""분산 트레이싱 모듈.
+
+도구 실행과 Slack/Notion API 요청을 span으로 기록한다.
+SLACK_TO_NOTION_TRACING 환경변수로 켜며, 꺼져 있으면 모든 함수가 아무 일도 하지 않는다.
+
+    otlp   OpenTelemetry SDK로 OTLP(HTTP) 전송 (tracing extra 필요,
+           수신 주소는 OTEL_EXPORTER_OTLP_ENDPOINT 등 OpenTelemetry 표준 환경변수로 지정)
+    jsonl  span을 JSON Lines 파일에 기록 (SLACK_TO_NOTION_TRACE_FILE, 기본 DEFAULT_TRACE_FILE)
+"""
+
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+TRACING_ENV = "SLACK_TO_NOTION_TRACING"
+TRACE_FILE_ENV = "SLACK_TO_NOTION_TRACE_FILE"
+DEFAULT_TRACE_FILE = Path(".claude/slack-to-notion/traces.jsonl")
+SERVICE_NAME = "slack-to-notion-mcp"
+
+TRACING_MODES = ("otlp", "jsonl")
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있을 때 사용하는 span. 모든 동작을 무시한다."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: dict | None = None) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# 현재 설정된 기록 방식 (None이면 비활성)
+_backend = None
+
+
+class _JsonlSpan:
+    """JSON Lines로 기록하는 span. 필드 이름은 OpenTelemetry span 형식을 따른다."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id", "start_ns", "attributes", "events", "error")
+
+    def __init__(self, name: str, parent: "_JsonlSpan | None", attributes: dict | None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.attributes = dict(attributes or {})
+        self.events: list[dict] = []
+        self.error: str | None = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: dict | None = None) -> None:
+        self.events.append({"name": name, "time_unix_nano": time.time_ns(), "attributes": dict(attributes or {})})
+
+    def set_error(self, message: str) -> None:
+        self.error = message
+
+    def to_dict(self, end_ns: int) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": end_ns,
+            "duration_ms": round((end_ns - self.start_ns) / 1e6, 3),
+            "status": {"code": "ERROR", "message": self.error} if self.error else {"code": "OK"},
+            "attributes": self.attributes,
+            "events": self.events,
+            "resource": {"service.name": SERVICE_NAME},
+        }
+
+
+class _JsonlBackend:
+    """span을 끝날 때마다 한 줄씩 파일에 추가한다."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._current: contextvars.ContextVar[_JsonlSpan | None] = contextvars.ContextVar(
+            "slack_to_notion_span", default=None,
+        )
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, attributes: dict | None):
+        span = _JsonlSpan(name, self._current.get(), attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            self._current.reset(token)
+            self._write(span.to_dict(time.time_ns()))
+
+    def current(self):
+        return self._current.get() or _NOOP_SPAN
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+
+
+class _OtelSpan:
+    """OpenTelemetry span을 이 모듈의 span 인터페이스로 감싼다."""
+
+    __slots__ = ("_span", "_error_status")
+
+    def __init__(self, span, error_status):
+        self._span = span
+        self._error_status = error_status
+
+    def set_attribute(self, key: str, value) -> None:
+        self._span.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: dict | None = None) -> None:
+        self._span.add_event(name, attributes or {})
+
+    def set_error(self, message: str) -> None:
+        self._span.set_status(self._error_status(message))
+
+
+class _OtelBackend:
+    """OpenTelemetry SDK로 span을 만들고 OTLP로 내보낸다."""
+
+    def __init__(self):
+        try:
+            from opentelemetry import trace
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.trace import Status, StatusCode
+        except ImportError as e:
+            raise RuntimeError(
+                "OTLP 트레이싱을 사용하려면 OpenTelemetry 패키지가 필요합니다. "
+                "pip install 'slack-to-notion-mcp[tracing]'로 설치하거나 "
+                f"{TRACING_ENV}=jsonl로 파일에 기록하세요."
+            ) from e
+
+        provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        trace.set_tracer_provider(provider)
+        self._trace = trace
+        self._tracer = trace.get_tracer("slack_to_notion")
+        self._error_status = lambda message: Status(StatusCode.ERROR, message)
+
+    @contextmanager
+    def span(self, name: str, attributes: dict | None):
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield _OtelSpan(span, self._error_status)
+
+    def current(self):
+        return _OtelSpan(self._trace.get_current_span(), self._error_status)
+
+
+def configure(mode: str | None = None) -> str | None:
+    """트레이싱 기록 방식을 설정한다.
+
+    Args:
+        mode: "otlp", "jsonl", 또는 빈 문자열/"off"(비활성). 미지정 시 SLACK_TO_NOTION_TRACING 환경변수 사용
+
+    Returns:
+        적용된 방식. 비활성이면 None
+
+    Raises:
+        ValueError: 지원하지 않는 방식인 경우
+        RuntimeError: otlp 방식에 필요한 패키지가 없는 경우
+    """
+    global _backend
+    if mode is None:
+        mode = os.environ.get(TRACING_ENV, "")
+    mode = mode.strip().lower()
+    if mode in ("", "off", "none", "false", "0"):
+        _backend = None
+        return None
+    if mode == "jsonl":
+        _backend = _JsonlBackend(Path(os.environ.get(TRACE_FILE_ENV) or DEFAULT_TRACE_FILE))
+    elif mode == "otlp":
+        _backend = _OtelBackend()
+    else:
+        raise ValueError(f"지원하지 않는 트레이싱 방식입니다: {mode} ({', '.join(TRACING_MODES)} 중 선택)")
+    return mode
+
+
+def enabled() -> bool:
+    """트레이싱이 켜져 있는지 여부."""
+    return _backend is not None
+
+
+def span(name: str, attributes: dict | None = None):
+    """name span을 시작하는 context manager를 반환한다. 예외가 나면 span을 에러로 기록한다.
+
+    with tracing.span("slack conversations.history", {"rpc.method": ...}) as span:
+        span.set_attribute("slack.pages", 2)
+    """
+    if _backend is None:
+        return _NOOP_SPAN
+    return _backend.span(name, attributes)
+
+
+def current_span():
+    """현재 실행 중인 span을 반환한다. 트레이싱이 꺼져 있으면 아무 일도 하지 않는 span."""
+    if _backend is None:
+        return _NOOP_SPAN
+    return _backend.current()
+
+
+def propagate(func):
+    """다른 스레드에서 실행해도 현재 span 아래에 기록되도록 func를 감싼다.
+
+    ThreadPoolExecutor는 contextvars를 넘기지 않으므로 작업 함수에 적용한다.
+    트레이싱이 꺼져 있으면 func를 그대로 반환한다.
+    """
+    if _backend is None:
+        return func
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # 같은 Context는 여러 스레드에서 동시에 진입할 수 없으므로 호출마다 복사한다
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
@@ -0,0 +1,9 @@
+"""테스트 공통 설정."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_working_dir(tmp_path, monkeypatch):
+    """캐시/히스토리 기본 경로(.claude/...)가 레포 대신 임시 디렉토리에 생성되도록 한다."""
+    monkeypatch.chdir(tmp_path)
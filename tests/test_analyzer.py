@@ -7,14 +7,23 @@ import pytest
 
 from slack_to_notion.analyzer import (
     ANALYSIS_GUIDE_EXAMPLES,
+    HISTORY_ARCHIVE_DIRNAME,
+    HISTORY_INDEX_FILENAME,
+    apply_history_retention,
+    format_channels_for_analysis,
     format_messages_for_analysis,
+    format_search_results,
     format_threads_for_analysis,
     get_analysis_guide,
     list_history,
+    load_history_result,
     load_preferences,
     load_result,
+    prune_history_archive,
+    rebuild_history_index,
     save_preference,
     save_result,
+    search_history_index,
 )
 
 
@@ -162,6 +171,81 @@ class TestFormatThreadsForAnalysis:
         assert ") \u2014 test" in result
 
 
+class TestFormatMessagesThreadExpansion:
+    """스레드 답글 펼침 포맷팅 테스트."""
+
+    def test_replies_inline_under_parent(self):
+        messages = [
+            {"ts": "1700000000.000000", "user_name": "김동영", "text": "배포 일정?", "reply_count": 3},
+            {"ts": "1700000500.000000", "user_name": "이철수", "text": "점심"},
+        ]
+        replies = {"1700000000.000000": [
+            {"ts": "1700000100.000000", "user_name": "이철수", "text": "금요일", "reply_count": 0},
+        ]}
+        result = format_messages_for_analysis(messages, "dev", thread_replies=replies)
+        assert "Expanded threads: 1 (replies: 1)" in result
+        assert "  \u21b3 이철수 (" in result
+        assert result.index("금요일") < result.index("점심")
+        assert "... (답글 2개 생략)" in result
+
+    def test_no_expansion_keeps_format(self):
+        messages = [{"ts": "1700000000.000000", "user": "U001", "text": "hi", "reply_count": 2}]
+        result = format_messages_for_analysis(messages, "dev")
+        assert "Expanded threads" not in result
+        assert "\u21b3" not in result
+
+
+class TestFormatChannelsForAnalysis:
+    """복수 채널 포맷팅 테스트."""
+
+    def test_sections_per_channel(self):
+        channels = [
+            {"channel_name": "general", "messages": [
+                {"ts": "1700000000.000000", "user_name": "김동영", "text": "공지"},
+            ]},
+            {"channel_name": "dev", "messages": [
+                {"ts": "1700000100.000000", "user_name": "이철수", "text": "배포 완료", "reply_count": 2},
+                {"ts": "1700000200.000000", "user": "U003", "text": "확인"},
+            ]},
+        ]
+        result = format_channels_for_analysis(channels)
+        assert "Channel count: 2" in result
+        assert "Total messages: 3" in result
+        assert "=== Channel: general (1 messages) ===" in result
+        assert "=== Channel: dev (2 messages) ===" in result
+        assert result.index("공지") < result.index("=== Channel: dev")
+        assert "[스레드 - 답글 2개]" in result
+
+    def test_failed_channel(self):
+        channels = [{"channel_name": "secret", "error": "권한 없음"}]
+        result = format_channels_for_analysis(channels)
+        assert "=== Channel: secret (수집 실패) ===" in result
+        assert "[수집 실패] 권한 없음" in result
+        assert "Total messages: 0" in result
+
+
+class TestFormatSearchResults:
+    """검색 결과 포맷팅 테스트."""
+
+    def test_basic(self):
+        messages = [
+            {"channel_id": "C001", "ts": "1739612400.000000", "user_name": "김동영", "text": "배포 완료"},
+        ]
+        result = format_search_results(messages, "배포", {"C001": "dev"})
+        assert "Query: 배포" in result
+        assert "Result count: 1" in result
+        assert "[#dev] 김동영 (" in result
+        assert ") \u2014 배포 완료" in result
+
+    def test_thread_reply_marker(self):
+        messages = [
+            {"channel_id": "C001", "ts": "101.0", "thread_ts": "100.0", "user": "U001", "text": "답글"},
+        ]
+        result = format_search_results(messages, "답글")
+        assert "[#C001]" in result
+        assert "thread_ts: 100.0" in result
+
+
 class TestSaveAndLoadResult:
     """분석 결과 저장/로드 테스트."""
 
@@ -195,6 +279,66 @@ class TestSaveAndLoadResult:
             load_result(tmp_path / "nonexistent.json")
 
 
+class TestResultStorageFormats:
+    """압축/원자적 저장 테스트."""
+
+    def test_compact_encoding(self, tmp_path):
+        filepath = tmp_path / "compact.json"
+        save_result({"a": [1, 2], "b": "한글"}, filepath)
+        assert filepath.read_text(encoding="utf-8") == '{"a":[1,2],"b":"한글"}'
+
+    def test_gzip_by_suffix(self, tmp_path):
+        import gzip
+        filepath = tmp_path / "result.json.gz"
+        save_result({"요약": "압축"}, filepath)
+        assert filepath.read_bytes()[:2] == b"\x1f\x8b"
+        assert json.loads(gzip.decompress(filepath.read_bytes())) == {"요약": "압축"}
+        assert load_result(filepath) == {"요약": "압축"}
+
+    def test_gzip_by_argument(self, tmp_path):
+        filepath = tmp_path / "result.json"
+        save_result({"k": "v"}, filepath, compression="gzip")
+        assert load_result(filepath) == {"k": "v"}
+
+    def test_zstd_roundtrip(self, tmp_path):
+        pytest.importorskip("zstandard")
+        filepath = tmp_path / "result.json.zst"
+        save_result({"k": "v"}, filepath)
+        assert load_result(filepath) == {"k": "v"}
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            save_result({}, tmp_path / "a.json", compression="brotli")
+
+    def test_load_legacy_indented_file(self, tmp_path):
+        filepath = tmp_path / "legacy.json"
+        filepath.write_text(json.dumps({"title": "이전 형식"}, ensure_ascii=False, indent=2), encoding="utf-8")
+        assert load_result(filepath) == {"title": "이전 형식"}
+
+    def test_load_corrupted_gzip(self, tmp_path):
+        filepath = tmp_path / "bad.json.gz"
+        filepath.write_bytes(b"\x1f\x8b" + b"garbage")
+        with pytest.raises(ValueError):
+            load_result(filepath)
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        from unittest.mock import patch
+        filepath = tmp_path / "result.json"
+        save_result({"v": 1}, filepath)
+        with patch("slack_to_notion.analyzer.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_result({"v": 2}, filepath)
+        assert load_result(filepath) == {"v": 1}
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+    def test_compressed_files_listed(self, tmp_path):
+        save_result({"title": "압축 분석"}, tmp_path / "a.json.gz")
+        save_result({"title": "일반 분석"}, tmp_path / "b.json")
+        result = list_history(history_dir=tmp_path)
+        summaries = {r["filename"]: r["summary"] for r in result}
+        assert summaries == {"a.json.gz": "압축 분석", "b.json": "일반 분석"}
+
+
 class TestSavePreference:
     """사용자 선호도 저장 테스트."""
 
@@ -227,6 +371,140 @@ class TestSavePreference:
         assert pref_path.exists()
 
 
+class TestPreferenceCompaction:
+    """선호도 중복 제거/대체/한도 테스트."""
+
+    def test_duplicate_not_repeated(self, tmp_path):
+        pref_path = tmp_path / "preferences.md"
+        save_preference("결정사항 위주로", pref_path)
+        save_preference("결정사항  위주로", pref_path)
+        content = load_preferences(pref_path)
+        assert content.count("결정사항") == 1
+
+    def test_duplicate_moves_to_latest(self, tmp_path):
+        pref_path = tmp_path / "preferences.md"
+        save_preference("A 방식", pref_path)
+        save_preference("B 방식", pref_path)
+        save_preference("A 방식", pref_path)
+        content = load_preferences(pref_path)
+        assert content.index("B 방식") < content.index("A 방식")
+
+    def test_same_key_superseded(self, tmp_path):
+        pref_path = tmp_path / "preferences.md"
+        save_preference("회의록은 결정사항 위주로", pref_path, key="회의록")
+        save_preference("회의록은 타임라인 순으로", pref_path, key="회의록")
+        content = load_preferences(pref_path)
+        assert "결정사항" not in content
+        assert "#회의록 회의록은 타임라인 순으로" in content
+
+    def test_entry_count_capped(self, tmp_path):
+        from slack_to_notion.analyzer import MAX_PREFERENCE_ENTRIES
+        pref_path = tmp_path / "preferences.md"
+        for i in range(MAX_PREFERENCE_ENTRIES + 5):
+            save_preference(f"선호 {i}", pref_path)
+        content = load_preferences(pref_path)
+        assert "선호 0\n" not in content
+        assert f"선호 {MAX_PREFERENCE_ENTRIES + 4}" in content
+        assert content.count("\n- ") == MAX_PREFERENCE_ENTRIES
+
+    def test_char_limit(self, tmp_path):
+        from slack_to_notion.analyzer import MAX_PREFERENCE_CHARS
+        pref_path = tmp_path / "preferences.md"
+        save_preference("오래된 선호", pref_path)
+        save_preference("x" * (MAX_PREFERENCE_CHARS - 3), pref_path)
+        assert "오래된 선호" not in load_preferences(pref_path)
+
+    def test_legacy_append_only_file(self, tmp_path):
+        """이전 append-only 파일의 중복도 정리해서 반환한다."""
+        pref_path = tmp_path / "preferences.md"
+        pref_path.write_text(
+            "## 분석 선호도\n\n- [2026-01-01] 요약 위주\n- [2026-01-02] 요약 위주\n- [2026-01-03] 표로 정리\n",
+            encoding="utf-8",
+        )
+        content = load_preferences(pref_path)
+        assert content.count("요약 위주") == 1
+        assert "[2026-01-02] 요약 위주" in content
+
+    def test_hand_edited_legacy_file_preserved(self, tmp_path):
+        """직접 쓴 메모와 이전 버전의 여러 줄 항목은 저장해도 그대로 남는다."""
+        pref_path = tmp_path / "preferences.md"
+        original = (
+            "## 분석 선호도\n"
+            "\n"
+            "팀 공용 규칙은 위키를 따른다 (직접 작성한 메모)\n"
+            "\n"
+            "- [2026-01-01] 회의록은\n"
+            "결정사항과 담당자를 함께 적는다\n"
+            "- [2026-01-02] #말투 존댓말로\n"
+            "\n"
+            "### 참고\n"
+            "- 분기 보고서 양식 링크\n"
+        )
+        pref_path.write_text(original, encoding="utf-8")
+        save_preference("표로 정리", pref_path)
+
+        content = pref_path.read_text(encoding="utf-8")
+        assert "팀 공용 규칙은 위키를 따른다 (직접 작성한 메모)\n" in content
+        assert "- [2026-01-01] 회의록은\n결정사항과 담당자를 함께 적는다\n" in content
+        assert "### 참고\n- 분기 보고서 양식 링크\n" in content
+        # 새 항목은 마지막 항목 뒤에 추가된다
+        assert content.index("표로 정리") > content.index("분기 보고서 양식 링크")
+        loaded = load_preferences(pref_path)
+        assert "- [2026-01-01] 회의록은\n  결정사항과 담당자를 함께 적는다" in loaded
+
+    def test_replaced_multiline_entry_removed_entirely(self, tmp_path):
+        pref_path = tmp_path / "preferences.md"
+        pref_path.write_text(
+            "## 분석 선호도\n\n- [2026-01-01] #회의록 결정사항\n담당자 포함\n\n메모\n", encoding="utf-8",
+        )
+        save_preference("타임라인 순으로", pref_path, key="회의록")
+        content = pref_path.read_text(encoding="utf-8")
+        assert "결정사항" not in content
+        assert "담당자 포함" not in content
+        assert "#회의록 타임라인 순으로" in content
+        assert "메모" in content
+
+    def test_entries_over_limit_kept_on_disk(self, tmp_path):
+        from slack_to_notion.analyzer import MAX_PREFERENCE_ENTRIES
+        pref_path = tmp_path / "preferences.md"
+        for i in range(MAX_PREFERENCE_ENTRIES + 5):
+            save_preference(f"선호 {i}", pref_path)
+        assert pref_path.read_text(encoding="utf-8").count("\n- ") == MAX_PREFERENCE_ENTRIES + 5
+        assert load_preferences(pref_path).count("\n- ") == MAX_PREFERENCE_ENTRIES
+
+    def test_cache_invalidated_on_external_edit(self, tmp_path):
+        import os
+        pref_path = tmp_path / "preferences.md"
+        save_preference("처음 선호", pref_path)
+        assert "처음 선호" in load_preferences(pref_path)
+        pref_path.write_text("## 분석 선호도\n\n- [2026-01-01] 직접 수정한 선호\n", encoding="utf-8")
+        stat = pref_path.stat()
+        os.utime(pref_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        content = load_preferences(pref_path)
+        assert "직접 수정한 선호" in content
+        assert "처음 선호" not in content
+
+
+class TestConcurrentWrites:
+    """동시에 실행된 도구의 파일 갱신 테스트."""
+
+    def test_concurrent_preferences_all_kept(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+        pref_path = tmp_path / "preferences.md"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: save_preference(f"선호 {i}", pref_path, key=f"주제{i}"), range(20)))
+        content = pref_path.read_text(encoding="utf-8")
+        assert all(f"#주제{i} 선호 {i}" in content for i in range(20))
+
+    def test_concurrent_history_saves_all_indexed(self, tmp_path):
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: save_result({"title": f"분석 {i}"}, tmp_path / f"a{i}.json"), range(20)))
+        index = json.loads((tmp_path / HISTORY_INDEX_FILENAME).read_text(encoding="utf-8"))
+        assert len(index["entries"]) == 20
+
+
 class TestLoadPreferences:
     """선호도 로드 테스트."""
 
@@ -281,3 +559,295 @@ class TestListHistory:
         (tmp_path / "bad.json").write_text("not json", encoding="utf-8")
         result = list_history(history_dir=tmp_path)
         assert result[0]["summary"] == "(읽기 실패)"
+
+
+class TestHistoryIndex:
+    """히스토리 사이드카 인덱스 테스트."""
+
+    def test_save_result_writes_index(self, tmp_path):
+        save_result({"title": "첫 분석"}, tmp_path / "a.json")
+        index = json.loads((tmp_path / HISTORY_INDEX_FILENAME).read_text(encoding="utf-8"))
+        entry = index["entries"]["a.json"]
+        assert entry["summary"] == "첫 분석"
+        assert entry["size"] > 0
+
+    def test_index_file_not_listed(self, tmp_path):
+        save_result({"title": "분석"}, tmp_path / "a.json")
+        result = list_history(history_dir=tmp_path)
+        assert [r["filename"] for r in result] == ["a.json"]
+
+    def test_list_uses_index_without_reading_files(self, tmp_path):
+        save_result({"title": "원래 요약"}, tmp_path / "a.json")
+        # 인덱스에 있는 파일은 다시 읽지 않는다
+        (tmp_path / "a.json").write_text('{"title": "바뀐 요약"}', encoding="utf-8")
+        assert list_history(history_dir=tmp_path)[0]["summary"] == "원래 요약"
+
+    def test_list_picks_up_new_and_removed_files(self, tmp_path):
+        save_result({"title": "A"}, tmp_path / "a.json")
+        save_result({"title": "B"}, tmp_path / "b.json")
+        (tmp_path / "b.json").unlink()
+        (tmp_path / "c.json").write_text('{"title": "C"}', encoding="utf-8")
+
+        result = list_history(history_dir=tmp_path)
+        assert sorted(r["filename"] for r in result) == ["a.json", "c.json"]
+        index = json.loads((tmp_path / HISTORY_INDEX_FILENAME).read_text(encoding="utf-8"))
+        assert sorted(index["entries"]) == ["a.json", "c.json"]
+
+    def test_sorted_by_mtime(self, tmp_path):
+        import os
+        save_result({"title": "오래된"}, tmp_path / "old.json")
+        save_result({"title": "최신"}, tmp_path / "new.json")
+        os.utime(tmp_path / "old.json", (1, 1))
+        rebuild_history_index(tmp_path)
+        result = list_history(history_dir=tmp_path)
+        assert result[0]["filename"] == "new.json"
+
+    def test_corrupted_index_recovered(self, tmp_path):
+        save_result({"title": "A"}, tmp_path / "a.json")
+        (tmp_path / HISTORY_INDEX_FILENAME).write_text("broken", encoding="utf-8")
+        assert list_history(history_dir=tmp_path)[0]["summary"] == "A"
+
+    def test_rebuild(self, tmp_path):
+        save_result({"title": "원래 요약"}, tmp_path / "a.json")
+        (tmp_path / "a.json").write_text('{"title": "바뀐 요약"}', encoding="utf-8")
+        assert rebuild_history_index(tmp_path) == 1
+        assert list_history(history_dir=tmp_path)[0]["summary"] == "바뀐 요약"
+
+    def test_rebuild_nonexistent_dir(self, tmp_path):
+        assert rebuild_history_index(tmp_path / "nonexistent") == 0
+
+
+class TestSearchHistory:
+    """히스토리 검색 테스트."""
+
+    def _seed(self, history_dir):
+        save_result({"title": "마케팅 주간 회의 정리", "content": "캠페인 예산 결정"}, history_dir / "a.json")
+        save_result({"title": "백엔드 배포 회고", "items": ["롤백 절차", "release checklist"]}, history_dir / "b.json")
+        save_result({"title": "채용 면접 피드백"}, history_dir / "c.json")
+
+    def test_finds_by_title(self, tmp_path):
+        self._seed(tmp_path)
+        results = search_history_index("마케팅 회의", history_dir=tmp_path)
+        assert results[0]["filename"] == "a.json"
+        assert results[0]["summary"] == "마케팅 주간 회의 정리"
+
+    def test_korean_particles_match(self, tmp_path):
+        self._seed(tmp_path)
+        results = search_history_index("배포는", history_dir=tmp_path)
+        assert results[0]["filename"] == "b.json"
+
+    def test_nested_values_indexed(self, tmp_path):
+        self._seed(tmp_path)
+        results = search_history_index("Release", history_dir=tmp_path)
+        assert [r["filename"] for r in results] == ["b.json"]
+
+    def test_no_match(self, tmp_path):
+        self._seed(tmp_path)
+        assert search_history_index("zzzz", history_dir=tmp_path) == []
+
+    def test_limit(self, tmp_path):
+        self._seed(tmp_path)
+        assert len(search_history_index("회의 배포 면접", limit=2, history_dir=tmp_path)) == 2
+
+    def test_files_added_without_save_result(self, tmp_path):
+        self._seed(tmp_path)
+        (tmp_path / "d.json").write_text('{"title": "보안 점검"}', encoding="utf-8")
+        results = search_history_index("보안", history_dir=tmp_path)
+        assert results[0]["filename"] == "d.json"
+
+    def test_removed_files_excluded(self, tmp_path):
+        self._seed(tmp_path)
+        search_history_index("마케팅", history_dir=tmp_path)
+        (tmp_path / "a.json").unlink()
+        assert search_history_index("마케팅", history_dir=tmp_path) == []
+
+    def test_nonexistent_dir(self, tmp_path):
+        assert search_history_index("회의", history_dir=tmp_path / "none") == []
+
+
+class TestLoadHistoryResult:
+    """히스토리 파일 로드 테스트."""
+
+    def test_load(self, tmp_path):
+        save_result({"title": "분석"}, tmp_path / "a.json")
+        assert load_history_result("a.json", tmp_path) == {"title": "분석"}
+
+    def test_rejects_path_traversal(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_history_result("../secret.json", tmp_path)
+
+    def test_rejects_index_file(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_history_result(HISTORY_INDEX_FILENAME, tmp_path)
+
+    def test_missing(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_history_result("none.json", tmp_path)
+
+
+class TestHistoryRetention:
+    """히스토리 보존 정책 및 보관 세그먼트 테스트."""
+
+    def _seed(self, history_dir, count=5):
+        import os
+        for i in range(count):
+            path = history_dir / f"analysis_{i}.json"
+            save_result({"title": f"분석 {i}", "body": "x" * 100}, path)
+            # i가 클수록 최신
+            os.utime(path, (1000 + i * 86400, 1000 + i * 86400))
+        rebuild_history_index(history_dir)
+
+    def _save_at(self, history_dir, days):
+        """day일째 수정된 결과를 추가로 저장한다."""
+        import os
+        for i in days:
+            path = history_dir / f"analysis_{i}.json"
+            save_result({"title": f"분석 {i}"}, path)
+            os.utime(path, (1000 + i * 86400, 1000 + i * 86400))
+
+    def test_no_limits_noop(self, tmp_path):
+        self._seed(tmp_path)
+        assert apply_history_retention(tmp_path) == []
+
+    def test_within_limits_noop(self, tmp_path):
+        self._seed(tmp_path)
+        assert apply_history_retention(tmp_path, max_count=10) == []
+        assert not (tmp_path / HISTORY_ARCHIVE_DIRNAME).exists()
+
+    def test_max_count_archives_oldest_to_low_watermark(self, tmp_path):
+        self._seed(tmp_path, count=6)
+        archived = apply_history_retention(tmp_path, max_count=5)
+        # 한도 5의 80% = 4건만 파일로 유지
+        assert sorted(archived) == ["analysis_0.json", "analysis_1.json"]
+        assert not (tmp_path / "analysis_0.json").exists()
+        assert len(list((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))) == 1
+
+    def test_max_age(self, tmp_path):
+        self._seed(tmp_path)
+        now = 1000 + 4 * 86400
+        archived = apply_history_retention(tmp_path, max_age_days=2.5, now=now)
+        assert sorted(archived) == ["analysis_0.json", "analysis_1.json"]
+
+    def test_max_age_keeps_newest(self, tmp_path):
+        self._seed(tmp_path, count=2)
+        archived = apply_history_retention(tmp_path, max_age_days=1, now=10**10)
+        assert archived == ["analysis_0.json"]
+
+    def test_max_bytes(self, tmp_path):
+        self._seed(tmp_path)
+        size = (tmp_path / "analysis_0.json").stat().st_size
+        archived = apply_history_retention(tmp_path, max_bytes=size * 3)
+        # 80% 예산(2.4건) 안에 드는 최신 2건만 유지
+        assert sorted(archived) == ["analysis_0.json", "analysis_1.json", "analysis_2.json"]
+
+    def test_archived_still_listed(self, tmp_path):
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        result = list_history(limit=10, history_dir=tmp_path)
+        assert len(result) == 5
+        by_name = {r["filename"]: r for r in result}
+        assert by_name["analysis_0.json"]["archived"] is True
+        assert by_name["analysis_0.json"]["summary"] == "분석 0"
+        assert by_name["analysis_4.json"]["archived"] is False
+
+    def test_archived_loadable_and_searchable(self, tmp_path):
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        assert load_history_result("analysis_0.json", tmp_path)["title"] == "분석 0"
+        results = search_history_index("analysis_0", history_dir=tmp_path)
+        assert results[0]["filename"] == "analysis_0.json"
+
+    def test_rebuild_keeps_archived(self, tmp_path):
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        (tmp_path / HISTORY_INDEX_FILENAME).unlink()
+        assert rebuild_history_index(tmp_path) == 5
+        assert load_history_result("analysis_1.json", tmp_path)["title"] == "분석 1"
+
+    def test_small_segments_merged(self, tmp_path):
+        self._seed(tmp_path, count=6)
+        apply_history_retention(tmp_path, max_count=5)
+        self._save_at(tmp_path, range(6, 9))
+        apply_history_retention(tmp_path, max_count=5)
+        segments = list((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))
+        assert len(segments) == 1
+        for i in range(5):
+            assert load_history_result(f"analysis_{i}.json", tmp_path)["title"] == f"분석 {i}"
+
+    def test_prune_archive_by_bytes_drops_oldest_segment(self, tmp_path, monkeypatch):
+        from slack_to_notion import analyzer
+        monkeypatch.setattr(analyzer, "HISTORY_SEGMENT_TARGET_BYTES", 0)
+        self._seed(tmp_path, count=6)
+        apply_history_retention(tmp_path, max_count=5)
+        save_result({"title": "분석 6"}, tmp_path / "analysis_6.json")
+        save_result({"title": "분석 7"}, tmp_path / "analysis_7.json")
+        apply_history_retention(tmp_path, max_count=5)
+        segments = sorted((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))
+        assert len(segments) == 2
+
+        deleted = prune_history_archive(tmp_path, max_bytes=segments[-1].stat().st_size)
+        assert sorted(deleted) == ["analysis_0.json", "analysis_1.json"]
+        assert not segments[0].exists()
+        names = {r["filename"] for r in list_history(limit=20, history_dir=tmp_path)}
+        assert "analysis_0.json" not in names
+        assert "analysis_2.json" in names
+        assert search_history_index("analysis_0", history_dir=tmp_path) == []
+        with pytest.raises(FileNotFoundError):
+            load_history_result("analysis_0.json", tmp_path)
+
+    def test_prune_archive_by_age(self, tmp_path):
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        segment = next((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))
+        # 한도 2의 80%(1건)만 파일로 남고 보관된 4건 중 가장 최신은 3일째 결과
+        newest = 1000 + 3 * 86400
+        assert prune_history_archive(tmp_path, max_age_days=30, now=newest + 29 * 86400) == []
+        deleted = prune_history_archive(tmp_path, max_age_days=30, now=newest + 31 * 86400)
+        assert len(deleted) == 4
+        assert not segment.exists()
+        assert [r["filename"] for r in list_history(limit=10, history_dir=tmp_path)] == ["analysis_4.json"]
+
+    def test_prune_archive_by_age_after_merge(self, tmp_path):
+        """합쳐 다시 쓴 세그먼트도 파일 수정시각이 아니라 담긴 결과의 시각으로 만료된다."""
+        self._seed(tmp_path, count=6)
+        apply_history_retention(tmp_path, max_count=5)
+        self._save_at(tmp_path, range(6, 9))
+        apply_history_retention(tmp_path, max_count=5)
+        (segment,) = (tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz")
+        # 병합된 세그먼트의 가장 최신 결과는 4일째 결과 (5~8일째는 파일로 유지)
+        newest = 1000 + 4 * 86400
+        assert prune_history_archive(tmp_path, max_age_days=30, now=newest + 29 * 86400) == []
+        deleted = prune_history_archive(tmp_path, max_age_days=30, now=newest + 31 * 86400)
+        assert sorted(deleted) == [f"analysis_{i}.json" for i in range(5)]
+        assert not segment.exists()
+
+    def test_segment_span_limits_merge(self, tmp_path):
+        """수정시각 범위가 HISTORY_SEGMENT_MAX_SPAN_DAYS를 넘으면 합치지 않아 오래된 세그먼트가 먼저 만료된다."""
+        self._seed(tmp_path, count=6)
+        apply_history_retention(tmp_path, max_count=5)
+        # 2~5일째와 60~61일째 결과가 옮겨지므로 0~1일째 세그먼트와 합치면 범위를 넘는다
+        self._save_at(tmp_path, range(60, 66))
+        apply_history_retention(tmp_path, max_count=5)
+        assert len(list((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))) == 2
+        deleted = prune_history_archive(tmp_path, max_age_days=30, now=1000 + 40 * 86400)
+        assert sorted(deleted) == ["analysis_0.json", "analysis_1.json"]
+
+    def test_prune_legacy_segment_name_reads_records(self, tmp_path):
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        segment = next((tmp_path / HISTORY_ARCHIVE_DIRNAME).glob("*.jsonl.gz"))
+        legacy = segment.with_name("segment-1.jsonl.gz")
+        segment.rename(legacy)
+        rebuild_history_index(tmp_path)
+        newest = 1000 + 3 * 86400
+        assert prune_history_archive(tmp_path, max_age_days=30, now=newest + 29 * 86400) == []
+        assert len(prune_history_archive(tmp_path, max_age_days=30, now=newest + 31 * 86400)) == 4
+
+    def test_live_file_wins_over_archive(self, tmp_path):
+        """보관 후 같은 이름으로 다시 저장하면 파일이 우선한다."""
+        self._seed(tmp_path)
+        apply_history_retention(tmp_path, max_count=2)
+        save_result({"title": "다시 저장"}, tmp_path / "analysis_0.json")
+        by_name = {r["filename"]: r for r in list_history(limit=10, history_dir=tmp_path)}
+        assert by_name["analysis_0.json"]["archived"] is False
+        assert load_history_result("analysis_0.json", tmp_path)["title"] == "다시 저장"
@@ -0,0 +1,40 @@
+"""벤치마크 스크립트 스모크 테스트.
+
+benchmarks/run.py를 가장 작은 크기로 한 번씩 실행해, 서버 구조가 바뀌어도
+가짜 서버에 연결한 클라이언트로 모든 시나리오가 실행되는지 확인한다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_RUN_SCRIPT = Path(__file__).resolve().parent.parent / "benchmarks" / "run.py"
+_TOKEN_ENV = ("SLACK_BOT_TOKEN", "SLACK_USER_TOKEN", "NOTION_API_KEY", "NOTION_PARENT_PAGE_URL")
+
+
+class TestBenchmarkRun:
+    """엔드투엔드 벤치마크 실행 테스트."""
+
+    def test_all_scenarios_smallest_size(self, tmp_path):
+        output = tmp_path / "result.json"
+        # 실제 토큰 없이 가짜 서버 클라이언트만으로 실행되어야 한다
+        env = {key: value for key, value in os.environ.items() if key not in _TOKEN_ENV}
+        subprocess.run(
+            [
+                sys.executable, str(_RUN_SCRIPT),
+                "--scenarios", "format_messages", "fetch_threads", "check_active_users", "create_notion_page",
+                "--sizes", "5", "--repeat", "1", "--output", str(output),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+            env=env,
+        )
+        results = json.loads(output.read_text(encoding="utf-8"))["results"]
+        assert sorted(r["scenario"] for r in results) == [
+            "check_active_users", "create_notion_page", "fetch_threads", "format_messages",
+        ]
+        assert all(r["total_requests"] > 0 for r in results)
@@ -0,0 +1,111 @@
+"""헤드리스 CLI 테스트."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from slack_to_notion import cli
+
+
+@pytest.fixture
+def slack():
+    client = MagicMock()
+    client.get_channel_name.return_value = "general"
+    client.find_channel.return_value = None
+    client.fetch_channels_messages.return_value = {
+        "C00000001": [{"ts": "1700000000.000000", "user": "U001", "user_name": "김동영", "text": "배포 완료"}],
+    }
+    with patch("slack_to_notion.cli.get_slack_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def notion():
+    client = MagicMock()
+    client.check_duplicate.return_value = False
+    client.create_analysis_page.return_value = "https://notion.so/page-1"
+    env = {"NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de"}
+    with patch("slack_to_notion.cli.get_notion_client", return_value=client), \
+         patch.dict("os.environ", env):
+        yield client
+
+
+class TestExportCommand:
+    """export 명령 테스트."""
+
+    def test_writes_formatted_text(self, slack):
+        code = cli.main(["export", "--channels", "C00000001", "--since", "2023-11-01", "--output", "out.txt"])
+        assert code == 0
+        text = Path("out.txt").read_text(encoding="utf-8")
+        assert "=== Channel: general (1 messages) ===" in text
+        assert "배포 완료" in text
+        _, limit, oldest, latest = slack.fetch_channels_messages.call_args[0]
+        assert limit == cli.DEFAULT_EXPORT_LIMIT
+        assert oldest and latest is None
+
+    def test_stdout_by_default(self, slack, capsys):
+        assert cli.main(["export", "--channels", "C00000001"]) == 0
+        assert "배포 완료" in capsys.readouterr().out
+
+    def test_failed_channel_exit_code(self, slack, capsys):
+        assert cli.main(["export", "--channels", "C00000001,없는채널", "--output", "out.txt"]) == 1
+        assert "없는채널" in capsys.readouterr().err
+        assert "배포 완료" in Path("out.txt").read_text(encoding="utf-8")
+
+    def test_upload(self, slack, notion, capsys):
+        assert cli.main(["export", "--channels", "C00000001", "--upload", "--title", "일일 기록"]) == 0
+        assert capsys.readouterr().out.strip() == "https://notion.so/page-1"
+        assert notion.create_analysis_page.call_args[0][1] == "일일 기록"
+        assert "배포 완료" in notion.build_page_blocks.call_args[0][0]
+
+    def test_upload_without_parent_page(self, slack, capsys):
+        with patch.dict("os.environ", {}, clear=True):
+            assert cli.main(["export", "--channels", "C00000001", "--upload"]) == 2
+        assert "NOTION_PARENT_PAGE_URL" in capsys.readouterr().err
+        slack.fetch_channels_messages.assert_not_called()
+
+    def test_invalid_time_range(self, slack, capsys):
+        assert cli.main(["export", "--channels", "C00000001", "--since", "어제쯤"]) == 2
+        assert "[에러]" in capsys.readouterr().err
+
+
+class TestUploadCommand:
+    """upload 명령 테스트."""
+
+    def test_uploads_file(self, notion, capsys):
+        Path("summary.md").write_text("# 주간 요약\n- 배포 2건", encoding="utf-8")
+        assert cli.main(["upload", "--title", "주간 요약", "--file", "summary.md"]) == 0
+        assert capsys.readouterr().out.strip() == "https://notion.so/page-1"
+        notion.build_page_blocks.assert_called_once_with("# 주간 요약\n- 배포 2건")
+
+    def test_duplicate_title(self, notion, capsys):
+        notion.check_duplicate.return_value = True
+        Path("summary.md").write_text("내용", encoding="utf-8")
+        assert cli.main(["upload", "--title", "주간 요약", "--file", "summary.md"]) == 1
+        assert "동일한 제목" in capsys.readouterr().err
+
+    def test_missing_file(self, notion, capsys):
+        assert cli.main(["upload", "--title", "주간 요약", "--file", "없는파일.md"]) == 1
+
+
+class TestArguments:
+    """인자 처리 테스트."""
+
+    def test_help_returns_without_systemexit(self, capsys):
+        assert cli.main(["export", "--help"]) == 0
+        assert "--channels" in capsys.readouterr().out
+
+    def test_missing_required_argument(self, capsys):
+        assert cli.main(["export"]) == 2
+
+    def test_dispatched_from_server_main(self, slack):
+        from slack_to_notion.mcp_server import main
+
+        argv = ["slack-to-notion-mcp", "export", "--channels", "C00000001", "--output", "out.txt"]
+        with patch.object(sys, "argv", argv), \
+             patch("slack_to_notion.mcp_server.mcp.run") as run:
+            assert main() == 0
+        run.assert_not_called()
+        assert Path("out.txt").exists()
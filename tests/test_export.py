@@ -0,0 +1,67 @@
+"""내보내기 파이프라인 테스트."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from slack_to_notion.errors import NotionClientError, SlackClientError
+from slack_to_notion.export import collect_channels, notion_parent_page_id, upload_page
+
+
+class TestCollectChannels:
+    """채널 수집 테스트."""
+
+    def test_resolves_names_and_keeps_failures(self):
+        client = MagicMock()
+        client.get_channel_name.return_value = "general"
+        client.find_channel.side_effect = lambda name: {"id": "C00000002", "name": "dev"} if name == "#dev" else None
+        client.fetch_channels_messages.return_value = {
+            "C00000001": [{"ts": "1.0", "text": "a"}],
+            "C00000002": SlackClientError("채널에 접근할 수 없습니다"),
+        }
+        targets = collect_channels(client, ["C00000001", "#dev", "없는채널"], 100)
+        assert [t["channel_name"] for t in targets] == ["general", "dev", "없는채널"]
+        assert targets[0]["messages"] == [{"ts": "1.0", "text": "a"}]
+        assert targets[1]["error"] == "채널에 접근할 수 없습니다"
+        assert "찾을 수 없습니다" in targets[2]["error"]
+        client.fetch_channels_messages.assert_called_once_with(["C00000001", "C00000002"], 100, None, None)
+        client.resolve_user_names.assert_called_once()
+
+
+class TestUploadPage:
+    """Notion 업로드 테스트."""
+
+    def test_duplicate_title_rejected(self):
+        client = MagicMock()
+        client.check_duplicate.return_value = True
+        with pytest.raises(NotionClientError, match="동일한 제목"):
+            upload_page(client, "parent", "제목", "내용")
+        client.create_analysis_page.assert_not_called()
+
+    def test_resume_appends_from_saved_offset(self):
+        client = MagicMock()
+        client.build_page_blocks.return_value = [{"type": "paragraph"}] * 250
+        resume = {"creating": True, "page_id": "page-1", "page_url": "https://notion.so/page-1", "appended": 200}
+        assert upload_page(client, "parent", "제목", "내용", resume=resume) == "https://notion.so/page-1"
+        client.check_duplicate.assert_not_called()
+        client.create_analysis_page.assert_not_called()
+        assert client.append_blocks.call_args[0][2] == 200
+
+    def test_resume_adopts_page_created_before_crash(self):
+        client = MagicMock()
+        client.build_page_blocks.return_value = [{"type": "paragraph"}] * 250
+        client.find_page.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        saved = {}
+        url = upload_page(client, "parent", "제목", "내용", checkpoint=lambda **values: saved.update(values),
+                          resume={"creating": True})
+        assert url == "https://notion.so/page-1"
+        client.check_duplicate.assert_not_called()
+        client.create_analysis_page.assert_not_called()
+        assert saved["page_id"] == "page-1"
+        assert client.append_blocks.call_args[0][2] == 100
+
+    def test_parent_page_from_env(self):
+        with patch.dict("os.environ", {"NOTION_PARENT_PAGE_ID": "abc123def456abc123def456abc123de"}, clear=True):
+            assert notion_parent_page_id() == "abc123def456abc123def456abc123de"
+        with patch.dict("os.environ", {}, clear=True):
+            assert notion_parent_page_id() is None
@@ -0,0 +1,207 @@
+"""백그라운드 작업 모듈 테스트."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from slack_to_notion import jobs, progress
+from slack_to_notion.jobs import JobError, JobManager
+
+
+def _dead_pid() -> int:
+    result = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    return int(result.stdout)
+
+
+class TestJobManager:
+    """작업 실행/상태 기록 테스트."""
+
+    def setup_method(self):
+        self.manager = JobManager(Path("jobs"))
+
+    def test_submit_runs_handler(self):
+        def handler(job):
+            job.save_state(stage="collected", count=len(job.params["items"]))
+            return {"count": job.state["count"]}
+
+        self.manager.register("count", handler)
+        job = self.manager.submit("count", {"items": [1, 2, 3]})
+        assert job["status"] == jobs.QUEUED
+        assert self.manager.join(5)
+
+        record = self.manager.get(job["id"])
+        assert record["status"] == jobs.SUCCEEDED
+        assert record["stage"] == "collected"
+        assert record["result"] == {"count": 3}
+        assert record["started_at"] and record["finished_at"]
+
+    def test_state_persisted_as_json(self):
+        self.manager.register("noop", lambda job: {})
+        job = self.manager.submit("noop", {"a": 1})
+        self.manager.join(5)
+        data = json.loads(Path("jobs", f"{job['id']}.json").read_text(encoding="utf-8"))
+        assert data["params"] == {"a": 1}
+        assert data["status"] == jobs.SUCCEEDED
+
+    def test_progress_recorded(self, monkeypatch):
+        monkeypatch.setattr(progress, "MIN_REPORT_INTERVAL", 0)
+
+        def handler(job):
+            progress.report(2, 4, "절반")
+            return {}
+
+        self.manager.register("work", handler)
+        job = self.manager.submit("work", {})
+        self.manager.join(5)
+        assert self.manager.get(job["id"])["progress"] == {"progress": 2, "total": 4, "message": "절반"}
+
+    def test_failure_recorded(self):
+        class FakeError(Exception):
+            def __init__(self):
+                self.message = "토큰이 만료되었습니다"
+                super().__init__(self.message)
+
+        def handler(job):
+            raise FakeError()
+
+        self.manager.register("fail", handler)
+        job = self.manager.submit("fail", {})
+        self.manager.join(5)
+        record = self.manager.get(job["id"])
+        assert record["status"] == jobs.FAILED
+        assert record["error"] == "토큰이 만료되었습니다"
+
+    def test_unknown_kind(self):
+        with pytest.raises(JobError, match="지원하지 않는"):
+            self.manager.submit("unknown", {})
+
+    def test_invalid_job_id(self):
+        with pytest.raises(JobError, match="형식"):
+            self.manager.get("../preferences")
+        with pytest.raises(JobError, match="찾을 수 없습니다"):
+            self.manager.get("20260101-000000-abcdef")
+
+    def test_cancel_running_job(self):
+        started = threading.Event()
+
+        def handler(job):
+            started.set()
+            while True:
+                progress.check_cancelled()
+                threading.Event().wait(0.01)
+
+        self.manager.register("long", handler)
+        job = self.manager.submit("long", {})
+        assert started.wait(5)
+        self.manager.cancel(job["id"])
+        self.manager.join(5)
+        assert self.manager.get(job["id"])["status"] == jobs.CANCELLED
+
+    def test_cancel_queued_job_not_run(self):
+        release = threading.Event()
+        runs = []
+
+        def handler(job):
+            runs.append(job.id)
+            release.wait(5)
+            return {}
+
+        self.manager.register("block", handler)
+        first = self.manager.submit("block", {})
+        second = self.manager.submit("block", {})
+        assert self.manager.cancel(second["id"])["status"] == jobs.CANCELLED
+        release.set()
+        self.manager.join(5)
+        assert runs == [first["id"]]
+        with pytest.raises(JobError, match="이미 끝난"):
+            self.manager.cancel(second["id"])
+
+    def test_resume_interrupted_job(self):
+        record = {
+            "id": "20260101-000000-abcdef", "kind": "resume", "status": jobs.RUNNING, "stage": "uploading",
+            "params": {}, "state": {"messages": 10}, "progress": None, "result": None, "error": None,
+            "created_at": "", "started_at": "", "finished_at": None, "pid": _dead_pid(),
+        }
+        Path("jobs").mkdir()
+        Path("jobs", f"{record['id']}.json").write_text(json.dumps(record), encoding="utf-8")
+
+        self.manager.register("resume", lambda job: {"messages": job.state["messages"]})
+        assert self.manager.resume() == [record["id"]]
+        self.manager.join(5)
+        resumed = self.manager.get(record["id"])
+        assert resumed["status"] == jobs.SUCCEEDED
+        assert resumed["result"] == {"messages": 10}
+
+    def test_resume_skips_live_process(self):
+        self.manager.register("noop", lambda job: {})
+        job = self.manager.submit("noop", {})
+        self.manager.join(5)
+        assert JobManager(Path("jobs")).resume() == []
+        assert self.manager.get(job["id"])["status"] == jobs.SUCCEEDED
+
+    def test_finished_jobs_pruned(self, monkeypatch):
+        monkeypatch.setattr(jobs, "MAX_FINISHED_JOBS", 2)
+
+        def handler(job):
+            job.artifact_path(".txt").write_text("결과", encoding="utf-8")
+            return {}
+
+        self.manager.register("artifact", handler)
+        ids = []
+        for _ in range(4):
+            ids.append(self.manager.submit("artifact", {})["id"])
+            self.manager.join(5)
+        remaining = sorted(path.name for path in Path("jobs").iterdir())
+        assert len(remaining) == 4
+        assert all(name.startswith((ids[2], ids[3])) for name in remaining)
+
+    def _running_record(self, **fields) -> dict:
+        record = {
+            "id": "20260101-000000-abcdef", "kind": "resume", "status": jobs.RUNNING, "stage": None,
+            "params": {}, "state": {}, "progress": None, "result": None, "error": None,
+            "created_at": "", "started_at": "", "finished_at": None, "pid": os.getpid(),
+        }
+        record.update(fields)
+        Path("jobs").mkdir(exist_ok=True)
+        Path("jobs", f"{record['id']}.json").write_text(json.dumps(record), encoding="utf-8")
+        return record
+
+    def test_resume_when_pid_reused(self):
+        """끝난 프로세스의 PID를 다른 프로세스가 쓰고 있어도 소유자 잠금이 없으면 이어서 실행한다."""
+        record = self._running_record(owner="0123456789abcdef")
+        self.manager.register("resume", lambda job: {"ok": True})
+        assert self.manager.resume() == [record["id"]]
+        self.manager.join(5)
+        assert self.manager.get(record["id"])["status"] == jobs.SUCCEEDED
+
+    @pytest.mark.skipif(os.name == "nt", reason="fcntl 잠금으로 다른 프로세스를 흉내 낸다")
+    def test_live_owner_lock_blocks_resume_and_cancel(self):
+        owner = "fedcba9876543210"
+        record = self._running_record(owner=owner, pid=_dead_pid())
+        owners_dir = Path("jobs", ".owners")
+        owners_dir.mkdir(exist_ok=True)
+        # 다른 프로세스가 소유자 잠금을 잡고 있는 상황
+        holder = subprocess.Popen(
+            [sys.executable, "-c",
+             "import fcntl, sys; f = open(sys.argv[1], 'a+b'); fcntl.flock(f, fcntl.LOCK_EX); "
+             "print('locked', flush=True); sys.stdin.read()",
+             str(owners_dir / f"{owner}.lock")],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "locked"
+            self.manager.register("resume", lambda job: {})
+            assert self.manager.resume() == []
+            with pytest.raises(JobError, match="다른 프로세스"):
+                self.manager.cancel(record["id"])
+        finally:
+            holder.stdin.close()
+            holder.wait(5)
+        # 잠금을 잡은 프로세스가 끝나면 이어서 실행한다
+        assert self.manager.resume() == [record["id"]]
+        assert not (owners_dir / f"{owner}.lock").exists()
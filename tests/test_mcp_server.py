@@ -1,6 +1,7 @@
 """MCP 서버 도구 단위 테스트."""
 
 import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,7 +20,7 @@ class TestCreateNotionPage:
             env.update(env_vars)
 
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.blocks.children.list.return_value = {"results": []}
@@ -40,7 +41,7 @@ class TestCreateNotionPage:
             "NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de",
         }
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.blocks.children.list.return_value = {
@@ -55,7 +56,7 @@ class TestCreateNotionPage:
     def test_missing_env_var(self):
         env = {"NOTION_API_KEY": "fake-key"}
         with patch.dict("os.environ", env, clear=True), \
-             patch("slack_to_notion.mcp_server._notion_client", None):
+             patch("slack_to_notion.clients._notion_client", None):
             from slack_to_notion.mcp_server import create_notion_page
             result = create_notion_page("제목", "내용")
             assert "NOTION_PARENT_PAGE_URL" in result
@@ -68,7 +69,7 @@ class TestFetchThreads:
     def test_multiple_threads(self):
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.conversations_replies.side_effect = [
@@ -92,7 +93,7 @@ class TestFetchThreads:
         """일부 스레드 수집 실패 시 나머지는 정상 수집."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_api = mock_cls.return_value
 
@@ -117,7 +118,7 @@ class TestFetchThreads:
         """channel_name 미지정 시 channel_id 사용."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.conversations_replies.return_value = {
@@ -139,7 +140,13 @@ class TestSavePreferenceTool:
             from slack_to_notion.mcp_server import save_preference_tool
             result = save_preference_tool("회의록 위주로 정리해줘")
             assert "저장되었습니다" in result
-            mock_save.assert_called_once_with("회의록 위주로 정리해줘")
+            mock_save.assert_called_once_with("회의록 위주로 정리해줘", key="")
+
+    def test_with_key(self):
+        with patch("slack_to_notion.mcp_server.save_preference") as mock_save:
+            from slack_to_notion.mcp_server import save_preference_tool
+            save_preference_tool("회의록은 타임라인 순으로", key="회의록")
+            mock_save.assert_called_once_with("회의록은 타임라인 순으로", key="회의록")
 
 
 class TestGetPreferences:
@@ -181,6 +188,63 @@ class TestListAnalysisHistory:
             assert "없습니다" in result
 
 
+class TestSearchHistory:
+    """search_history 도구 테스트."""
+
+    def test_with_results(self):
+        with patch("slack_to_notion.mcp_server.search_history_index") as mock_search:
+            mock_search.return_value = [
+                {"filename": "a.json", "path": "/tmp/a.json", "summary": "마케팅 분석", "score": 1.0},
+            ]
+            from slack_to_notion.mcp_server import search_history
+            result = search_history("마케팅")
+            assert "1건" in result
+            assert "a.json - 마케팅 분석" in result
+
+    def test_empty(self):
+        with patch("slack_to_notion.mcp_server.search_history_index") as mock_search:
+            mock_search.return_value = []
+            from slack_to_notion.mcp_server import search_history
+            assert "없습니다" in search_history("마케팅")
+
+
+class TestLoadHistory:
+    """load_history 도구 테스트."""
+
+    def test_success(self):
+        import json
+        with patch("slack_to_notion.mcp_server.load_history_result") as mock_load:
+            mock_load.return_value = {"title": "마케팅 분석"}
+            from slack_to_notion.mcp_server import load_history
+            assert json.loads(load_history("a.json")) == {"title": "마케팅 분석"}
+
+    def test_invalid_filename(self):
+        from slack_to_notion.mcp_server import load_history
+        assert "[에러]" in load_history("../a.json")
+
+    def test_missing_file(self):
+        from slack_to_notion.mcp_server import load_history
+        assert "[에러]" in load_history("none.json")
+
+
+class TestRebuildHistoryIndexTool:
+    """rebuild_history_index_tool 도구 테스트."""
+
+    def test_success(self):
+        with patch("slack_to_notion.mcp_server.rebuild_history_index") as mock_rebuild:
+            mock_rebuild.return_value = 3
+            from slack_to_notion.mcp_server import rebuild_history_index_tool
+            result = rebuild_history_index_tool()
+            assert "3건" in result
+
+    def test_error(self):
+        with patch("slack_to_notion.mcp_server.rebuild_history_index") as mock_rebuild:
+            mock_rebuild.side_effect = OSError("권한 없음")
+            from slack_to_notion.mcp_server import rebuild_history_index_tool
+            result = rebuild_history_index_tool()
+            assert "[에러]" in result
+
+
 class TestCreateNotionPageBlockConversion:
     """페이지 생성 시 블록 변환이 올바르게 전달되는지 테스트."""
 
@@ -190,7 +254,7 @@ class TestCreateNotionPageBlockConversion:
             "NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de",
         }
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.blocks.children.list.return_value = {"results": []}
@@ -218,7 +282,7 @@ class TestListChannelsErrors:
         """SlackClientError 발생 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             from slack_sdk.errors import SlackApiError
             error_response = MagicMock()
@@ -235,7 +299,7 @@ class TestListChannelsErrors:
         """예상치 못한 예외 발생 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_list.side_effect = RuntimeError("네트워크 오류")
 
@@ -246,12 +310,99 @@ class TestListChannelsErrors:
     def test_missing_token(self):
         """토큰 미설정 시 에러 메시지 반환."""
         with patch.dict("os.environ", {}, clear=True), \
-             patch("slack_to_notion.mcp_server._slack_client", None):
+             patch("slack_to_notion.clients._slack_client", None):
             from slack_to_notion.mcp_server import list_channels
             result = list_channels()
             assert "[에러]" in result
 
 
+class TestFindChannel:
+    """find_channel 도구 테스트."""
+
+    def _call_tool(self, name):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_cls.return_value.conversations_list.return_value = {
+                "channels": [{"id": "C001", "name": "general", "topic": {"value": ""}, "num_members": 3}],
+                "response_metadata": {"next_cursor": ""},
+            }
+            from slack_to_notion.mcp_server import find_channel
+            return find_channel(name)
+
+    def test_found(self):
+        import json
+        result = json.loads(self._call_tool("#general"))
+        assert result["id"] == "C001"
+
+    def test_not_found(self):
+        result = self._call_tool("missing")
+        assert "찾을 수 없습니다" in result
+
+
+class TestSearchMessages:
+    """search_messages 도구 테스트."""
+
+    def test_search_after_fetch(self):
+        env = {
+            "SLACK_BOT_TOKEN": "xoxb-fake",
+            "SLACK_TO_NOTION_MESSAGE_STORE": "1",
+            "SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS": "0",
+        }
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_api = mock_cls.return_value
+            mock_api.conversations_history.return_value = {
+                "messages": [
+                    {"ts": "1739612400.000000", "user": "U001", "text": "백엔드 배포 일정 공유"},
+                    {"ts": "1739612500.000000", "user": "U002", "text": "점심 메뉴"},
+                ]
+            }
+            mock_api.users_info.return_value = {
+                "user": {"profile": {"display_name": "김동영", "real_name": ""}}
+            }
+
+            from slack_to_notion.mcp_server import fetch_messages, search_messages
+            fetch_messages("C001")
+            result = search_messages("배포 일정")
+            assert "Result count: 1" in result
+            assert "백엔드 배포 일정 공유" in result
+            assert "김동영" in result
+            assert mock_api.conversations_history.call_count == 1
+
+    def test_no_results(self):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake", "SLACK_TO_NOTION_MESSAGE_STORE": "1"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient"):
+            from slack_to_notion.mcp_server import search_messages
+            result = search_messages("없는 내용")
+            assert "검색 결과가 없습니다" in result
+
+    def test_store_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SLACK_TO_NOTION_MESSAGE_STORE", raising=False)
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_cls.return_value.conversations_history.return_value = {
+                "messages": [{"ts": "1739612400.000000", "user": "U001", "text": "백엔드 배포 일정 공유"}]
+            }
+            from slack_to_notion.mcp_server import fetch_messages, search_messages
+            fetch_messages("C001")
+            result = search_messages("배포 일정")
+            assert "SLACK_TO_NOTION_MESSAGE_STORE" in result
+            assert not list(Path(".claude/slack-to-notion").glob("messages-*.db"))
+
+    def test_invalid_date(self):
+        from slack_to_notion.mcp_server import search_messages
+        result = search_messages("배포", since="2026/01/01")
+        assert "[에러]" in result
+        assert "YYYY-MM-DD" in result
+
+
 class TestFetchMessagesErrors:
     """fetch_messages 에러 처리 테스트."""
 
@@ -262,7 +413,7 @@ class TestFetchMessagesErrors:
         """잘못된 channel_id로 조회 시 에러 메시지 반환."""
         env = self._setup_env()
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             from slack_sdk.errors import SlackApiError
             error_response = MagicMock()
@@ -279,7 +430,7 @@ class TestFetchMessagesErrors:
         """limit=0은 내부에서 1로 보정되어 정상 호출."""
         env = self._setup_env()
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_history.return_value = {"messages": []}
 
@@ -294,7 +445,7 @@ class TestFetchMessagesErrors:
         """limit 음수는 1로 보정."""
         env = self._setup_env()
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_history.return_value = {"messages": []}
 
@@ -307,7 +458,7 @@ class TestFetchMessagesErrors:
         """limit 1001은 1000으로 보정."""
         env = self._setup_env()
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_history.return_value = {"messages": []}
 
@@ -317,6 +468,146 @@ class TestFetchMessagesErrors:
             assert call_kwargs["limit"] == 1000
 
 
+class TestFetchMessagesTimeRange:
+    """fetch_messages/format_messages 기간 지정 테스트."""
+
+    def test_since_until_mapped_to_oldest_latest(self):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_cls.return_value.conversations_history.return_value = {"messages": []}
+
+            from slack_to_notion.mcp_server import fetch_messages
+            result = fetch_messages(
+                "C001", since="2026-02-09", until="2026-02-15", timezone="Asia/Seoul",
+                oldest="1.000000",
+            )
+            assert "[에러]" not in result
+            call_kwargs = mock_cls.return_value.conversations_history.call_args[1]
+            assert call_kwargs["oldest"] == "1770562800.000000"
+            assert call_kwargs["latest"] == "1771167600.000000"
+
+    def test_invalid_since(self):
+        from slack_to_notion.mcp_server import fetch_messages
+        result = fetch_messages("C001", since="지난주")
+        assert "[에러]" in result
+        assert "날짜 형식" in result
+
+    def test_format_messages_invalid_timezone(self):
+        from slack_to_notion.mcp_server import format_messages
+        result = format_messages("C001", "general", since="2026-02-09", timezone="Nowhere/City")
+        assert "[에러]" in result
+        assert "시간대" in result
+
+
+class TestFormatMessagesExpandThreads:
+    """format_messages 스레드 펼침 테스트."""
+
+    def _run(self, **kwargs):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_api = mock_cls.return_value
+            mock_api.conversations_history.return_value = {"messages": [
+                {"ts": "1700000000.000000", "user": "U001", "text": "큰 스레드", "reply_count": 3},
+                {"ts": "1700000100.000000", "user": "U001", "text": "작은 스레드", "reply_count": 1},
+                {"ts": "1700000200.000000", "user": "U001", "text": "일반 메시지"},
+            ]}
+            mock_api.conversations_replies.side_effect = lambda channel, ts: {"messages": [
+                {"ts": ts, "user": "U001", "text": "parent"},
+                *[{"ts": f"{ts}{i}", "user": "U002", "text": f"답글{ts[-8:-7]}-{i}"} for i in range(3)],
+            ]}
+            mock_api.users_info.side_effect = lambda user: {"user": {"profile": {"display_name": user}}}
+
+            from slack_to_notion.mcp_server import format_messages
+            return format_messages("C001", "dev", **kwargs), mock_api
+
+    def test_expand_with_threshold(self):
+        result, mock_api = self._run(expand_threads=True, min_replies=2)
+        assert mock_api.conversations_replies.call_count == 1
+        assert "\u21b3 U002" in result
+        assert "Expanded threads: 1 (replies: 3)" in result
+
+    def test_reply_budget(self):
+        result, mock_api = self._run(expand_threads=True, max_replies=2)
+        assert mock_api.conversations_replies.call_count == 1
+        assert "... (답글 1개 생략)" in result
+
+    def test_disabled_by_default(self):
+        result, mock_api = self._run()
+        assert mock_api.conversations_replies.call_count == 0
+        assert "[스레드 - 답글 3개]" in result
+
+
+class TestFormatMessagesChannelName:
+    """format_messages 채널 이름 자동 입력 테스트."""
+
+    def test_channel_name_filled_from_info(self):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_api = mock_cls.return_value
+            mock_api.conversations_history.return_value = {"messages": []}
+            mock_api.conversations_info.return_value = {"channel": {"id": "C001", "name": "general"}}
+
+            from slack_to_notion.mcp_server import fetch_channel_info, format_messages
+            assert "Channel: general" in format_messages("C001")
+            assert "Channel: general" in format_messages("C001")
+            assert '"name": "general"' in fetch_channel_info("C001")
+            assert mock_api.conversations_info.call_count == 1
+
+    def test_explicit_channel_name_skips_lookup(self):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_api = mock_cls.return_value
+            mock_api.conversations_history.return_value = {"messages": []}
+
+            from slack_to_notion.mcp_server import format_messages
+            assert "Channel: 마케팅" in format_messages("C001", "마케팅")
+            mock_api.conversations_info.assert_not_called()
+
+
+class TestFormatChannels:
+    """format_channels 도구 테스트."""
+
+    def test_combined_sections(self):
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
+        with patch.dict("os.environ", env, clear=False), \
+             patch("slack_to_notion.clients._slack_client", None), \
+             patch("slack_to_notion.slack_client.WebClient") as mock_cls:
+            mock_api = mock_cls.return_value
+            mock_api.conversations_list.return_value = {
+                "channels": [
+                    {"id": "C00000001", "name": "general"},
+                    {"id": "C00000002", "name": "dev-backend"},
+                ],
+                "response_metadata": {"next_cursor": ""},
+            }
+            mock_api.conversations_history.side_effect = lambda channel, limit, **kw: {
+                "messages": [{"ts": "1700000000.000000", "user": "U001", "text": f"{channel} 소식"}]
+            }
+            mock_api.users_info.return_value = {"user": {"profile": {"display_name": "김동영"}}}
+            mock_api.conversations_info.return_value = {"channel": {"id": "C00000001", "name": "general"}}
+
+            from slack_to_notion.mcp_server import format_channels
+            result = format_channels(["C00000001", "#dev-backend", "없는채널"])
+            assert "Channel count: 3" in result
+            assert "=== Channel: general (1 messages) ===" in result
+            assert "=== Channel: dev-backend (1 messages) ===" in result
+            assert "C00000002 소식" in result
+            assert "=== Channel: 없는채널 (수집 실패) ===" in result
+            assert mock_api.users_info.call_count == 1
+
+    def test_empty_channels(self):
+        from slack_to_notion.mcp_server import format_channels
+        assert "[에러]" in format_channels([])
+
+
 class TestFetchThreadErrors:
     """fetch_thread 에러 처리 테스트."""
 
@@ -324,7 +615,7 @@ class TestFetchThreadErrors:
         """잘못된 thread_ts로 조회 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             from slack_sdk.errors import SlackApiError
             error_response = MagicMock()
@@ -341,7 +632,7 @@ class TestFetchThreadErrors:
         """예상치 못한 예외 발생 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_replies.side_effect = ConnectionError("연결 실패")
 
@@ -357,7 +648,7 @@ class TestFormatMessagesErrors:
         """SlackClientError 발생 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             from slack_sdk.errors import SlackApiError
             error_response = MagicMock()
@@ -374,7 +665,7 @@ class TestFormatMessagesErrors:
         """예상치 못한 예외 발생 시 에러 메시지 반환."""
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_cls.return_value.conversations_history.side_effect = RuntimeError("오류")
 
@@ -411,6 +702,76 @@ class TestSaveAnalysisResultErrors:
             assert "[에러]" not in result
             assert "저장되었습니다" in result
 
+    def test_compression_env(self):
+        """SLACK_TO_NOTION_HISTORY_COMPRESSION 설정 시 압축 확장자를 붙여 저장."""
+        import json
+        with patch.dict("os.environ", {"SLACK_TO_NOTION_HISTORY_COMPRESSION": "gzip"}), \
+             patch("slack_to_notion.mcp_server.save_result") as mock_save:
+            from slack_to_notion.mcp_server import save_analysis_result
+            save_analysis_result(json.dumps({"title": "테스트"}), "test.json")
+            path, compression = mock_save.call_args[0][1:]
+            assert path.name == "test.json.gz"
+            assert compression == "gzip"
+
+    def _wait_retention(self):
+        import time
+
+        from slack_to_notion import mcp_server
+        deadline = time.monotonic() + 5
+        while mcp_server._retention_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert mcp_server._retention_thread is None
+
+    def test_retention_runs_in_background(self):
+        import json
+        import threading
+        release = threading.Event()
+        env = {"SLACK_TO_NOTION_HISTORY_MAX_COUNT": "1", "SLACK_TO_NOTION_HISTORY_ARCHIVE_MAX_BYTES": "1000"}
+        with patch.dict("os.environ", env), \
+             patch("slack_to_notion.mcp_server.apply_history_retention") as mock_retention, \
+             patch("slack_to_notion.mcp_server.prune_history_archive") as mock_prune:
+            mock_retention.side_effect = lambda *args, **kwargs: release.wait(5) and ["old.json"]
+            mock_prune.return_value = []
+            from slack_to_notion.mcp_server import save_analysis_result
+            # 보존 정책이 끝나기 전에 저장 결과를 반환한다
+            result = save_analysis_result(json.dumps({"title": "테스트"}), "new.json")
+            assert "저장되었습니다" in result
+            # 정리 중에 다시 저장하면 끝난 뒤 한 번 더 실행한다
+            save_analysis_result(json.dumps({"title": "테스트"}), "new2.json")
+            release.set()
+            self._wait_retention()
+            assert mock_retention.call_count == 2
+            assert mock_retention.call_args[1]["max_count"] == 1
+            assert mock_prune.call_args[1]["max_bytes"] == 1000
+
+    def test_retention_skipped_without_env(self):
+        import json
+        with patch.dict("os.environ", {}, clear=True), \
+             patch("slack_to_notion.mcp_server.apply_history_retention") as mock_retention:
+            from slack_to_notion.mcp_server import save_analysis_result
+            save_analysis_result(json.dumps({"title": "테스트"}), "new.json")
+            self._wait_retention()
+            mock_retention.assert_not_called()
+
+    def test_retention_failure_does_not_fail_save(self):
+        import json
+        env = {"SLACK_TO_NOTION_HISTORY_MAX_COUNT": "1"}
+        with patch.dict("os.environ", env), \
+             patch("slack_to_notion.mcp_server.apply_history_retention") as mock_retention:
+            mock_retention.side_effect = OSError("권한 없음")
+            from slack_to_notion.mcp_server import save_analysis_result
+            result = save_analysis_result(json.dumps({"title": "테스트"}), "new.json")
+            assert "저장되었습니다" in result
+            assert "[에러]" not in result
+            self._wait_retention()
+            mock_retention.assert_called_once()
+
+    def test_invalid_compression_env(self):
+        with patch.dict("os.environ", {"SLACK_TO_NOTION_HISTORY_COMPRESSION": "brotli"}):
+            from slack_to_notion.mcp_server import save_analysis_result
+            result = save_analysis_result('{"title": "테스트"}')
+            assert "[에러]" in result
+
 
 class TestCreateNotionPageErrors:
     """create_notion_page NotionClientError 처리 테스트."""
@@ -424,7 +785,7 @@ class TestCreateNotionPageErrors:
             "NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de",
         }
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_cls.return_value.blocks.children.list.side_effect = \
                 NotionClientError("API 키가 올바르지 않습니다")
@@ -442,7 +803,7 @@ class TestCreateNotionPageErrors:
             "NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de",
         }
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.blocks.children.list.return_value = {"results": []}
@@ -459,7 +820,7 @@ class TestCreateNotionPageErrors:
             "NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de",
         }
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._notion_client", None), \
+             patch("slack_to_notion.clients._notion_client", None), \
              patch("slack_to_notion.notion_client.Client") as mock_cls:
             mock_cls.return_value.blocks.children.list.side_effect = RuntimeError("연결 실패")
 
@@ -468,6 +829,370 @@ class TestCreateNotionPageErrors:
             assert "[에러]" in result
 
 
+class TestToolRegistration:
+    """MCP 도구 등록/실행 방식 테스트."""
+
+    def test_tools_run_in_worker_thread(self):
+        import asyncio
+        import threading
+
+        from slack_to_notion import mcp_server
+
+        main_thread = threading.get_ident()
+        seen = []
+
+        def record():
+            seen.append(threading.get_ident())
+            return "ok"
+
+        with patch("slack_to_notion.mcp_server.get_analysis_guide", side_effect=record):
+            asyncio.run(mcp_server.mcp.call_tool("get_analysis_guide_tool", {}))
+        assert seen and seen[0] != main_thread
+
+    def test_tool_schema_keeps_signature(self):
+        import asyncio
+
+        from slack_to_notion import mcp_server
+
+        tools = {t.name: t for t in asyncio.run(mcp_server.mcp.list_tools())}
+        assert set(tools["fetch_messages"].inputSchema["properties"]) >= {"channel_id", "since", "until"}
+        assert "Slack 채널의 메시지를 조회한다" in tools["fetch_messages"].description
+
+
+class TestProgressNotifications:
+    """진행 알림/취소 테스트."""
+
+    def test_context_not_in_schema(self):
+        import asyncio
+
+        from slack_to_notion import mcp_server
+
+        tools = {t.name: t for t in asyncio.run(mcp_server.mcp.list_tools())}
+        assert set(tools["fetch_threads"].inputSchema["properties"]) == {"channel_id", "thread_ts_list", "channel_name"}
+        assert tools["check_active_users"].inputSchema["properties"] == {}
+
+    def test_progress_sent_through_context(self, monkeypatch):
+        import asyncio
+
+        from slack_to_notion import mcp_server, progress
+
+        monkeypatch.setattr(progress, "MIN_REPORT_INTERVAL", 0)
+        sent = []
+
+        class FakeContext:
+            async def report_progress(self, value, total=None, message=None):
+                sent.append((value, total, message))
+
+        client = MagicMock()
+        client.fetch_thread_replies.return_value = [{"ts": "100.0", "user": "U001", "text": "주제"}]
+        tool = mcp_server.mcp._tool_manager.get_tool("fetch_threads")
+
+        async def run():
+            result = await tool.fn(channel_id="C001", thread_ts_list=["100.0", "200.0"], ctx=FakeContext())
+            await asyncio.sleep(0)
+            return result
+
+        with patch("slack_to_notion.mcp_server.get_slack_client", return_value=client):
+            result = asyncio.run(run())
+        assert "Thread count: 2" in result
+        assert [(value, total) for value, total, _ in sent] == [(0, 2), (1, 2), (2, 2)]
+
+    def test_cancelled_request_stops_worker(self):
+        import asyncio
+        import threading
+        import time
+
+        from slack_to_notion import mcp_server, progress
+
+        started = threading.Event()
+        cancelled = []
+
+        def get_active_users():
+            started.set()
+            deadline = time.monotonic() + 5
+            while not progress.current().cancelled and time.monotonic() < deadline:
+                time.sleep(0.01)
+            cancelled.append(progress.current().cancelled)
+            progress.check_cancelled()
+            return []
+
+        client = MagicMock()
+        client.get_active_users.side_effect = get_active_users
+        tool = mcp_server.mcp._tool_manager.get_tool("check_active_users")
+
+        async def run():
+            task = asyncio.create_task(tool.fn())
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("slack_to_notion.mcp_server.get_slack_client", return_value=client):
+            asyncio.run(run())
+        # asyncio.run은 종료 전에 작업 스레드가 끝나기를 기다린다
+        assert cancelled == [True]
+
+    def test_cancelled_tool_returns_notice(self):
+        from slack_to_notion import progress
+        from slack_to_notion.mcp_server import check_active_users
+
+        client = MagicMock()
+        client.get_active_users.side_effect = progress.OperationCancelled()
+        with patch("slack_to_notion.mcp_server.get_slack_client", return_value=client):
+            result = check_active_users()
+        assert result.startswith("[안내]")
+        assert "취소" in result
+
+
+class TestExportJobs:
+    """백그라운드 내보내기 작업 도구 테스트."""
+
+    def setup_method(self):
+        self.slack = MagicMock()
+        self.slack.get_channel_name.return_value = "general"
+        self.slack.fetch_channels_messages.return_value = {
+            "C00000001": [{"ts": "1700000000.000000", "user": "U001", "user_name": "김동영", "text": "분기 회고"}],
+        }
+        self.notion = MagicMock()
+        self.notion.check_duplicate.return_value = False
+        self.notion.create_analysis_page.return_value = "https://notion.so/export-1"
+        self.patches = [
+            patch("slack_to_notion.mcp_server._job_manager", None),
+            patch("slack_to_notion.mcp_server.get_slack_client", return_value=self.slack),
+            patch("slack_to_notion.mcp_server.get_notion_client", return_value=self.notion),
+            patch.dict("os.environ", {"NOTION_PARENT_PAGE_URL": "abc123def456abc123def456abc123de"}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def _start(self, **kwargs):
+        import re
+
+        from slack_to_notion import mcp_server
+
+        result = mcp_server.start_export(["C00000001"], **kwargs)
+        job_id = re.search(r"작업 ID: ([\w-]+)", result).group(1)
+        assert mcp_server._get_job_manager().join(5)
+        return job_id
+
+    def test_export_uploaded_to_notion(self):
+        import json
+
+        from slack_to_notion import mcp_server
+
+        job_id = self._start(since="2023-11-01", until="2023-11-30", timezone="Asia/Seoul")
+        status = json.loads(mcp_server.job_status(job_id))
+        assert status["status"] == "succeeded"
+        assert status["result"] == {"channels": 1, "messages": 1, "failed_channels": {}, "url": "https://notion.so/export-1"}
+        # 기간은 작업 등록 시점의 타임스탬프로 고정된다
+        assert status["params"]["oldest"] and status["params"]["latest"]
+
+        parent_id, title, blocks = self.notion.create_analysis_page.call_args[0]
+        assert title.startswith("[C00000001] Slack 내보내기 - ")
+        content = self.notion.build_page_blocks.call_args[0][0]
+        assert "분기 회고" in content
+        assert "https://notion.so/export-1" in mcp_server.job_result(job_id)
+
+    def test_export_text_without_upload(self):
+        from slack_to_notion import mcp_server
+
+        job_id = self._start(upload=False)
+        self.notion.create_analysis_page.assert_not_called()
+        text = mcp_server.job_result(job_id)
+        assert "=== Channel: general (1 messages) ===" in text
+
+        first = mcp_server.job_result(job_id, max_chars=10)
+        assert first.startswith(text[:10])
+        assert "offset=10" in first
+
+    def test_resume_after_crash_during_upload(self):
+        import json
+        import subprocess
+
+        from slack_to_notion import jobs, mcp_server
+        from slack_to_notion.notion_client import NotionClient
+
+        self.slack.fetch_channels_messages.return_value = {
+            "C00000001": [{"ts": f"1700000{i:03d}.000000", "user": "U001", "text": f"메시지 {i}"} for i in range(250)],
+        }
+        with patch("slack_to_notion.notion_client.Client") as sdk:
+            notion = NotionClient("fake-key")
+        api = sdk.return_value
+        api.pages.create.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        api.blocks.children.list.return_value = {"results": []}
+        # 두 번째 블록 추가 요청 중에 서버가 죽은 상황
+        api.blocks.children.append.side_effect = [{"results": []}, RuntimeError("서버 종료")]
+
+        with patch("slack_to_notion.mcp_server.get_notion_client", return_value=notion):
+            job_id = self._start(title="분기 정리")
+            path = mcp_server._get_job_manager().directory / f"{job_id}.json"
+            record = json.loads(path.read_text(encoding="utf-8"))
+            assert record["state"]["page_id"] == "page-1"
+            assert record["state"]["appended"] == 200
+            total = len(notion.build_page_blocks(path.with_suffix(".txt").read_text(encoding="utf-8")))
+            assert total > 200
+
+            # 다른 프로세스가 실행하다 죽은 상태로 되돌린 뒤 재시작 (잠금 파일이 없는 소유자)
+            dead_pid = int(subprocess.run(
+                [sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True,
+            ).stdout)
+            record.update(status=jobs.RUNNING, finished_at=None, error=None, pid=dead_pid, owner="0" * 16)
+            path.write_text(json.dumps(record), encoding="utf-8")
+            # 재시작 시점에는 작업이 만든 페이지가 상위 페이지 하위에 있다
+            api.blocks.children.list.return_value = {
+                "results": [{"id": "page-1", "type": "child_page", "child_page": {"title": "분기 정리"}}],
+            }
+            api.blocks.children.append.side_effect = None
+            api.blocks.children.append.reset_mock()
+            assert mcp_server._get_job_manager().resume() == [job_id]
+            assert mcp_server._get_job_manager().join(5)
+
+        status = json.loads(mcp_server.job_status(job_id))
+        assert status["status"] == "succeeded"
+        assert status["result"]["url"] == "https://notion.so/page-1"
+        assert api.pages.create.call_count == 1
+        # 이미 추가된 200개 이후 블록만 추가한다
+        appended = [len(call.kwargs["children"]) for call in api.blocks.children.append.call_args_list]
+        assert sum(appended) == total - 200
+
+    def test_duplicate_title_fails_job(self):
+        from slack_to_notion import mcp_server
+
+        self.notion.check_duplicate.return_value = True
+        job_id = self._start(title="분기 정리")
+        result = mcp_server.job_result(job_id)
+        assert result.startswith("[에러]")
+        assert "동일한 제목" in result
+
+    def test_missing_parent_page(self):
+        from slack_to_notion import mcp_server
+
+        with patch.dict("os.environ", {}, clear=True):
+            result = mcp_server.start_export(["C00000001"])
+        assert "NOTION_PARENT_PAGE_URL" in result
+        assert mcp_server._get_job_manager().recent() == []
+
+    def test_invalid_arguments(self):
+        from slack_to_notion import mcp_server
+
+        assert mcp_server.start_export([]).startswith("[에러]")
+        assert mcp_server.start_export(["C00000001"], since="어제쯤").startswith("[에러]")
+        assert mcp_server.job_status("없는작업").startswith("[에러]")
+        assert mcp_server.cancel_job("20260101-000000-abcdef").startswith("[에러]")
+
+    def test_job_status_lists_recent(self):
+        import json
+
+        from slack_to_notion import mcp_server
+
+        job_id = self._start(upload=False)
+        assert [job["id"] for job in json.loads(mcp_server.job_status())] == [job_id]
+
+
+class TestGetMetrics:
+    """실행 지표 조회 도구 테스트."""
+
+    def setup_method(self):
+        from slack_to_notion.metrics import metrics
+
+        metrics.reset()
+
+    def _metrics(self):
+        import json
+
+        from slack_to_notion import mcp_server
+
+        return json.loads(mcp_server.get_metrics())
+
+    def test_tool_span_recorded(self):
+        from slack_to_notion import mcp_server
+
+        mcp_server.get_analysis_guide_tool()
+        result = self._metrics()
+        assert result["spans"]["tool.get_analysis_guide_tool"]["count"] == 1
+        assert set(result) == {"since", "spans", "api", "caches"}
+
+    def test_error_result_counted(self):
+        from slack_to_notion import mcp_server
+
+        with patch.dict("os.environ", {}, clear=True):
+            mcp_server.create_notion_page("제목", "내용")
+        result = self._metrics()
+        assert result["spans"]["tool.create_notion_page"]["errors"] == 1
+
+    def test_reset(self):
+        from slack_to_notion import mcp_server
+
+        mcp_server.get_analysis_guide_tool()
+        mcp_server.get_metrics(reset=True)
+        result = self._metrics()
+        assert "tool.get_analysis_guide_tool" not in result["spans"]
+
+
+class TestWarmUp:
+    """서버 시작 warm-up 테스트."""
+
+    def test_disabled_by_default(self):
+        from slack_to_notion import mcp_server
+
+        with patch.dict("os.environ", {}, clear=True):
+            assert mcp_server._start_warm_up() is None
+
+    def test_started_once_after_initialized_notification(self):
+        import asyncio
+
+        from mcp.types import InitializedNotification
+
+        from slack_to_notion import mcp_server
+
+        handler = mcp_server.mcp._mcp_server.notification_handlers[InitializedNotification]
+        with patch.dict("os.environ", {"SLACK_TO_NOTION_WARMUP": "1"}), \
+             patch("slack_to_notion.mcp_server._warm_up") as mock_warm_up, \
+             patch.object(mcp_server, "_warm_up_started", False), \
+             patch("slack_to_notion.mcp_server.threading.Thread") as thread:
+            asyncio.run(handler(InitializedNotification(method="notifications/initialized")))
+            asyncio.run(handler(InitializedNotification(method="notifications/initialized")))
+        thread.assert_called_once_with(target=mock_warm_up, name="slack-to-notion-warmup", daemon=True)
+        thread.return_value.start.assert_called_once()
+
+    def test_warms_configured_clients(self):
+        from slack_to_notion import mcp_server
+
+        slack = MagicMock()
+        slack.warm_up.return_value = {"team": "팀", "user": "bot", "channels": 2, "cached_users": 0}
+        notion = MagicMock()
+        env = {"SLACK_BOT_TOKEN": "xoxb-fake", "NOTION_API_KEY": "ntn_fake"}
+        with patch.dict("os.environ", env, clear=True), \
+             patch("slack_to_notion.clients._slack_client", slack), \
+             patch("slack_to_notion.clients._notion_client", notion):
+            mcp_server._warm_up()
+        slack.warm_up.assert_called_once()
+        notion.warm_up.assert_called_once()
+
+    def test_failure_does_not_raise(self):
+        from slack_to_notion import mcp_server
+        from slack_to_notion.slack_client import SlackClientError
+
+        slack = MagicMock()
+        slack.warm_up.side_effect = SlackClientError("토큰 오류")
+        with patch.dict("os.environ", {"SLACK_BOT_TOKEN": "xoxb-fake"}, clear=True), \
+             patch("slack_to_notion.clients._slack_client", slack):
+            mcp_server._warm_up()
+
+    def test_skips_clients_without_token(self):
+        from slack_to_notion import mcp_server
+
+        with patch.dict("os.environ", {}, clear=True), \
+             patch("slack_to_notion.mcp_server.get_slack_client") as get_slack, \
+             patch("slack_to_notion.mcp_server.get_notion_client") as get_notion:
+            mcp_server._warm_up()
+        get_slack.assert_not_called()
+        get_notion.assert_not_called()
+
+
 class TestMainHelp:
     """main 함수 --help 플래그 테스트."""
 
@@ -493,7 +1218,7 @@ class TestFetchMessagesFieldFiltering:
         import json
         env = {"SLACK_BOT_TOKEN": "xoxb-fake"}
         with patch.dict("os.environ", env, clear=False), \
-             patch("slack_to_notion.mcp_server._slack_client", None), \
+             patch("slack_to_notion.clients._slack_client", None), \
              patch("slack_to_notion.slack_client.WebClient") as mock_cls:
             mock_api = mock_cls.return_value
             mock_api.conversations_history.return_value = {
@@ -0,0 +1,186 @@
+"""메시지 로컬 저장소 단위 테스트."""
+
+import sqlite3
+import time
+from contextlib import closing
+from unittest.mock import patch
+
+import pytest
+
+from slack_to_notion import message_store
+from slack_to_notion.message_store import (
+    DEFAULT_MAX_AGE_DAYS,
+    DEFAULT_MAX_BYTES,
+    MessageStore,
+    store_enabled,
+    store_limits,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MessageStore(tmp_path / "messages.db")
+    store.add_messages("C001", [
+        {"ts": "1000.0", "user": "U001", "text": "백엔드 배포 일정 논의"},
+        {"ts": "2000.0", "user": "U002", "text": "Deploy finished 100%"},
+        {"ts": "3000.0", "user": "U001", "text": "점심 뭐 먹지", "thread_ts": "3000.0"},
+    ])
+    store.add_messages("C002", [
+        {"ts": "1500.0", "user": "U003", "text": "다른 채널 배포 공지"},
+    ])
+    return store
+
+
+class TestMessageStore:
+    """저장 및 검색 테스트."""
+
+    def test_count(self, store):
+        assert store.count() == 4
+
+    def test_count_without_db(self, tmp_path):
+        assert MessageStore(tmp_path / "none.db").count() == 0
+
+    def test_upsert_updates_text(self, store):
+        store.add_messages("C001", [{"ts": "1000.0", "user": "U001", "text": "수정된 일정 공지"}])
+        assert store.count() == 4
+        assert store.search("수정된 일정")[0]["ts"] == "1000.0"
+        assert store.search("배포 일정") == []
+
+    def test_skips_messages_without_ts(self, store):
+        assert store.add_messages("C001", [{"text": "no ts"}]) == 0
+
+    def test_fts_term(self, store):
+        results = store.search("deploy")
+        assert [r["ts"] for r in results] == ["2000.0"]
+
+    def test_short_korean_term(self, store):
+        """2글자 한글 단어도 검색된다."""
+        results = store.search("배포")
+        assert {r["channel_id"] for r in results} == {"C001", "C002"}
+
+    def test_multiple_terms_and(self, store):
+        results = store.search("배포 일정")
+        assert [r["ts"] for r in results] == ["1000.0"]
+
+    def test_like_wildcards_escaped(self, store):
+        assert [r["ts"] for r in store.search("100%")] == ["2000.0"]
+        assert store.search("0%F") == []
+
+    def test_channel_filter(self, store):
+        results = store.search("배포", channel_id="C002")
+        assert [r["ts"] for r in results] == ["1500.0"]
+
+    def test_user_filter(self, store):
+        results = store.search(user_ids=["U001"])
+        assert [r["ts"] for r in results] == ["3000.0", "1000.0"]
+
+    def test_date_filter(self, store):
+        results = store.search(oldest=1200, latest=2500)
+        assert [r["ts"] for r in results] == ["2000.0", "1500.0"]
+
+    def test_limit(self, store):
+        assert len(store.search(limit=2)) == 2
+
+    def test_missing_db_returns_empty(self, tmp_path):
+        assert MessageStore(tmp_path / "none.db").search("x") == []
+
+
+class TestMessageStoreRetention:
+    """보존 한도 정리 테스트."""
+
+    def test_old_history_kept_until_stored_age(self, tmp_path):
+        """오래전 대화도 저장 시각 기준으로 보존한다."""
+        store = MessageStore(tmp_path / "messages.db", max_age_days=30)
+        old_ts = f"{time.time() - 400 * 86400:.6f}"
+        store.add_messages("C001", [{"ts": old_ts, "text": "작년 배포 회고"}])
+        assert [r["ts"] for r in store.search("배포 회고")] == [old_ts]
+
+    def test_messages_pruned_by_stored_time(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(message_store, "PRUNE_INTERVAL", 0)
+        now = time.time()
+        store = MessageStore(tmp_path / "messages.db", max_age_days=30)
+        with patch("slack_to_notion.message_store.time.time", return_value=now - 40 * 86400):
+            store.add_messages("C001", [{"ts": "100.0", "text": "오래전에 저장한 공지"}])
+            store.add_messages("C001", [{"ts": "200.0", "text": "다시 수집한 공지"}])
+        store.add_messages("C001", [
+            {"ts": "200.0", "text": "다시 수집한 공지"},
+            {"ts": "300.0", "text": "최근 공지"},
+        ])
+        assert sorted(r["ts"] for r in store.search("공지")) == ["200.0", "300.0"]
+
+    def test_prune_throttled(self, tmp_path):
+        store = MessageStore(tmp_path / "messages.db", max_age_days=30)
+        with patch.object(store, "_prune", wraps=store._prune) as mock_prune:
+            for i in range(5):
+                store.add_messages("C001", [{"ts": f"{i}.0", "text": "페이지"}])
+        assert mock_prune.call_count == 1
+
+    def test_explicit_prune(self, tmp_path):
+        store = MessageStore(tmp_path / "messages.db", max_age_days=30)
+        with patch("slack_to_notion.message_store.time.time", return_value=time.time() - 40 * 86400):
+            store.add_messages("C001", [{"ts": "100.0", "text": "a"}])
+        assert store.prune() == 1
+        assert store.count() == 0
+
+    def test_migrates_db_without_stored_at(self, tmp_path):
+        path = tmp_path / "messages.db"
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute(
+                "CREATE TABLE messages (id INTEGER PRIMARY KEY, channel_id TEXT NOT NULL, ts TEXT NOT NULL, "
+                "ts_num REAL NOT NULL, thread_ts TEXT, user TEXT, text TEXT NOT NULL DEFAULT '', "
+                "UNIQUE (channel_id, ts))"
+            )
+            conn.execute(
+                "INSERT INTO messages (channel_id, ts, ts_num, text) VALUES ('C001', '1.0', 1.0, '이전 메시지')"
+            )
+            conn.commit()
+
+        store = MessageStore(path, max_age_days=30)
+        store.add_messages("C001", [{"ts": "2.0", "text": "새 메시지"}])
+        assert store.count() == 2
+        with closing(sqlite3.connect(path)) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM messages WHERE stored_at > 0").fetchone()[0] == 2
+
+    def test_oldest_messages_pruned_over_size_limit(self, tmp_path):
+        store = MessageStore(tmp_path / "messages.db")
+        store.add_messages("C001", [
+            {"ts": f"{i}.0", "text": f"메시지 {i} " + "가나다라마바사" * 20} for i in range(1, 501)
+        ])
+        size = store.path.stat().st_size
+        store.max_bytes = size // 2
+        store.add_messages("C001", [{"ts": "1000.0", "text": "새 메시지"}])
+        assert store.path.stat().st_size <= size // 2
+        remaining = store.count()
+        assert 0 < remaining < 501
+        assert store.search("새 메시지")[0]["ts"] == "1000.0"
+        # 먼저 저장한 메시지부터 (저장 시각이 같으면 작성 시각 순으로) 삭제된다
+        assert store.search(oldest=1, latest=1) == []
+
+    def test_no_limits_keeps_everything(self, tmp_path):
+        store = MessageStore(tmp_path / "messages.db")
+        store.add_messages("C001", [{"ts": "1.0", "text": "아주 오래된 메시지"}])
+        assert store.count() == 1
+
+
+class TestStoreSettings:
+    """환경변수 설정 테스트."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SLACK_TO_NOTION_MESSAGE_STORE", raising=False)
+        assert store_enabled() is False
+        monkeypatch.setenv("SLACK_TO_NOTION_MESSAGE_STORE", "1")
+        assert store_enabled() is True
+
+    def test_default_limits(self, monkeypatch):
+        monkeypatch.delenv("SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS", raising=False)
+        monkeypatch.delenv("SLACK_TO_NOTION_MESSAGE_STORE_MAX_BYTES", raising=False)
+        assert store_limits() == (DEFAULT_MAX_AGE_DAYS, DEFAULT_MAX_BYTES)
+
+    def test_zero_disables_limit(self, monkeypatch):
+        monkeypatch.setenv("SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS", "0")
+        monkeypatch.setenv("SLACK_TO_NOTION_MESSAGE_STORE_MAX_BYTES", "1048576")
+        assert store_limits() == (None, 1048576)
+
+    def test_invalid_value_uses_default(self, monkeypatch):
+        monkeypatch.setenv("SLACK_TO_NOTION_MESSAGE_STORE_MAX_AGE_DAYS", "abc")
+        assert store_limits()[0] == DEFAULT_MAX_AGE_DAYS
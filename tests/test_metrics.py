@@ -0,0 +1,93 @@
+"""실행 계측 단위 테스트."""
+
+from unittest.mock import patch
+
+import pytest
+
+from slack_to_notion.metrics import Metrics, payload_size, response_size
+
+
+class TestMetrics:
+    """지표 수집기 테스트."""
+
+    def setup_method(self):
+        self.metrics = Metrics()
+
+    def test_span_records_timing(self):
+        with self.metrics.span("tool.test"):
+            pass
+        with self.metrics.span("tool.test"):
+            pass
+        span = self.metrics.snapshot()["spans"]["tool.test"]
+        assert span["count"] == 2
+        assert span["errors"] == 0
+        assert span["max_ms"] >= 0
+
+    def test_span_counts_exception_as_error(self):
+        with pytest.raises(ValueError):
+            with self.metrics.span("tool.fail"):
+                raise ValueError("실패")
+        assert self.metrics.snapshot()["spans"]["tool.fail"]["errors"] == 1
+
+    def test_timed_decorator(self):
+        @self.metrics.timed("step")
+        def step(x):
+            return x * 2
+
+        assert step(2) == 4
+        assert step.__name__ == "step"
+        assert self.metrics.snapshot()["spans"]["step"]["count"] == 1
+
+    def test_api_calls_grouped_by_service(self):
+        self.metrics.record_api_call("slack", "users.info", 0.1, size=100)
+        self.metrics.record_api_call("slack", "users.info", 0.3, size=50, error=True)
+        self.metrics.record_retry("slack", "users.info")
+        self.metrics.record_api_call("notion", "pages.create", 0.2)
+        api = self.metrics.snapshot()["api"]
+        assert api["slack"]["users.info"]["count"] == 2
+        assert api["slack"]["users.info"]["errors"] == 1
+        assert api["slack"]["users.info"]["retries"] == 1
+        assert api["slack"]["users.info"]["bytes"] == 150
+        assert api["slack"]["users.info"]["avg_ms"] == 200.0
+        assert api["notion"]["pages.create"]["count"] == 1
+
+    def test_cache_hit_rate(self):
+        self.metrics.record_cache("slack.users", hits=3, misses=1)
+        self.metrics.record_cache("slack.empty")
+        caches = self.metrics.snapshot()["caches"]
+        assert caches["slack.users"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+        assert "slack.empty" not in caches
+
+    def test_reset(self):
+        self.metrics.record_span("tool.test", 0.1)
+        self.metrics.reset()
+        snapshot = self.metrics.snapshot()
+        assert snapshot["spans"] == {}
+        assert snapshot["api"] == {}
+
+
+class TestPayloadSize:
+    """응답 크기 계산 테스트."""
+
+    def test_utf8_bytes(self):
+        assert payload_size({"text": "한"}) == len('{"text": "한"}'.encode("utf-8"))
+
+    def test_unserializable_falls_back_to_str(self):
+        assert payload_size({"obj": object()}) > 0
+
+
+class TestResponseSize:
+    """전송 크기 기반 응답 크기 테스트."""
+
+    def test_content_length_header(self):
+        assert response_size({"Content-Length": "512"}, {"text": "한"}) == 512
+        assert response_size({"content-length": "64"}, {}) == 64
+
+    def test_without_header_skips_serialization(self):
+        with patch("slack_to_notion.metrics.tracing.enabled", return_value=False):
+            assert response_size({}, {"text": "한"}) == 0
+            assert response_size(None, {"text": "한"}) == 0
+
+    def test_without_header_serializes_when_tracing(self):
+        with patch("slack_to_notion.metrics.tracing.enabled", return_value=True):
+            assert response_size({}, {"text": "한"}) == payload_size({"text": "한"})
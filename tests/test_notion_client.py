@@ -2,11 +2,16 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from notion_client import Client
 
+from slack_to_notion import progress
+from slack_to_notion.metrics import metrics
 from slack_to_notion.notion_client import (
     NotionClient,
     NotionClientError,
+    _method_name,
     extract_page_id,
     split_rich_text,
 )
@@ -563,3 +568,175 @@ class TestNotionClientErrorFormatting:
     def test_unknown_error(self):
         msg = self.client._format_error_message(self._make_error("rate_limited"))
         assert "rate_limited" in msg
+
+
+# ──────────────────────────────────────────────
+# 속도 제한 / 재시도
+# ──────────────────────────────────────────────
+
+
+def _api_error(code: str, status: int, retry_after: str | None = None):
+    import httpx
+    from notion_client.errors import APIResponseError
+
+    headers = httpx.Headers({"retry-after": retry_after} if retry_after else {})
+    return APIResponseError(code=code, status=status, message=code, headers=headers, raw_body_text="")
+
+
+class TestNotionClientRetry:
+    """Notion 요청 재시도 테스트."""
+
+    def setup_method(self):
+        with patch("slack_to_notion.notion_client.Client"):
+            self.client = NotionClient("fake-api-key")
+            self.mock_api = self.client.client
+        self.sleep = patch("slack_to_notion.notion_client.time.sleep").start()
+        # 대기 없이 테스트하도록 속도 제한과 Retry-After 일시정지를 무력화
+        self.client.rate_limiter = MagicMock()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_rate_limited_retried_with_retry_after(self):
+        self.mock_api.blocks.children.list.side_effect = [
+            _api_error("rate_limited", 429, retry_after="2"),
+            {"results": []},
+        ]
+        assert self.client.check_duplicate("page-id", "제목") is False
+        self.sleep.assert_called_once_with(2.0)
+        self.client.rate_limiter.pause.assert_called_once_with(2.0)
+
+    def test_read_retried_on_server_error(self):
+        self.mock_api.blocks.children.list.side_effect = [
+            _api_error("service_unavailable", 503),
+            _api_error("internal_server_error", 500),
+            {"results": []},
+        ]
+        assert self.client.check_duplicate("page-id", "제목") is False
+        assert self.mock_api.blocks.children.list.call_count == 3
+
+    def test_response_size_from_transport_headers(self):
+        metrics.reset()
+
+        def list_children(**kwargs):
+            self.client._record_response(httpx.Response(200, headers={"Content-Length": "321"}))
+            return {"results": []}
+
+        self.mock_api.blocks.children.list.side_effect = list_children
+        self.client.check_duplicate("page-id", "제목")
+        (method_stat,) = metrics.snapshot()["api"]["notion"].values()
+        assert method_stat["bytes"] == 321
+
+    def test_response_hook_registered(self):
+        client = NotionClient("fake-api-key")
+        assert client._record_response in client.client.client.event_hooks["response"]
+
+    def test_retry_recorded_in_metrics(self):
+        metrics.reset()
+        self.mock_api.blocks.children.list.side_effect = [
+            _api_error("service_unavailable", 503),
+            {"results": []},
+        ]
+        self.client.check_duplicate("page-id", "제목")
+        stat = metrics.snapshot()["api"]["notion"]
+        assert len(stat) == 1
+        (method_stat,) = stat.values()
+        assert method_stat["count"] == 2
+        assert method_stat["errors"] == 1
+        assert method_stat["retries"] == 1
+
+    def test_warm_up_checks_api_key(self):
+        self.mock_api.users.me.return_value = {"object": "user", "name": "분석봇"}
+        assert self.client.warm_up() == "분석봇"
+
+    def test_warm_up_invalid_key(self):
+        self.mock_api.users.me.side_effect = _api_error("unauthorized", 401)
+        with pytest.raises(NotionClientError, match="NOTION_API_KEY"):
+            self.client.warm_up()
+
+    def test_method_name_from_sdk_endpoint(self):
+        sdk = Client(auth="fake-api-key")
+        assert _method_name(sdk.pages.create) == "pages.create"
+        assert _method_name(sdk.blocks.children.list) == "blocks.children.list"
+
+    def test_validation_error_not_retried(self):
+        self.mock_api.blocks.children.list.side_effect = _api_error("validation_error", 400)
+        with pytest.raises(NotionClientError):
+            self.client.check_duplicate("page-id", "제목")
+        assert self.mock_api.blocks.children.list.call_count == 1
+
+    def test_retries_exhausted(self):
+        self.mock_api.blocks.children.list.side_effect = _api_error("rate_limited", 429)
+        with pytest.raises(NotionClientError):
+            self.client.check_duplicate("page-id", "제목")
+        assert self.mock_api.blocks.children.list.call_count == 6
+
+    def test_create_page_not_retried_when_already_created(self):
+        self.mock_api.pages.create.side_effect = _api_error("internal_server_error", 500)
+        self.mock_api.blocks.children.list.return_value = {
+            "results": [{"id": "abc-123", "type": "child_page", "child_page": {"title": "제목"}}],
+        }
+        url = self.client.create_analysis_page("parent-id", "제목", [])
+        assert url == "https://www.notion.so/abc123"
+        assert self.mock_api.pages.create.call_count == 1
+
+    def test_create_page_retried_when_not_created(self):
+        self.mock_api.pages.create.side_effect = [
+            _api_error("service_unavailable", 503),
+            {"id": "page-1", "url": "https://notion.so/page-1"},
+        ]
+        self.mock_api.blocks.children.list.return_value = {"results": []}
+        url = self.client.create_analysis_page("parent-id", "제목", [])
+        assert url == "https://notion.so/page-1"
+        assert self.mock_api.pages.create.call_count == 2
+
+    def test_append_not_duplicated_after_ambiguous_failure(self):
+        blocks = [{"type": "paragraph"}] * 150
+        self.mock_api.pages.create.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        self.mock_api.blocks.children.append.side_effect = _api_error("internal_server_error", 500)
+        # 실패 응답을 받았지만 실제로는 150개 블록이 모두 추가된 상태
+        self.mock_api.blocks.children.list.return_value = {"results": [{"type": "paragraph"}] * 150}
+        self.client.create_analysis_page("parent-id", "제목", blocks)
+        assert self.mock_api.blocks.children.append.call_count == 1
+
+    def test_append_progress_reported(self, monkeypatch):
+        monkeypatch.setattr(progress, "MIN_REPORT_INTERVAL", 0)
+        sent = []
+        self.mock_api.pages.create.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        with progress.use(progress.ProgressReporter(lambda value, total, message: sent.append((value, total)))):
+            self.client.create_analysis_page("parent-id", "제목", [{"type": "paragraph"}] * 250)
+        assert sent == [(100, 250), (200, 250)]
+
+    def test_cancel_stops_append_with_page_url(self):
+        reporter = progress.ProgressReporter()
+        self.mock_api.pages.create.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        self.mock_api.blocks.children.append.side_effect = lambda **kwargs: reporter.cancel()
+        with progress.use(reporter), pytest.raises(progress.OperationCancelled) as exc_info:
+            self.client.create_analysis_page("parent-id", "제목", [{"type": "paragraph"}] * 250)
+        assert self.mock_api.blocks.children.append.call_count == 1
+        assert "200/250" in exc_info.value.message
+        assert "https://notion.so/page-1" in exc_info.value.message
+
+    def test_checkpoint_after_create_and_each_append(self):
+        saved = []
+        self.mock_api.pages.create.return_value = {"id": "page-1", "url": "https://notion.so/page-1"}
+        self.client.create_analysis_page(
+            "parent-id", "제목", [{"type": "paragraph"}] * 250, checkpoint=lambda **values: saved.append(values),
+        )
+        assert saved == [
+            {"page_id": "page-1", "page_url": "https://notion.so/page-1", "appended": 100},
+            {"appended": 200},
+            {"appended": 250},
+        ]
+
+    def test_append_blocks_from_offset(self):
+        self.client.append_blocks("page-1", [{"type": "paragraph"}] * 250, 200)
+        self.mock_api.pages.create.assert_not_called()
+        assert [len(call.kwargs["children"]) for call in self.mock_api.blocks.children.append.call_args_list] == [50]
+
+    def test_create_page_client_error_not_retried(self):
+        self.mock_api.pages.create.side_effect = _api_error("validation_error", 400)
+        with pytest.raises(NotionClientError):
+            self.client.create_analysis_page("parent-id", "제목", [])
+        assert self.mock_api.pages.create.call_count == 1
+        self.mock_api.blocks.children.list.assert_not_called()
@@ -0,0 +1,116 @@
+"""도구 프로파일링 단위 테스트."""
+
+import cProfile
+import pstats
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from slack_to_notion import profiling
+
+
+class TestProfilingConfigure:
+    """프로파일링 설정 테스트."""
+
+    def teardown_method(self):
+        profiling.configure("")
+
+    def test_disabled_by_default(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert profiling.configure() is False
+        assert profiling.enabled() is False
+
+    def test_enabled_from_env(self):
+        env = {"SLACK_TO_NOTION_PROFILE": "create_notion_page", "SLACK_TO_NOTION_PROFILE_THRESHOLD_MS": "250"}
+        with patch.dict("os.environ", env, clear=True):
+            assert profiling.configure() is True
+        assert profiling._settings.tools == {"create_notion_page"}
+        assert profiling._settings.threshold_ms == 250.0
+
+    def test_invalid_threshold(self):
+        with patch.dict("os.environ", {"SLACK_TO_NOTION_PROFILE_THRESHOLD_MS": "느림"}):
+            with pytest.raises(ValueError, match="밀리초"):
+                profiling.configure("all")
+
+    def test_disabled_returns_noop_context(self):
+        assert profiling.profile("any_tool") is profiling._DISABLED
+
+
+class TestProfilingCapture:
+    """프로파일 저장 테스트."""
+
+    def teardown_method(self):
+        profiling.configure("")
+
+    def _profiles(self, tmp_path):
+        return sorted((tmp_path / "profiles").glob("*.prof"))
+
+    def test_saves_profile_above_threshold(self, tmp_path):
+        profiling.configure("all", threshold_ms=0, directory=tmp_path / "profiles")
+        with profiling.profile("create_notion_page", ("제목",), {"content": "내용"}):
+            sum(range(1000))
+        (path,) = self._profiles(tmp_path)
+        assert path.name.startswith("create_notion_page-")
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_same_arguments_same_hash(self, tmp_path):
+        assert profiling._args_hash(("a",), {"b": 1}) == profiling._args_hash(("a",), {"b": 1})
+        assert profiling._args_hash(("a",), {"b": 1}) != profiling._args_hash(("a",), {"b": 2})
+
+    def test_fast_call_not_saved(self, tmp_path):
+        profiling.configure("all", threshold_ms=60_000, directory=tmp_path / "profiles")
+        with profiling.profile("format_messages"):
+            pass
+        assert self._profiles(tmp_path) == []
+
+    def test_other_tools_not_profiled(self, tmp_path):
+        profiling.configure("create_notion_page", threshold_ms=0, directory=tmp_path / "profiles")
+        assert profiling.profile("format_messages") is profiling._DISABLED
+
+    def test_prunes_old_profiles(self, tmp_path):
+        profiling.configure("all", threshold_ms=0, directory=tmp_path / "profiles")
+        with patch.object(profiling, "MAX_PROFILES", 2):
+            for _ in range(3):
+                with profiling.profile("format_messages"):
+                    pass
+        assert len(self._profiles(tmp_path)) == 2
+
+    def test_same_timestamp_not_overwritten(self, tmp_path):
+        directory = tmp_path / "profiles"
+        fixed = profiling.datetime(2026, 1, 1, 12, 0, 0)
+        with patch.object(profiling, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed
+            for _ in range(3):
+                profiler = cProfile.Profile()
+                profiler.enable()
+                profiler.disable()
+                profiling._save(profiler, directory, "format_messages", (), {}, 1.0)
+        profiles = self._profiles(tmp_path)
+        assert len(profiles) == 3
+        assert all(pstats.Stats(str(path)).total_calls >= 0 for path in profiles)
+
+    def test_prune_ignores_files_removed_concurrently(self, tmp_path):
+        directory = tmp_path / "profiles"
+        directory.mkdir()
+        for i in range(3):
+            (directory / f"tool-{i}.prof").write_bytes(b"")
+        removed = directory / "tool-0.prof"
+        original_stat = Path.stat
+
+        def stat(path, *args, **kwargs):
+            if path == removed:
+                raise FileNotFoundError(path)
+            return original_stat(path, *args, **kwargs)
+
+        with patch.object(profiling, "MAX_PROFILES", 1), patch.object(Path, "stat", stat):
+            profiling._prune(directory)
+        assert sorted(p.name for p in directory.glob("*.prof")) == ["tool-0.prof", "tool-2.prof"]
+
+    def test_tool_call_profiled(self, tmp_path):
+        from slack_to_notion import mcp_server
+
+        profiling.configure("get_analysis_guide_tool", threshold_ms=0, directory=tmp_path / "profiles")
+        mcp_server.get_analysis_guide_tool()
+        (path,) = self._profiles(tmp_path)
+        assert path.name.startswith("get_analysis_guide_tool-")
@@ -0,0 +1,69 @@
+"""진행 상황 보고/취소 모듈 테스트."""
+
+import pytest
+
+from slack_to_notion import progress
+from slack_to_notion.progress import OperationCancelled, ProgressReporter
+
+
+class TestProgressReporter:
+    """ProgressReporter 테스트."""
+
+    def setup_method(self):
+        self.sent = []
+        self.reporter = ProgressReporter(lambda value, total, message: self.sent.append((value, total, message)))
+
+    def test_report_sends_progress(self):
+        self.reporter.report(1, 3, "스레드 1/3개 수집")
+        assert self.sent == [(1, 3, "스레드 1/3개 수집")]
+
+    def test_reports_throttled_except_last(self, monkeypatch):
+        monkeypatch.setattr(progress, "MIN_REPORT_INTERVAL", 60)
+        for done in range(1, 4):
+            self.reporter.report(done, 3)
+        assert self.sent == [(1, 3, None), (3, 3, None)]
+
+    def test_new_phase_keeps_values_increasing(self, monkeypatch):
+        monkeypatch.setattr(progress, "MIN_REPORT_INTERVAL", 0)
+        self.reporter.report(100, 100, "메시지")
+        self.reporter.report(1, 20, "스레드")
+        self.reporter.report(20, 20, "스레드")
+        assert [(value, total) for value, total, _ in self.sent] == [(100, 100), (101, 120), (120, 120)]
+
+    def test_cancel_raises_on_next_check(self):
+        self.reporter.cancel()
+        assert self.reporter.cancelled
+        with pytest.raises(OperationCancelled):
+            self.reporter.report(1, 3)
+        assert self.sent == []
+
+    def test_send_failure_ignored(self):
+        def fail(value, total, message):
+            raise RuntimeError("closed")
+
+        ProgressReporter(fail).report(1, 1)
+
+    def test_quiet_shares_cancellation(self):
+        quiet = self.reporter.quiet()
+        quiet.report(1, 1)
+        assert self.sent == []
+        self.reporter.cancel()
+        with pytest.raises(OperationCancelled):
+            quiet.check_cancelled()
+
+
+class TestCurrentReporter:
+    """현재 작업 reporter 설정 테스트."""
+
+    def test_default_does_nothing(self):
+        progress.report(1, 2, "무시")
+        progress.check_cancelled()
+
+    def test_use_sets_current(self):
+        reporter = ProgressReporter()
+        with progress.use(reporter):
+            assert progress.current() is reporter
+            reporter.cancel()
+            with pytest.raises(OperationCancelled, match="취소"):
+                progress.check_cancelled()
+        progress.check_cancelled()
@@ -0,0 +1,63 @@
+"""API 호출 속도 제한 단위 테스트."""
+
+import time
+
+from slack_to_notion.ratelimit import RateLimitScheduler, TokenBucket
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트."""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_when_empty(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        waited = bucket.acquire()
+        assert waited > 0
+        assert time.monotonic() - start >= 0.015
+
+    def test_capacity_at_least_one(self):
+        assert TokenBucket(rate=0.5).capacity == 1.0
+
+    def test_pause_blocks_until_elapsed(self):
+        bucket = TokenBucket(rate=100, capacity=5)
+        bucket.pause(0.05)
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+class TestRateLimitScheduler:
+    """메서드별 스케줄러 테스트."""
+
+    def setup_method(self):
+        self.scheduler = RateLimitScheduler({"fast.method": 10.0}, default_rate=1.0, burst=5)
+
+    def test_buckets_per_method(self):
+        assert self.scheduler.bucket("fast.method").rate == 10.0
+        assert self.scheduler.bucket("other.method").rate == 1.0
+        assert self.scheduler.bucket("fast.method") is self.scheduler.bucket("fast.method")
+
+    def test_burst_capped_by_per_minute_rate(self):
+        scheduler = RateLimitScheduler({}, default_rate=2 / 60, burst=20)
+        assert scheduler.bucket("tier1.method").capacity == 2
+
+    def test_rate_limited_halves_rate_and_pauses(self):
+        self.scheduler.record_rate_limited("fast.method", 0.05)
+        bucket = self.scheduler.bucket("fast.method")
+        assert bucket.rate == 5.0
+        start = time.monotonic()
+        self.scheduler.acquire("fast.method")
+        assert time.monotonic() - start >= 0.04
+        # 다른 메서드는 영향을 받지 않는다
+        assert self.scheduler.acquire("other.method") == 0.0
+
+    def test_success_recovers_rate(self):
+        self.scheduler.record_rate_limited("fast.method", 0)
+        for _ in range(20):
+            self.scheduler.record_success("fast.method")
+        assert self.scheduler.bucket("fast.method").rate == 10.0
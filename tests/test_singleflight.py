@@ -0,0 +1,71 @@
+"""동일 요청 병합 단위 테스트."""
+
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slack_to_notion.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트."""
+
+    def setup_method(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _slow(self, value):
+        def func():
+            with self.lock:
+                self.calls += 1
+            time.sleep(0.05)
+            return value
+        return func
+
+    def test_concurrent_identical_calls_share_result(self):
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(self.flight.do, "key", self._slow("ok")) for _ in range(5)]
+            results = [f.result() for f in futures]
+        assert self.calls == 1
+        assert all(result == "ok" for result, _ in results)
+        assert sum(shared for _, shared in results) == 5
+
+    def test_different_keys_run_separately(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            a = executor.submit(self.flight.do, "a", self._slow(1))
+            b = executor.submit(self.flight.do, "b", self._slow(2))
+            assert (a.result()[0], b.result()[0]) == (1, 2)
+        assert self.calls == 2
+
+    def test_sequential_calls_not_cached(self):
+        self.flight.do("key", self._slow("first"))
+        result, shared = self.flight.do("key", self._slow("second"))
+        assert result == "second"
+        assert shared is False
+
+    def test_error_propagates_to_waiters(self):
+        def fail():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.flight.do, "key", fail) for _ in range(3)]
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_clone_gives_waiters_own_copy(self):
+        def func():
+            time.sleep(0.05)
+            return {"messages": [{"ts": "1"}]}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self.flight.do, "key", func, copy.deepcopy) for _ in range(4)]
+            results = [f.result()[0] for f in futures]
+        assert len({id(result) for result in results}) == 4
+        results[0]["messages"][0]["user_name"] = "홍길동"
+        assert all("user_name" not in result["messages"][0] for result in results[1:])
@@ -0,0 +1,62 @@
+"""로컬 텍스트 검색 인덱스 단위 테스트."""
+
+from slack_to_notion.text_index import TrigramIndex, normalize_text, trigrams
+
+
+class TestNormalizeText:
+    """검색용 정규화 테스트."""
+
+    def test_lowercase_and_separators(self):
+        assert normalize_text("#Dev-Backend_team") == "dev backend team"
+
+    def test_empty(self):
+        assert normalize_text("  ") == ""
+
+    def test_trigrams_padded(self):
+        grams = trigrams("ab")
+        assert "  a" in grams
+        assert "ab " in grams
+
+
+class TestTrigramIndex:
+    """트라이그램 인덱스 검색 테스트."""
+
+    def setup_method(self):
+        self.index = TrigramIndex()
+        channels = [
+            ("C001", "general", "전체 공지"),
+            ("C002", "dev-backend", "백엔드 배포 논의"),
+            ("C003", "dev-frontend", "프론트엔드"),
+            ("C004", "marketing", "마케팅 캠페인"),
+        ]
+        for channel_id, name, topic in channels:
+            self.index.add(channel_id, name, payload={"id": channel_id, "name": name})
+            self.index.add(channel_id, topic, weight=0.6)
+
+    def test_exact_match_ranked_first(self):
+        results = self.index.search("dev-backend")
+        assert results[0][1]["id"] == "C002"
+
+    def test_typo_tolerated(self):
+        results = self.index.search("markting")
+        assert results[0][1]["id"] == "C004"
+
+    def test_topic_match(self):
+        results = self.index.search("배포")
+        assert results[0][1]["id"] == "C002"
+
+    def test_limit(self):
+        results = self.index.search("dev", limit=1)
+        assert len(results) == 1
+
+    def test_no_match(self):
+        assert self.index.search("zzzzqqq") == []
+
+    def test_empty_query(self):
+        assert self.index.search("") == []
+
+    def test_payload_defaults_to_key(self):
+        index = TrigramIndex()
+        index.add("k1", "hello world")
+        assert index.search("hello")[0][1] == "k1"
+        assert len(index) == 1
@@ -0,0 +1,74 @@
+"""날짜/시간 범위 변환 단위 테스트."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from slack_to_notion.timerange import parse_time_bound, resolve_time_range, resolve_timezone
+
+
+class TestParseTimeBound:
+    """시점 문자열 변환 테스트."""
+
+    def setup_method(self):
+        self.tz = resolve_timezone("Asia/Seoul")
+
+    def test_date_start_of_day(self):
+        expected = datetime(2026, 2, 8, 15, 0, tzinfo=timezone.utc).timestamp()
+        assert parse_time_bound("2026-02-09", self.tz) == expected
+
+    def test_date_end_is_next_midnight(self):
+        expected = datetime(2026, 2, 9, 15, 0, tzinfo=timezone.utc).timestamp()
+        assert parse_time_bound("2026-02-09", self.tz, end=True) == expected
+
+    def test_datetime_with_minutes(self):
+        expected = datetime(2026, 2, 9, 0, 30, tzinfo=timezone.utc).timestamp()
+        assert parse_time_bound("2026-02-09 09:30", self.tz) == expected
+
+    def test_explicit_offset_overrides_timezone(self):
+        expected = datetime(2026, 2, 9, 9, 0, tzinfo=timezone.utc).timestamp()
+        assert parse_time_bound("2026-02-09T09:00:00+00:00", self.tz) == expected
+
+    def test_relative_days(self):
+        now = datetime.now(timezone.utc).timestamp()
+        assert abs(parse_time_bound("7d", self.tz) - (now - 7 * 86400)) < 5
+
+    def test_raw_timestamp(self):
+        assert parse_time_bound("1739612400.000000") == 1739612400.0
+
+    def test_raw_timestamp_with_dot(self):
+        assert parse_time_bound("1739612400.5") == 1739612400.5
+
+    @pytest.mark.parametrize("value", ["2026", "20260101", "0"])
+    def test_bare_short_number_rejected(self, value):
+        with pytest.raises(ValueError, match="Unix timestamp"):
+            parse_time_bound(value)
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            parse_time_bound("2026/02/09")
+
+
+class TestResolveTimeRange:
+    """since/until → oldest/latest 변환 테스트."""
+
+    def test_both_bounds(self):
+        oldest, latest = resolve_time_range("2026-02-09", "2026-02-15", "Asia/Seoul")
+        assert float(latest) - float(oldest) == 7 * 86400
+        assert oldest.endswith(".000000")
+
+    def test_empty_returns_none(self):
+        assert resolve_time_range() == (None, None)
+
+    def test_since_after_until(self):
+        with pytest.raises(ValueError, match="늦습니다"):
+            resolve_time_range("2026-02-15", "2026-02-09")
+
+    def test_unknown_timezone(self):
+        with pytest.raises(ValueError, match="시간대"):
+            resolve_time_range("2026-02-09", timezone="Mars/Olympus")
+
+    def test_timezone_from_env(self, monkeypatch):
+        monkeypatch.setenv("SLACK_TO_NOTION_TIMEZONE", "UTC")
+        oldest, _ = resolve_time_range("2026-02-09")
+        assert float(oldest) == datetime(2026, 2, 9, tzinfo=timezone.utc).timestamp()